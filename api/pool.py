@@ -723,21 +723,34 @@ class SessionPool:
                 {"type": "user_message", "text": text},
                 exclude=source_ws,
             )
-            async for event in sm.send(text):
-                payload = serialize_event(event)
-                await self._broadcast_session(session_id, payload)
-                if payload.get("type") in ("permission_request", "permission_resolved"):
-                    # Mirror to the orchestrator so its UI can show a matching
-                    # banner and (for permission_request) so the orchestrator
-                    # agent can respond programmatically.  Same envelope as
-                    # nested_session_event so existing dispatch logic fits.
-                    await self.broadcast_orchestrator({
-                        "type": "nested_session_event",
-                        "session_id": session_id,
-                        "event_type": payload["type"],
-                        "event_data": payload,
-                    })
-                yield event
+            # Closed explicitly so a consumer that stops early (aclose,
+            # timeout) tears down the SDK stream while still holding the lock.
+            stream = sm.send(text)
+            try:
+                async for event in stream:
+                    # Background turns often run with nobody watching — skip
+                    # serializing events no subscriber would receive.
+                    if self._subscribers.get(session_id) or self._orchestrator_subs:
+                        await self._broadcast_send_event(session_id, event)
+                    yield event
+            finally:
+                await stream.aclose()
+
+    async def _broadcast_send_event(self, session_id: str, event: Event) -> None:
+        """Fan one :meth:`send` event out to session + orchestrator subscribers."""
+        payload = serialize_event(event)
+        await self._broadcast_session(session_id, payload)
+        if payload.get("type") in ("permission_request", "permission_resolved"):
+            # Mirror to the orchestrator so its UI can show a matching
+            # banner and (for permission_request) so the orchestrator
+            # agent can respond programmatically.  Same envelope as
+            # nested_session_event so existing dispatch logic fits.
+            await self.broadcast_orchestrator({
+                "type": "nested_session_event",
+                "session_id": session_id,
+                "event_type": payload["type"],
+                "event_data": payload,
+            })
 
     async def compact(self, session_id: str) -> AsyncIterator[Event]:
         """Trigger compaction with per-session lock, broadcasting to all subscribers."""
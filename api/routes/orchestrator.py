@@ -33,6 +33,7 @@ from api.serializers import serialize_orchestrator_event
 from orchestrator import summary_cache
 from orchestrator.config import OrchestratorConfig, get_available_models
 from orchestrator.providers.discovery import list_orchestrator_models
+from orchestrator.providers.voice_base import ToolCallAccumulator
 from orchestrator.session import OrchestratorSession
 from orchestrator.voice_timeouts import VoiceTimeouts
 
@@ -1262,10 +1263,13 @@ async def _handle_voice_tool_call(
         pending_args = ""
         if hasattr(session, "_voice_provider") and session._voice_provider:
             prov = session._voice_provider
-            pending_args = (
-                getattr(prov, "_pending_call_args", {}).get(call_id, "")
-                or getattr(prov, "_pending_args", {}).get(call_id, "")
-            )
+            if isinstance(prov, ToolCallAccumulator):
+                pending_args = prov.peek_args(call_id)
+            else:
+                pending_args = (
+                    getattr(prov, "_pending_call_args", {}).get(call_id, "")
+                    or getattr(prov, "_pending_args", {}).get(call_id, "")
+                )
         try:
             tool_input = _json.loads(pending_args or event.get("arguments", "") or "{}")
         except Exception:
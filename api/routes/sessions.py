@@ -144,14 +144,15 @@ def list_pool_sessions(
         ))
 
     # Regular agent sessions
-    for s in pool.list_sessions():
+    agent_sessions = pool.list_sessions()
+    infos = store.get_session_infos(
+        [s["sdk_session_id"] for s in agent_sessions if s.get("sdk_session_id")]
+    )
+    for s in agent_sessions:
         local_id = s["session_id"]
         sdk_id = s.get("sdk_session_id")
-        title = None
-        if sdk_id:
-            info = store.get_session_info(sdk_id)
-            if info:
-                title = info.title
+        info = infos.get(sdk_id) if sdk_id else None
+        title = info.title if info else None
         result.append(PoolSessionResponse(
             local_id=local_id,
             sdk_session_id=sdk_id,
@@ -18,6 +18,17 @@ from manager.types import (
     ToolUse,
     TurnComplete,
 )
+from orchestrator.types import (
+    ErrorEvent,
+    NestedSessionEvent,
+    TextComplete as OTextComplete,
+    TextDelta as OTextDelta,
+    ToolExecutingEvent,
+    ToolProgressEvent,
+    ToolResultEvent,
+    ToolUseStart,
+    TurnComplete as OTurnComplete,
+)
 
 
 def serialize_event(event: Event) -> dict[str, Any]:
@@ -92,19 +103,8 @@ def serialize_event(event: Event) -> dict[str, Any]:
 
 def serialize_orchestrator_event(event: object) -> dict[str, Any]:
     """Convert an orchestrator OrchestratorEvent to a JSON-compatible dict."""
-    from orchestrator.types import (
-        TextDelta as OTextDelta,
-        TextComplete as OTextComplete,
-        ToolUseStart,
-        ToolResultEvent,
-        ToolExecutingEvent,
-        ToolProgressEvent,
-        NestedSessionEvent,
-        TurnComplete as OTurnComplete,
-        ErrorEvent,
-    )
-
-    if isinstance(event, OTextDelta):
+    # Per-token fast path: exact-type check, no function-local import.
+    if type(event) is OTextDelta:
         return {"type": "text_delta", "text": event.text}
     if isinstance(event, OTextComplete):
         return {"type": "text_complete", "text": event.text}
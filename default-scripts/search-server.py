@@ -31,6 +31,8 @@ Both transports speak the same JSON-line protocol:
   {"command": "list_collections"}                -> {"collections": [str], "error": null}
   {"command": "get_by_file", ...}                -> {"ids": [str], "error": null}
   {"command": "encode", "text": "..."}           -> {"embedding": [float], "error": null}
+  {"command": "query_many", "queries": [<query request>, ...]}
+    -> {"replies": [<query reply>, ...], "error": null}
 
   Write commands
   --------------
@@ -62,15 +64,25 @@ Crash-safety
   mid-flush.
 - validate/repair commands run their work in subprocesses so a chroma
   SIGSEGV is a recoverable exit code, not a server crash.
+
+Embedding cache
+---------------
+<INDEX_DIR>/.embedding-cache.sqlite maps (sha256(chunk text), model) to
+the chunk's vector so re-indexing unchanged content skips the encoder.
+Each edited chunk version adds a row; past EMBEDDING_CACHE_MAX_ENTRIES
+rows the least-recently-used ones are pruned on the next write.
 """
 import errno
 import fcntl
+import hashlib
 import json
 import os
 import socket
+import sqlite3
 import sys
 import threading
 import traceback
+from collections import OrderedDict
 from pathlib import Path
 
 # Add project root to path for utils import (and sibling default-scripts)
@@ -87,6 +99,20 @@ SOCKET_PATH = INDEX_DIR / ".search-server.sock"
 
 HNSW_METADATA = {"hnsw:space": "cosine", "hnsw:sync_threshold": 200}
 
+MODEL_NAME = "all-MiniLM-L6-v2"
+
+# Chunk embeddings keyed by (sha256(text), model), so re-indexing unchanged
+# files skips the encoder. Lives beside the index this process owns.
+EMBEDDING_CACHE_PATH = INDEX_DIR / ".embedding-cache.sqlite"
+# Every edited chunk version adds a row, so the cache is capped: past this
+# many rows the least-recently-used ones are pruned (~1.5KB each for
+# MiniLM's 384-dim float32 vectors, so ~150MB at the cap).
+EMBEDDING_CACHE_MAX_ENTRIES = 100_000
+
+# Distinct query strings whose embeddings stay cached — agents re-ask the
+# same questions across turns, and each encode is a full MiniLM forward pass.
+QUERY_CACHE_SIZE = 512
+
 
 # ── stdio helpers ────────────────────────────────────────────────────────────
 
@@ -118,6 +144,116 @@ def acquire_lock(lockfile: Path):
     return fd
 
 
+# ── embedding cache ──────────────────────────────────────────────────────────
+
+class EmbeddingCache:
+    """Persistent ``(sha256(text), model) → float32 vector`` store.
+
+    Used by ``encode_many`` (the indexers' batch path): only texts with no
+    cached vector reach the model. Vectors are the model's own float32
+    output, so a cache hit is bit-identical to re-encoding. Rows carry a
+    ``last_used`` counter; once ``max_entries`` is exceeded the
+    least-recently-used rows are pruned.
+    """
+
+    # Stay under SQLite's default host-parameter limit per SELECT.
+    _BATCH = 500
+
+    def __init__(self, path: Path, model_name: str,
+                 max_entries: int = EMBEDDING_CACHE_MAX_ENTRIES):
+        self.model_name = model_name
+        self.max_entries = max_entries
+        self._conn = sqlite3.connect(str(path), check_same_thread=False)
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS embedding_cache ("
+            " hash TEXT NOT NULL, model TEXT NOT NULL, vector BLOB NOT NULL,"
+            " last_used INTEGER NOT NULL DEFAULT 0,"
+            " PRIMARY KEY (hash, model))"
+        )
+        columns = {row[1] for row in self._conn.execute("PRAGMA table_info(embedding_cache)")}
+        if "last_used" not in columns:
+            self._conn.execute(
+                "ALTER TABLE embedding_cache ADD COLUMN last_used INTEGER NOT NULL DEFAULT 0"
+            )
+        self._conn.execute(
+            "CREATE INDEX IF NOT EXISTS embedding_cache_last_used"
+            " ON embedding_cache (last_used)"
+        )
+        self._conn.commit()
+        self._clock = self._conn.execute(
+            "SELECT COALESCE(MAX(last_used), 0) FROM embedding_cache"
+        ).fetchone()[0]
+        # Socket clients are served from separate threads.
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _hash(text: str) -> str:
+        return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+    def _tick(self) -> int:
+        self._clock += 1
+        return self._clock
+
+    def get_many(self, texts: list[str]) -> list[list[float] | None]:
+        import numpy as np
+
+        hashes = [self._hash(t) for t in texts]
+        found: dict[str, bytes] = {}
+        with self._lock:
+            for i in range(0, len(hashes), self._BATCH):
+                batch = hashes[i:i + self._BATCH]
+                rows = self._conn.execute(
+                    "SELECT hash, vector FROM embedding_cache"
+                    f" WHERE model = ? AND hash IN ({','.join('?' * len(batch))})",
+                    (self.model_name, *batch),
+                )
+                found.update(rows)
+            if found:
+                now = self._tick()
+                hits = list(found)
+                for i in range(0, len(hits), self._BATCH):
+                    batch = hits[i:i + self._BATCH]
+                    self._conn.execute(
+                        "UPDATE embedding_cache SET last_used = ?"
+                        f" WHERE model = ? AND hash IN ({','.join('?' * len(batch))})",
+                        (now, self.model_name, *batch),
+                    )
+                self._conn.commit()
+        return [
+            np.frombuffer(found[h], dtype=np.float32).tolist() if h in found else None
+            for h in hashes
+        ]
+
+    def put_many(self, texts: list[str], vectors) -> None:
+        import numpy as np
+
+        with self._lock:
+            now = self._tick()
+            rows = [
+                (self._hash(t), self.model_name,
+                 np.asarray(v, dtype=np.float32).tobytes(), now)
+                for t, v in zip(texts, vectors)
+            ]
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO embedding_cache (hash, model, vector, last_used)"
+                " VALUES (?, ?, ?, ?)",
+                rows,
+            )
+            self._prune()
+            self._conn.commit()
+
+    def _prune(self) -> None:
+        """Drop the least-recently-used rows beyond ``max_entries``."""
+        (count,) = self._conn.execute("SELECT COUNT(*) FROM embedding_cache").fetchone()
+        excess = count - self.max_entries
+        if excess > 0:
+            self._conn.execute(
+                "DELETE FROM embedding_cache WHERE rowid IN ("
+                " SELECT rowid FROM embedding_cache ORDER BY last_used LIMIT ?)",
+                (excess,),
+            )
+
+
 # ── request dispatch ─────────────────────────────────────────────────────────
 
 class IndexServer:
@@ -129,10 +265,47 @@ class IndexServer:
         from sentence_transformers import SentenceTransformer
 
         self.client = chromadb.PersistentClient(path=str(INDEX_DIR))
-        self.model = SentenceTransformer("all-MiniLM-L6-v2")
+        self.model = SentenceTransformer(MODEL_NAME)
+        self.embedding_cache = EmbeddingCache(EMBEDDING_CACHE_PATH, MODEL_NAME)
         # All writes serialize through this lock so concurrent socket
         # clients can't interleave inside a single chroma write.
         self._write_lock = threading.Lock()
+        # query text → embedding, LRU-ordered. Per-instance so the cache
+        # lives and dies with self.model.
+        self._query_cache: OrderedDict[str, list[float]] = OrderedDict()
+        self._query_cache_lock = threading.Lock()
+
+    def _query_embeddings(self, queries: list[str]) -> list[list[float]]:
+        """Embed query strings, encoding every cache miss in one batch."""
+        with self._query_cache_lock:
+            found: dict[str, list[float]] = {}
+            for q in queries:
+                emb = self._query_cache.get(q)
+                if emb is not None:
+                    self._query_cache.move_to_end(q)
+                    found[q] = emb
+        missing = list(dict.fromkeys(q for q in queries if q not in found))
+        if missing:
+            fresh = [v.tolist() for v in self.model.encode(missing)]
+            with self._query_cache_lock:
+                for q, emb in zip(missing, fresh):
+                    found[q] = emb
+                    self._query_cache[q] = emb
+                    self._query_cache.move_to_end(q)
+                while len(self._query_cache) > QUERY_CACHE_SIZE:
+                    self._query_cache.popitem(last=False)
+        return [found[q] for q in queries]
+
+    def _encode_many(self, texts: list[str]) -> list[list[float]]:
+        """Batch-encode chunk texts, consulting :class:`EmbeddingCache` first."""
+        embeddings = self.embedding_cache.get_many(texts)
+        missing = [i for i, e in enumerate(embeddings) if e is None]
+        if missing:
+            fresh = self.model.encode([texts[i] for i in missing])
+            self.embedding_cache.put_many([texts[i] for i in missing], fresh)
+            for i, vec in zip(missing, fresh):
+                embeddings[i] = vec.tolist()
+        return embeddings
 
     def get_or_create_collection(self, name: str):
         return self.client.get_or_create_collection(name=name, metadata=HNSW_METADATA)
@@ -172,8 +345,18 @@ class IndexServer:
             return {"embedding": emb, "error": None}
         if cmd == "encode_many":
             texts = request["texts"]
-            embs = [v.tolist() for v in self.model.encode(texts)] if texts else []
+            embs = self._encode_many(texts) if texts else []
             return {"embeddings": embs, "error": None}
+        if cmd == "query_many":
+            # Concurrent searches coalesced by the orchestrator client: one
+            # batched encode for every distinct query, then per-item replies.
+            # Only plain query items are accepted — a sub-item can't smuggle
+            # in a command (a write, or a nested query_many).
+            queries = request["queries"]
+            texts = [q["query"] for q in queries if self._is_plain_query(q) and q.get("query")]
+            if texts:
+                self._query_embeddings(texts)
+            return {"replies": [self._handle_sub_query(q) for q in queries], "error": None}
         if cmd == "get_by_file":
             return self._get_by_file(request["collection"], request["file_path"])
         if cmd == "add_chunks":
@@ -192,6 +375,24 @@ class IndexServer:
             return self._repair(request["collection"], request.get("tier", "auto"))
         return {"error": f"Unknown command: {cmd}"}
 
+    @staticmethod
+    def _is_plain_query(item) -> bool:
+        return isinstance(item, dict) and "command" not in item
+
+    def _handle_sub_query(self, item) -> dict:
+        """One ``query_many`` item → its query reply, or a per-item error."""
+        if not self._is_plain_query(item):
+            return {"results": [], "error": "query_many items must be plain query requests"}
+        try:
+            return self._handle_query(item)
+        except Exception as e:
+            tb = traceback.format_exc()
+            print(
+                f"[search-server FAILED] query_many item={item!r}\n{tb}",
+                file=sys.stderr, flush=True,
+            )
+            return {"results": [], "error": f"{type(e).__name__}: {e}"}
+
     def _get_by_file(self, name: str, file_path: str) -> dict:
         col = self.get_or_create_collection(name)
         try:
@@ -281,7 +482,7 @@ class IndexServer:
         if count == 0:
             return {"results": [], "error": f"Collection '{collection_name}' is empty."}
 
-        query_embedding = self.model.encode([query])[0].tolist()
+        query_embedding = self._query_embeddings([query])[0]
         results = collection.query(
             query_embeddings=[query_embedding],
             n_results=min(n_results, count),
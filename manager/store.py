@@ -296,11 +296,33 @@ class SessionStore:
         return previews[start_idx:end_idx], total_count, has_more
 
     def get_session_info(self, session_id: str) -> SessionInfo | None:
-        """Get lightweight summary info for a single session."""
+        """Get lightweight summary info for a single session.
+
+        Shares the (mtime_ns, size) cache with :meth:`list_sessions`, so
+        the orchestrator's prompt builder can look up titles for every
+        active agent on every turn without re-parsing their JSONLs.
+        """
         jsonl_path = self._locate_jsonl(session_id)
         if jsonl_path is None:
             return None
-        return self._parse_session_info(jsonl_path, session_id)
+        return self._scan_file(jsonl_path, session_id, self._load_titles())
+
+    def get_session_infos(self, session_ids: list[str]) -> dict[str, SessionInfo]:
+        """Bulk :meth:`get_session_info`: ``session_id → SessionInfo``.
+
+        Reads the titles file once for the whole batch instead of once per
+        id; unknown ids are simply absent from the result.
+        """
+        titles = self._load_titles()
+        infos: dict[str, SessionInfo] = {}
+        for session_id in session_ids:
+            jsonl_path = self._locate_jsonl(session_id)
+            if jsonl_path is None:
+                continue
+            info = self._scan_file(jsonl_path, session_id, titles)
+            if info is not None:
+                infos[session_id] = info
+        return infos
 
     def rename_session(self, session_id: str, title: str) -> bool:
         """Store a custom title for a session. Returns True if the session exists."""
@@ -314,6 +336,9 @@ class SessionStore:
     def delete_session(self, session_id: str, *, skip_index_cleanup: bool = False) -> bool:
         """Soft-delete a session: move its JSONL into context/trash/.
 
+        The ``<id>.history.json`` snapshot written by the orchestrator's
+        ``HistoryLoader`` is removed along with it.
+
         The vector-index cleanup spawns a chromadb subprocess (multi-second
         cold start) and is the slow part of deletion. Callers that want to
         return to the user immediately can pass ``skip_index_cleanup=True``
@@ -334,6 +359,9 @@ class SessionStore:
             target = trash_dir / f"{jsonl_path.stem}.{ts}.jsonl"
 
         jsonl_path.rename(target)
+        # HistoryLoader's sibling snapshot is a full copy of the conversation;
+        # it's only a cache, so drop it rather than leave it in context/.
+        jsonl_path.with_suffix(".history.json").unlink(missing_ok=True)
 
         titles = self._load_titles()
         if session_id in titles:
@@ -10,7 +10,7 @@ from collections.abc import AsyncIterator
 from typing import Any
 
 from orchestrator.config import OrchestratorConfig
-from orchestrator.prompt import build_system_prompt
+from orchestrator.prompt import build_system_prompt_blocks
 from orchestrator.providers.base import ModelProvider
 from orchestrator.tools import ToolRegistry
 from orchestrator.types import (
@@ -30,14 +30,37 @@ logger = logging.getLogger(__name__)
 
 MAX_TOOL_LOOPS = 20  # Safety limit to prevent infinite tool loops
 HEARTBEAT_INTERVAL = 5.0  # Seconds between progress updates for long-running tools
+# Providers emit tiny text deltas at hundreds of Hz; coalesce them so the
+# WebSocket sends ~30 frames/s instead of one per token.
+TEXT_DELTA_FLUSH_INTERVAL = 0.033  # Seconds
+TEXT_DELTA_FLUSH_COUNT = 8  # Buffered deltas that force a flush
+
+
+def _is_error_result(result: str) -> bool:
+    """Return True when a tool result is a JSON payload carrying ``error``.
+
+    Tool outputs can be large (file reads, search hits), so we only pay for
+    a full ``json.loads`` when the raw text could possibly match: anything
+    that parses to an error-bearing value must contain the substring
+    ``error`` and, being an object/array/string, start with ``{``/``[``/``"``.
+    """
+    if not isinstance(result, str) or "error" not in result:
+        return False
+    if result.lstrip()[:1] not in ("{", "[", '"'):
+        return False
+    try:
+        return "error" in json.loads(result)
+    except (json.JSONDecodeError, TypeError):
+        return False
 
 
 class OrchestratorAgent:
     """Agent loop that calls a model provider and executes tools.
 
-    Tool execution is non-blocking: events are streamed via an async queue
-    so the WebSocket can continue sending updates to the frontend during
-    long-running tool operations.
+    Tool execution is non-blocking: each tool call runs as its own task and
+    the loop waits on them with ``asyncio.wait``, yielding results as they
+    finish (plus periodic progress heartbeats) so the WebSocket can keep
+    sending updates to the frontend during long-running tool operations.
 
     Usage::
 
@@ -107,8 +130,9 @@ class OrchestratorAgent:
         # Build system prompt. Text mode passes the full history to the
         # provider via messages=, so we don't need to duplicate it in the
         # system prompt. Voice mode builds its own prompt via
-        # OrchestratorSession.get_session_update().
-        system = build_system_prompt(self._config, self._context)
+        # OrchestratorSession.get_session_update(). Blocks let the Anthropic
+        # provider cache the static prefix; others flatten them to text.
+        system = build_system_prompt_blocks(self._config, self._context)
         tools = self._registry.get_definitions()
 
         total_input_tokens = 0
@@ -123,30 +147,44 @@ class OrchestratorAgent:
             assistant_content: list[dict[str, Any]] = []
             tool_calls: list[ToolUseStart] = []
 
+            # Buffered TextDelta fragments. Flushed on size/age and always
+            # before any other event so ordering is preserved. The first
+            # delta goes out immediately (last_flush starts at 0).
+            pending_text: list[str] = []
+            last_flush = 0.0
+
             async for event in self._provider.create_message(
                 messages=self._history,
                 tools=tools,
                 system=system,
             ):
+                if isinstance(event, TextDelta) and not self._interrupted:
+                    pending_text.append(event.text)
+                    now = time.monotonic()
+                    if (
+                        len(pending_text) >= TEXT_DELTA_FLUSH_COUNT
+                        or now - last_flush >= TEXT_DELTA_FLUSH_INTERVAL
+                    ):
+                        yield TextDelta(text="".join(pending_text))
+                        pending_text.clear()
+                        last_flush = now
+                    continue
+
+                if pending_text:
+                    yield TextDelta(text="".join(pending_text))
+                    pending_text.clear()
+
                 if self._interrupted:
                     yield ErrorEvent(error="interrupted", detail="Agent was interrupted")
                     return
 
-                if isinstance(event, TextDelta):
-                    yield event
-
-                elif isinstance(event, TextComplete):
+                if isinstance(event, TextComplete):
                     assistant_content.append({"type": "text", "text": event.text})
                     yield event
 
                 elif isinstance(event, ToolUseStart):
                     tool_calls.append(event)
-                    assistant_content.append({
-                        "type": "tool_use",
-                        "id": event.tool_call_id,
-                        "name": event.tool_name,
-                        "input": event.tool_input,
-                    })
+                    assistant_content.append(event.as_content_block())
                     yield event
 
                 elif isinstance(event, TurnComplete):
@@ -157,6 +195,9 @@ class OrchestratorAgent:
                     yield event
                     return
 
+            if pending_text:
+                yield TextDelta(text="".join(pending_text))
+
             # Add assistant message to history
             if assistant_content:
                 self._history.append({"role": "assistant", "content": assistant_content})
@@ -182,12 +223,7 @@ class OrchestratorAgent:
                 # Results are tracked in the streaming execution
                 result = self._last_tool_results.get(tc.tool_call_id)
                 if result:
-                    is_error = False
-                    try:
-                        parsed = json.loads(result)
-                        is_error = "error" in parsed
-                    except (json.JSONDecodeError, TypeError):
-                        pass
+                    is_error = _is_error_result(result)
                     tool_results.append({
                         "type": "tool_result",
                         "tool_use_id": tc.tool_call_id,
@@ -207,136 +243,91 @@ class OrchestratorAgent:
     async def _execute_tools_streaming(
         self, tool_calls: list[ToolUseStart]
     ) -> AsyncIterator[OrchestratorEvent]:
-        """Execute tools with non-blocking streaming of progress events.
-
-        Uses an async queue to decouple tool execution from event yielding.
-        This allows the WebSocket to continue sending events (heartbeats,
-        nested session events) while tools are executing.
+        """Execute tools concurrently, streaming results as they complete.
+
+        Each tool runs as its own task and the loop wakes on whichever
+        finishes first — or every 0.5s to honour interrupts and emit
+        heartbeats — so the WebSocket keeps receiving events (heartbeats,
+        nested session events) while long-running tools execute. Waiting
+        directly on the tasks avoids a relay queue, per-tool wrapper
+        coroutines and a separate heartbeat task, which dominated the cost
+        of the common one-to-three-tool batch.
         """
         # Track results for history
         self._last_tool_results: dict[str, str] = {}
 
-        # Event queue for non-blocking streaming
-        event_queue: asyncio.Queue[OrchestratorEvent | None] = asyncio.Queue()
-
-        # Track which tools are still running
-        pending_tools: dict[str, asyncio.Task] = {}
-        start_times: dict[str, float] = {}
-
-        async def execute_single_tool(tc: ToolUseStart) -> None:
-            """Execute a single tool and put result in queue."""
-            start_time = time.monotonic()
-            start_times[tc.tool_call_id] = start_time
-
-            # Signal that execution has started
-            await event_queue.put(ToolExecutingEvent(
-                tool_call_id=tc.tool_call_id,
-                tool_name=tc.tool_name,
-            ))
-
-            try:
-                result = await self._registry.execute(
-                    tc.tool_name, tc.tool_input, self._context
-                )
-                self._last_tool_results[tc.tool_call_id] = result
-
-                is_error = False
-                try:
-                    parsed = json.loads(result)
-                    is_error = "error" in parsed
-                except (json.JSONDecodeError, TypeError):
-                    pass
-
-                await event_queue.put(ToolResultEvent(
-                    tool_call_id=tc.tool_call_id,
-                    output=result,
-                    is_error=is_error,
-                ))
-            except asyncio.CancelledError:
-                # Tool was cancelled (e.g., interrupt)
-                await event_queue.put(ToolResultEvent(
-                    tool_call_id=tc.tool_call_id,
-                    output=json.dumps({"error": "Tool execution cancelled"}),
-                    is_error=True,
-                ))
-            except Exception as e:
-                logger.exception("Tool execution failed: %s", tc.tool_name)
-                error_result = json.dumps({"error": str(e)})
-                self._last_tool_results[tc.tool_call_id] = error_result
-                await event_queue.put(ToolResultEvent(
-                    tool_call_id=tc.tool_call_id,
-                    output=error_result,
-                    is_error=True,
-                ))
-            finally:
-                pending_tools.pop(tc.tool_call_id, None)
-
-        async def heartbeat_generator() -> None:
-            """Generate periodic heartbeat events for long-running tools."""
-            while pending_tools:
-                await asyncio.sleep(HEARTBEAT_INTERVAL)
-                if not pending_tools:
-                    break
-
-                for call_id, task in list(pending_tools.items()):
-                    if task.done():
-                        continue
-                    # Find the tool name
-                    tool_name = next(
-                        (tc.tool_name for tc in tool_calls if tc.tool_call_id == call_id),
-                        "unknown"
-                    )
-                    elapsed = time.monotonic() - start_times.get(call_id, time.monotonic())
-                    await event_queue.put(ToolProgressEvent(
-                        tool_call_id=call_id,
-                        tool_name=tool_name,
-                        elapsed_seconds=elapsed,
-                        message=f"Still executing {tool_name}...",
-                    ))
-
-        # Start all tool executions concurrently
+        start_time = time.monotonic()
+        pending: dict[asyncio.Task[str], ToolUseStart] = {}
         for tc in tool_calls:
             task = asyncio.create_task(
-                execute_single_tool(tc),
+                self._registry.execute(tc.tool_name, tc.tool_input, self._context),
                 name=f"tool-{tc.tool_name}-{tc.tool_call_id[:8]}",
             )
-            pending_tools[tc.tool_call_id] = task
+            pending[task] = tc
 
-        # Start heartbeat generator
-        heartbeat_task = asyncio.create_task(heartbeat_generator(), name="tool-heartbeat")
+        for tc in tool_calls:
+            yield ToolExecutingEvent(
+                tool_call_id=tc.tool_call_id,
+                tool_name=tc.tool_name,
+            )
 
-        # Yield events as they arrive (non-blocking)
-        completed_count = 0
-        total_tools = len(tool_calls)
+        next_heartbeat = start_time + HEARTBEAT_INTERVAL
+        while pending:
+            if self._interrupted:
+                # Cancel all pending tools
+                for task in pending:
+                    task.cancel()
+                yield ErrorEvent(error="interrupted", detail="Agent was interrupted during tool execution")
+                return
 
-        try:
-            while completed_count < total_tools:
-                if self._interrupted:
-                    # Cancel all pending tools
-                    for task in pending_tools.values():
-                        task.cancel()
-                    heartbeat_task.cancel()
-                    yield ErrorEvent(error="interrupted", detail="Agent was interrupted during tool execution")
-                    return
+            # Short timeout so the interrupt flag is re-checked regularly
+            done, _ = await asyncio.wait(
+                pending, timeout=0.5, return_when=asyncio.FIRST_COMPLETED,
+            )
+            # Iterate in call order so simultaneous completions are stable
+            for task in [t for t in pending if t in done]:
+                yield self._tool_result_event(pending.pop(task), task)
+
+            now = time.monotonic()
+            if pending and now >= next_heartbeat:
+                for tc in pending.values():
+                    yield ToolProgressEvent(
+                        tool_call_id=tc.tool_call_id,
+                        tool_name=tc.tool_name,
+                        elapsed_seconds=now - start_time,
+                        message=f"Still executing {tc.tool_name}...",
+                    )
+                next_heartbeat = now + HEARTBEAT_INTERVAL
 
-                try:
-                    # Wait for next event with timeout to check for interrupts
-                    event = await asyncio.wait_for(event_queue.get(), timeout=0.5)
-                    if event is not None:
-                        yield event
-                        if isinstance(event, ToolResultEvent):
-                            completed_count += 1
-                except asyncio.TimeoutError:
-                    # No event ready, continue loop to check interrupt flag
-                    continue
+    def _tool_result_event(
+        self, tc: ToolUseStart, task: asyncio.Task[str]
+    ) -> ToolResultEvent:
+        """Turn a finished tool task into a result event, recording it for history."""
+        try:
+            result = task.result()
+        except asyncio.CancelledError:
+            # Tool was cancelled (e.g., interrupt)
+            return ToolResultEvent(
+                tool_call_id=tc.tool_call_id,
+                output=json.dumps({"error": "Tool execution cancelled"}),
+                is_error=True,
+            )
+        except Exception as e:
+            logger.exception("Tool execution failed: %s", tc.tool_name)
+            error_result = json.dumps({"error": str(e)})
+            self._last_tool_results[tc.tool_call_id] = error_result
+            return ToolResultEvent(
+                tool_call_id=tc.tool_call_id,
+                output=error_result,
+                is_error=True,
+            )
 
-        finally:
-            # Clean up heartbeat task
-            heartbeat_task.cancel()
-            try:
-                await heartbeat_task
-            except asyncio.CancelledError:
-                pass
+        self._last_tool_results[tc.tool_call_id] = result
+        return ToolResultEvent(
+            tool_call_id=tc.tool_call_id,
+            output=result,
+            is_error=_is_error_result(result),
+        )
 
     async def interrupt(self) -> None:
         """Interrupt the current agent loop."""
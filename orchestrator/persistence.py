@@ -7,14 +7,29 @@ and results.
 
 from __future__ import annotations
 
+import asyncio
 import json
 import logging
 import os
+import tempfile
+from concurrent.futures import Future, ThreadPoolExecutor
+from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any
 
+import orjson
+
 logger = logging.getLogger(__name__)
 
+# One thread for every session's JSONL writes: batches are written in
+# submission order, so a later flush never overtakes an earlier one.
+_WRITE_EXECUTOR = ThreadPoolExecutor(max_workers=1, thread_name_prefix="history-writer")
+
+
+def utc_timestamp() -> str:
+    """Return the current UTC time as the ISO-8601 string stored in JSONL records."""
+    return datetime.now(timezone.utc).isoformat()
+
 
 class HistoryLoader:
     """Loads conversation history from JSONL files.
@@ -23,8 +38,16 @@ class HistoryLoader:
     - User messages from text and voice modes
     - Assistant responses with embedded tool calls
     - Tool results grouped as user messages
+
+    For JSONLs of at least ``SNAPSHOT_MIN_BYTES`` the reconstructed history
+    is also written to a sibling ``.history.json`` snapshot keyed on the
+    JSONL's ``(size, mtime_ns)``; a later load of the unchanged file reads
+    the snapshot instead of replaying every line.
     """
 
+    SNAPSHOT_MIN_BYTES = 256 * 1024
+    SNAPSHOT_SCHEMA_VERSION = 1
+
     def __init__(self, jsonl_path: Path) -> None:
         self._jsonl_path = jsonl_path
 
@@ -36,13 +59,61 @@ class HistoryLoader:
         - {"role": "assistant", "content": [{"type": "text", "text": "..."}, ...]}
         - {"role": "user", "content": [{"type": "tool_result", ...}, ...]}
         """
-        if not self._jsonl_path.is_file():
+        try:
+            st = os.stat(self._jsonl_path)
+        except OSError:
             return []
+        key = (st.st_size, st.st_mtime_ns)
+        use_snapshot = st.st_size >= self.SNAPSHOT_MIN_BYTES
+        if use_snapshot:
+            history = self._read_snapshot(key)
+            if history is not None:
+                return history
 
         entries = self._read_jsonl()
         history = self._reconstruct_history(entries)
+        if use_snapshot:
+            self._write_snapshot(key, history)
         return history
 
+    def _snapshot_path(self) -> Path:
+        return self._jsonl_path.with_suffix(".history.json")
+
+    def _read_snapshot(self, key: tuple[int, int]) -> list[dict[str, Any]] | None:
+        """Return the snapshot's history if it matches ``key``, else None."""
+        try:
+            payload = orjson.loads(self._snapshot_path().read_bytes())
+        except (OSError, orjson.JSONDecodeError):
+            return None
+        if (
+            not isinstance(payload, dict)
+            or payload.get("schema_version") != self.SNAPSHOT_SCHEMA_VERSION
+            or (payload.get("jsonl_size"), payload.get("jsonl_mtime_ns")) != key
+        ):
+            return None
+        history = payload.get("history")
+        return history if isinstance(history, list) else None
+
+    def _write_snapshot(self, key: tuple[int, int], history: list[dict[str, Any]]) -> None:
+        """Atomically write the snapshot (temp file + rename). Never raises."""
+        sp = self._snapshot_path()
+        payload = {
+            "schema_version": self.SNAPSHOT_SCHEMA_VERSION,
+            "jsonl_size": key[0],
+            "jsonl_mtime_ns": key[1],
+            "history": history,
+        }
+        try:
+            data = orjson.dumps(payload, option=orjson.OPT_NON_STR_KEYS)
+            with tempfile.NamedTemporaryFile(
+                mode="wb", dir=sp.parent, prefix=sp.name + ".", suffix=".tmp", delete=False,
+            ) as tmp:
+                tmp.write(data)
+                tmp_path = tmp.name
+            os.replace(tmp_path, sp)
+        except (OSError, TypeError) as e:
+            logger.warning("Failed to write history snapshot %s: %s", sp.name, e)
+
     def _read_jsonl(self) -> list[dict[str, Any]]:
         """Read all valid JSON lines from the JSONL file.
 
@@ -54,34 +125,38 @@ class HistoryLoader:
         entries: list[dict[str, Any]] = []
         decoder = json.JSONDecoder()
         try:
-            with open(self._jsonl_path) as f:
-                for line_num, line in enumerate(f, start=1):
-                    line = line.strip()
-                    if not line:
-                        continue
+            # The file is read in one call and split on newlines; lines are
+            # parsed as bytes with orjson (which skips surrounding
+            # whitespace such as ``\r``), and only the rare damaged line is
+            # decoded to str for the stdlib ``raw_decode`` recovery.
+            data = self._jsonl_path.read_bytes()
+            for line_num, raw in enumerate(data.split(b"\n"), start=1):
+                if not raw or raw.isspace():
+                    continue
+                try:
+                    entries.append(orjson.loads(raw))
+                    continue
+                except orjson.JSONDecodeError:
+                    pass
+                # Fallback: consume concatenated objects one at a time.
+                line = raw.decode("utf-8", errors="replace").strip()
+                pos = 0
+                recovered = 0
+                while pos < len(line):
                     try:
-                        entries.append(json.loads(line))
-                        continue
-                    except json.JSONDecodeError:
-                        pass
-                    # Fallback: consume concatenated objects one at a time.
-                    pos = 0
-                    recovered = 0
-                    while pos < len(line):
-                        try:
-                            obj, end = decoder.raw_decode(line, pos)
-                        except json.JSONDecodeError as e:
-                            logger.warning(
-                                "Invalid JSON at %s:%d (col %d, recovered %d): %s",
-                                self._jsonl_path.name, line_num, pos, recovered, e,
-                            )
-                            break
-                        entries.append(obj)
-                        recovered += 1
-                        pos = end
-                        # Skip whitespace between objects.
-                        while pos < len(line) and line[pos].isspace():
-                            pos += 1
+                        obj, end = decoder.raw_decode(line, pos)
+                    except json.JSONDecodeError as e:
+                        logger.warning(
+                            "Invalid JSON at %s:%d (col %d, recovered %d): %s",
+                            self._jsonl_path.name, line_num, pos, recovered, e,
+                        )
+                        break
+                    entries.append(obj)
+                    recovered += 1
+                    pos = end
+                    # Skip whitespace between objects.
+                    while pos < len(line) and line[pos].isspace():
+                        pos += 1
         except Exception as e:
             logger.warning("Failed to read JSONL %s: %s", self._jsonl_path, e)
 
@@ -198,28 +273,139 @@ class HistoryLoader:
 class HistoryWriter:
     """Writes conversation events to a JSONL file.
 
-    Each event is written as a single JSON line with a timestamp.
+    Each event is written as a single JSON line with a timestamp. Inside a
+    running event loop, appends are buffered and handed to a background
+    writer thread once ``FLUSH_COUNT`` lines are pending or
+    ``FLUSH_INTERVAL`` seconds have passed since the first buffered line,
+    so a burst of voice/tool events costs one write and the event loop
+    never blocks on disk. Outside an event loop (scripts, sync tests) every
+    append is written immediately.
+
+    Readers of the same file must flush first to see the buffered tail —
+    ``await`` :meth:`aflush` from async code, :meth:`flush` only when no
+    loop is running. The append fd stays open between batches;
+    :meth:`aclose` / :meth:`close` release it when the session ends.
     """
 
+    FLUSH_INTERVAL = 0.05
+    FLUSH_COUNT = 64
+
     def __init__(self, jsonl_path: Path) -> None:
         self._jsonl_path = jsonl_path
+        # Encoded lines accumulate in one reusable buffer (cleared in place
+        # after each hand-off) instead of a list of per-record bytes + join.
+        self._buffer = bytearray()
+        self._pending_count = 0
+        self._flush_handle: asyncio.TimerHandle | None = None
+        # Most recent batch submitted to the writer thread.
+        self._inflight: Future | None = None
+        # O_APPEND fd, only touched on the writer thread.
+        self._fd: int | None = None
 
     def append(self, data: dict[str, Any]) -> None:
-        """Append a single event to the JSONL file.
-
-        Uses ``os.write`` on an O_APPEND fd so the JSON object + trailing
-        newline land in a single atomic syscall.  Buffered ``open(...)`` +
-        ``f.write`` was losing the trailing ``\\n`` on abrupt process exit
-        (SIGKILL, OOM, restart) — the buffer was partially flushed and the
-        next process appended its first object directly after, producing
-        ``}{`` joins that break ``json.loads`` line-by-line.
-        """
-        line = (json.dumps(data) + "\n").encode("utf-8")
+        """Queue a single event for the JSONL file."""
+        try:
+            line = orjson.dumps(
+                data, option=orjson.OPT_APPEND_NEWLINE | orjson.OPT_NON_STR_KEYS
+            )
+        except orjson.JSONEncodeError:
+            # orjson rejects a few things stdlib json accepts (lone
+            # surrogates from a json.loads-ed transcript, ints wider than
+            # 64 bits in tool input); losing the event would abort the turn.
+            line = json.dumps(data, default=str).encode() + b"\n"
+        self._buffer += line
+        self._pending_count += 1
         try:
-            fd = os.open(self._jsonl_path, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            self.flush()
+            return
+        if self._pending_count >= self.FLUSH_COUNT:
+            self.flush_in_background()
+        elif self._flush_handle is None:
+            self._flush_handle = loop.call_later(self.FLUSH_INTERVAL, self.flush_in_background)
+
+    def flush_in_background(self) -> None:
+        """Hand every buffered event to the writer thread without waiting."""
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+        if not self._pending_count:
+            return
+        # Swap in a fresh buffer rather than copying: the writer thread
+        # takes ownership of the filled one.
+        batch, self._buffer = self._buffer, bytearray()
+        self._pending_count = 0
+        self._inflight = _WRITE_EXECUTOR.submit(self._write, batch)
+
+    def flush(self) -> None:
+        """Write every buffered event to disk and wait until it has landed.
+
+        Blocks the calling thread; async code must use :meth:`aflush`.
+        """
+        self.flush_in_background()
+        if self._inflight is not None:
+            self._inflight.result()
+            self._inflight = None
+
+    async def aflush(self) -> None:
+        """Awaitable :meth:`flush` that leaves the event loop free while the
+        writer thread drains (it is shared by every session)."""
+        self.flush_in_background()
+        inflight = self._inflight
+        if inflight is not None:
+            await asyncio.wrap_future(inflight)
+            if self._inflight is inflight:
+                self._inflight = None
+
+    def close(self) -> None:
+        """Flush the buffered tail and release the append fd.
+
+        A later :meth:`append` transparently reopens the file. Blocks the
+        calling thread; async code must use :meth:`aclose`.
+        """
+        self.flush()
+        _WRITE_EXECUTOR.submit(self._close_fd).result()
+
+    async def aclose(self) -> None:
+        """Awaitable :meth:`close`."""
+        await self.aflush()
+        await asyncio.wrap_future(_WRITE_EXECUTOR.submit(self._close_fd))
+
+    def _close_fd(self) -> None:
+        if self._fd is not None:
             try:
-                os.write(fd, line)
-            finally:
-                os.close(fd)
+                os.close(self._fd)
+            except OSError:
+                pass
+            self._fd = None
+
+    def _open_append(self) -> int:
+        """Open the JSONL for appending, creating its directory only if the
+        first attempt finds it missing (so the common case is one syscall)."""
+        flags = os.O_WRONLY | os.O_APPEND | os.O_CREAT
+        try:
+            return os.open(self._jsonl_path, flags, 0o644)
+        except FileNotFoundError:
+            self._jsonl_path.parent.mkdir(parents=True, exist_ok=True)
+            return os.open(self._jsonl_path, flags, 0o644)
+
+    def _write(self, batch: bytearray) -> None:
+        """Append one batch to the JSONL file (runs on the writer thread).
+
+        Uses a single ``os.write`` on an O_APPEND fd so the whole batch —
+        each JSON object with its trailing newline — lands in one atomic
+        syscall.  Buffered ``open(...)`` + ``f.write`` was losing the
+        trailing ``\\n`` on abrupt process exit (SIGKILL, OOM, restart) —
+        the buffer was partially flushed and the next process appended its
+        first object directly after, producing ``}{`` joins that break
+        ``json.loads`` line-by-line.
+        """
+        try:
+            if self._fd is None:
+                self._fd = self._open_append()
+            os.write(self._fd, batch)
         except Exception as e:
             logger.warning("Failed to write to JSONL %s: %s", self._jsonl_path, e)
+            # Reopen on the next batch rather than reuse a broken fd.
+            self._close_fd()
@@ -4,10 +4,15 @@ from __future__ import annotations
 
 import json
 import os
+import stat
+from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
 from typing import Any
 
 from orchestrator.config import OrchestratorConfig
+from orchestrator.token_budget import tool_result_text
+from utils.mcp_config import config_stamp as mcp_config_stamp
 from utils.mcp_config import load_available_mcps
 
 # Limits for content injection
@@ -17,23 +22,57 @@ MAX_MEMORY_INDEX_CHARS = 40000
 # Shared memory index filename
 MEMORY_INDEX_FILENAME = "MEMORY.md"
 
+# Repository root, resolved once at import rather than on every prompt build
+_PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+@dataclass(frozen=True, slots=True)
+class PromptBudgets:
+    """Character caps for file contents inlined into the system prompt.
+
+    Lets callers with different context budgets (realtime voice vs. text)
+    size the memory dumps independently. Frozen so it is hashable — the
+    caps are part of the cached readers' keys.
+    """
+
+    max_memory_chars: int = MAX_MEMORY_CHARS
+    max_memory_index_chars: int = MAX_MEMORY_INDEX_CHARS
+
+
+DEFAULT_PROMPT_BUDGETS = PromptBudgets()
+
+# Realtime voice models have a much smaller context window (see
+# ``orchestrator.token_budget``), most of which goes to conversation history.
+# Inline only the head of MEMORY.md — its folder ontology and top entries —
+# and let the truncation marker point the model at ``read_file`` for the
+# rest, so the full index is fetched on demand instead of prefilled on
+# every session update.
+VOICE_PROMPT_BUDGETS = PromptBudgets(max_memory_index_chars=12_000)
+
 
 # ---------------------------------------------------------------------------
 # MCP Configuration Loading
 # ---------------------------------------------------------------------------
 
-def _load_mcp_descriptions() -> dict[str, str]:
-    """Load MCP descriptions from the descriptions config file."""
-    config_dir = os.environ.get("CLAUDE_CONFIG_DIR")
-    if config_dir:
-        desc_path = Path(config_dir) / "mcp_descriptions.json"
-    else:
-        project_root = Path(__file__).resolve().parent.parent
-        desc_path = project_root / ".claude_config" / "mcp_descriptions.json"
+def _file_stamp(path: str) -> tuple[int, int] | None:
+    """Return ``(mtime_ns, size)`` for a regular file, or None if missing.
 
-    if not desc_path.is_file():
-        return {}
+    Used as the invalidation key for the cached loaders below, so every
+    prompt build costs one ``stat`` per file instead of a read + parse.
+    """
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    if not stat.S_ISREG(st.st_mode):
+        return None
+    return st.st_mtime_ns, st.st_size
 
+
+@lru_cache(maxsize=4)
+def _read_mcp_descriptions_cached(
+    desc_path: str, mtime_ns: int, size: int
+) -> dict[str, str]:
     try:
         with open(desc_path) as f:
             return json.load(f)
@@ -41,16 +80,42 @@ def _load_mcp_descriptions() -> dict[str, str]:
         return {}
 
 
-def _get_mcp_description(name: str, config: dict[str, Any]) -> str:
+def _mcp_descriptions_path() -> str:
+    config_dir = os.environ.get("CLAUDE_CONFIG_DIR")
+    if config_dir:
+        return os.path.join(config_dir, "mcp_descriptions.json")
+    return os.path.join(_PROJECT_ROOT, ".claude_config", "mcp_descriptions.json")
+
+
+def _load_mcp_descriptions() -> dict[str, str]:
+    """Load MCP descriptions from the descriptions config file.
+
+    The parsed dict is cached per file stamp and shared between callers —
+    treat it as read-only.
+    """
+    desc_path = _mcp_descriptions_path()
+    stamp = _file_stamp(desc_path)
+    if stamp is None:
+        return {}
+    return _read_mcp_descriptions_cached(desc_path, *stamp)
+
+
+def _get_mcp_description(
+    name: str,
+    config: dict[str, Any],
+    descriptions: dict[str, str] | None = None,
+) -> str:
     """Get a description for an MCP server.
 
     Checks (in order):
-    1. The mcp_descriptions.json file
+    1. The mcp_descriptions.json file (pass ``descriptions`` to reuse an
+       already-loaded mapping when describing several servers)
     2. A 'description' field in the MCP config
     3. Falls back to a generic description from command/type
     """
     # Check descriptions file first
-    descriptions = _load_mcp_descriptions()
+    if descriptions is None:
+        descriptions = _load_mcp_descriptions()
     if name in descriptions:
         return descriptions[name]
 
@@ -71,26 +136,38 @@ def _get_mcp_description(name: str, config: dict[str, Any]) -> str:
 # Memory Loading
 # ---------------------------------------------------------------------------
 
-def _load_memory_index(config: OrchestratorConfig) -> str:
+def _load_memory_index(
+    config: OrchestratorConfig,
+    budgets: PromptBudgets = DEFAULT_PROMPT_BUDGETS,
+) -> str:
     """Load the shared MEMORY.md index file contents.
 
     This is the authoritative index of skills, memory files, and project references
     used by both the orchestrator and agent sessions.
     """
-    memory_dir = Path(config.memory_path).parent if config.memory_path else None
-    if not memory_dir:
-        project_root = Path(__file__).resolve().parent.parent
-        memory_dir = project_root / "context" / "memory"
+    if config.memory_path:
+        memory_dir = os.path.dirname(config.memory_path)
+    else:
+        memory_dir = os.path.join(_PROJECT_ROOT, "context", "memory")
 
-    memory_index_path = memory_dir / MEMORY_INDEX_FILENAME
+    memory_index_path = os.path.join(memory_dir, MEMORY_INDEX_FILENAME)
 
-    if not memory_index_path.is_file():
+    stamp = _file_stamp(memory_index_path)
+    if stamp is None:
         return ""
+    return _read_memory_index_cached(
+        memory_index_path, *stamp, budgets.max_memory_index_chars
+    )
+
 
+@lru_cache(maxsize=4)
+def _read_memory_index_cached(path: str, mtime_ns: int, size: int, cap: int) -> str:
+    """Read and truncate MEMORY.md. Keyed on the file stamp so edits invalidate."""
     try:
-        content = memory_index_path.read_text(encoding="utf-8")
-        if len(content) > MAX_MEMORY_INDEX_CHARS:
-            truncated = content[:MAX_MEMORY_INDEX_CHARS]
+        with open(path, encoding="utf-8") as f:
+            content = f.read()
+        if len(content) > cap:
+            truncated = content[:cap]
             shown_lines = truncated.count("\n") + (0 if truncated.endswith("\n") else 1)
             total_lines = content.count("\n") + (0 if content.endswith("\n") else 1)
             # End cleanly on the last fully-shown line, then append the marker.
@@ -109,59 +186,72 @@ def _load_memory_index(config: OrchestratorConfig) -> str:
         return "(failed to read memory index)"
 
 
-def _load_private_memory(config: OrchestratorConfig) -> str:
-    """Load the orchestrator's private memory file contents."""
-    memory_path = Path(config.memory_path)
-    if not memory_path.is_file():
-        return ""
-
+@lru_cache(maxsize=8)
+def _read_memory_file_cached(
+    path: str, mtime_ns: int, size: int, cap: int
+) -> str | None:
+    """Read a memory file clipped to ``cap`` chars; None if unreadable."""
     try:
-        raw = memory_path.read_text(encoding="utf-8")
-        if len(raw) > MAX_MEMORY_CHARS:
-            raw = raw[:MAX_MEMORY_CHARS] + "\n... (truncated)"
-        return raw
+        with open(path, encoding="utf-8") as f:
+            raw = f.read()
     except Exception:
-        return "(failed to read memory file)"
+        return None
+    if len(raw) > cap:
+        raw = raw[:cap] + "\n... (truncated)"
+    return raw
+
+
+def _load_private_memory(
+    config: OrchestratorConfig,
+    budgets: PromptBudgets = DEFAULT_PROMPT_BUDGETS,
+) -> str:
+    """Load the orchestrator's private memory file contents."""
+    memory_path = config.memory_path
+    stamp = _file_stamp(memory_path) if memory_path else None
+    if stamp is None:
+        return ""
+    raw = _read_memory_file_cached(memory_path, *stamp, budgets.max_memory_chars)
+    return "(failed to read memory file)" if raw is None else raw
 
 
 def _provider_memory_path(
     config: OrchestratorConfig, provider_id: str
 ) -> Path | None:
-    """Return the path to a provider-specific memory file, or None if missing.
+    """Return the path to a provider-specific memory file (may not exist).
 
     Looked up as `ORCHESTRATOR_MEMORY_<provider_id>.md` next to the main
     orchestrator memory file. Used only in realtime voice sessions.
     """
     if not provider_id or not config.memory_path:
         return None
-    base = Path(config.memory_path)
-    candidate = base.parent / f"{base.stem}_{provider_id}.md"
-    return candidate if candidate.is_file() else None
+    stem, _ = os.path.splitext(config.memory_path)
+    return Path(f"{stem}_{provider_id}.md")
 
 
 def _load_provider_memory(
-    config: OrchestratorConfig, provider_id: str
+    config: OrchestratorConfig,
+    provider_id: str,
+    budgets: PromptBudgets = DEFAULT_PROMPT_BUDGETS,
 ) -> tuple[str, Path | None]:
     """Read a provider-specific memory file. Returns (contents, path) or ("", None)."""
     path = _provider_memory_path(config, provider_id)
-    if path is None:
+    # One stat answers both "does it exist" and "is the cache still fresh".
+    stamp = _file_stamp(path) if path is not None else None
+    if stamp is None:
         return "", None
-    try:
-        raw = path.read_text(encoding="utf-8")
-        if len(raw) > MAX_MEMORY_CHARS:
-            raw = raw[:MAX_MEMORY_CHARS] + "\n... (truncated)"
-        return raw, path
-    except Exception:
+    raw = _read_memory_file_cached(str(path), *stamp, budgets.max_memory_chars)
+    if raw is None:
         return "(failed to read provider memory file)", path
+    return raw, path
 
 
 # ---------------------------------------------------------------------------
 # Prompt Section Builders
 # ---------------------------------------------------------------------------
 
-def _role_section() -> str:
-    """Build the role and identity section."""
-    return """You are an orchestrator agent that coordinates multiple Claude Code instances.
+# Static sections are module constants so every build reuses the same
+# string object, and the prompt prefix stays byte-identical across turns.
+_ROLE_SECTION = """You are an orchestrator agent that coordinates multiple Claude Code instances.
 
 You can open, monitor, and communicate with Claude Code agent sessions to accomplish complex tasks.
 You have access to the project's conversation history and memory via search tools, and can read/write files in the project directory.
@@ -178,6 +268,63 @@ The user interacts with you through a multi-tab web interface. Each agent sessio
 - Coordinate multi-step workflows across sessions
 - Maintain persistent memory for cross-session context"""
 
+_GUIDELINES_SECTION = """## Guidelines
+
+### Before Starting Work
+- **Search first**: Use `search_memory` and `search_history` before non-trivial tasks — relevant context often exists
+- **Check active sessions**: Review what's already running to avoid duplicate work
+
+### Delegating to Agents
+- **Be specific**: Give clear, actionable instructions with enough context for independent work
+- **Fire-and-forget**: `send_to_agent_session` returns IMMEDIATELY with a turn_id; the agent runs in the background. Do NOT loop calling it waiting for a response — results arrive as background events on your next turn.
+- **In parallel**: While a turn is in flight you can spawn other agents, check progress and read output with `read_agent_session` (returns persisted messages plus a `live` block with `status: running/idle` and the live event tail when running), respond to permission requests (`respond_to_agent_permission`), or talk to the user.
+- **Match MCPs to tasks**: Load only the MCPs an agent needs
+
+### Background Events
+- After every fire-and-forget turn, you'll receive a structured `[SESSION xxx event: turn <id> <status>, ...]` line (succeeded / failed / cancelled / timeout). Status only — call `read_agent_session(session_id)` for the actual content; it works both while a turn is still running (live tail in `live.events`) and after it finishes (persisted messages).
+- Permission events also arrive as structured lines: `[SESSION xxx event: <user|orchestrator> <approved|denied> <ToolName> — "<message>"]`. Typically the user answered in their tab; only call `respond_to_agent_permission` when they're unavailable, the agent has explicitly asked you to decide, or you have a specific reason to overrule.
+- Agents announce intent BEFORE calling gated tools (per their system prompt). When you see one of those announcements in `read_agent_session`'s `live.events` while a turn is running, you can respond via the agent's chat — the user's chat reply also auto-denies the pending popup with their prose as the rejection reason, prompting the agent to refine.
+
+### Session Management
+- **Open sessions only when needed**: Don't open sessions speculatively
+- **Close sessions when done**: Free resources after tasks complete
+- **Report progress**: Keep the user informed of status and results
+- **Use the returned session_id immediately**: When `open_agent_session` returns `{"session_id": "<id>", "status": "started"}`, the very next `send_to_agent_session` call for that work MUST pass that exact `<id>`. Do not reuse an older session_id from earlier in the conversation — that silently delivers the work to the wrong agent and the user sees the original task respond, not the new one.
+- **Check tool results**: When a tool returns `{"error": "..."}`, treat it as a failure even if the error sounds recoverable. Do not narrate "I've opened a new session" if `open_agent_session` errored — tell the user what failed and pick a valid input (e.g. an MCP from the Available MCPs list) before retrying.
+
+### Session Configuration
+Sessions inherit their settings from `assistant_config.json` — the same file the Config page in the UI edits. Every `open_agent_session` call resolves working directory (local path or SSH target), session harness (`claude` / `qwen`), harness model, chrome flag, and enabled MCPs from that file at the moment of the call. The orchestrator does NOT carry a separate config: editing the file via the UI or the tools below changes what the next spawned session sees, immediately.
+
+- **Before spawning with non-default settings**: call `get_assistant_config` to inspect the current values. Each `open_agent_session` response also echoes the `resolved_config` it actually used, so you can verify after the fact.
+- **To change settings**: call `update_assistant_config` with only the fields you want to change. Same validation as the Config page (working-directory ids must exist in `working_directory_history`, harness must be registered, etc.). Changes take effect on the next `open_agent_session`.
+- **For one-off MCP overrides**: pass `mcp_servers` to `open_agent_session` directly — that replaces the inherited list for that session only, without touching the global config.
+- **Confirm with the user first** before changing global config in ways that persist across sessions (switching working directory, switching provider, enabling chrome). The user owns the Config page; surprise edits will confuse them.
+
+### Memory Maintenance
+- **Update the shared index** when you or agents modify skills or create memory files
+- **Remind agents** to report back when their work affects the index
+- **Verify writes** — after updating any memory file, confirm nothing was accidentally omitted"""
+
+
+# Fixed scaffolding of the MCP section; only the server list and the usage
+# examples derived from it vary.
+_MCP_SECTION_TMPL = """## MCP Orchestration
+
+MCP (Model Context Protocol) servers extend agent capabilities by connecting to external tools and services.
+You can configure which MCPs are loaded when opening agent sessions.
+
+### Available MCPs
+
+{items}
+
+### Usage
+
+When calling `open_agent_session`, pass the `mcp_servers` parameter with a list of MCP names:
+{usage_examples}- Omit parameter or pass `[]` — Default Claude Code tools only
+
+**Only pass names from the list above.** Inventing names will fail the call.
+Load only the MCPs needed for each task to minimize resource usage."""
+
 
 def _self_reference_section(context: dict[str, Any]) -> str | None:
     """Expose the orchestrator's own conversation JSONL path.
@@ -231,7 +378,17 @@ def _active_sessions_section(context: dict[str, Any]) -> str:
         for h in runner.list_in_flight():
             in_flight.setdefault(h.session_id, []).append(h)
 
+    # Title lookup (best-effort) — agents that just opened may not have a
+    # JSONL entry yet, in which case we just omit it.
     store = context.get("store")
+    infos: dict[str, Any] = {}
+    if store is not None:
+        try:
+            infos = store.get_session_infos(
+                [s["sdk_session_id"] for s in sessions if s.get("sdk_session_id")]
+            )
+        except Exception:  # noqa: BLE001
+            pass
     lines = ["## Active Agent Sessions"]
     for s in sessions:
         sid = s["session_id"]
@@ -240,16 +397,8 @@ def _active_sessions_section(context: dict[str, Any]) -> str:
         cost = s.get("cost", 0.0)
         sdk_id = s.get("sdk_session_id", "")
 
-        # Title lookup (best-effort) — agents that just opened may not have a
-        # JSONL entry yet, in which case we just omit it.
-        title: str | None = None
-        if store is not None and sdk_id:
-            try:
-                info = store.get_session_info(sdk_id)
-                if info is not None:
-                    title = info.title
-            except Exception:  # noqa: BLE001
-                pass
+        info = infos.get(sdk_id) if sdk_id else None
+        title: str | None = info.title if info is not None else None
 
         title_part = f' ("{title}")' if title else ""
         sdk_note = f", sdk_id={sdk_id}" if sdk_id else ""
@@ -292,6 +441,31 @@ def _active_sessions_section(context: dict[str, Any]) -> str:
 
 
 def _mcp_section() -> str:
+    """Return the MCP orchestration section, re-rendering only on config edits.
+
+    The section is a pure function of the MCP config files and
+    ``mcp_descriptions.json``, so it is cached on their stat stamps: an
+    unchanged catalog costs three ``stat`` calls and yields the identical
+    string (keeping the cacheable prompt prefix stable). Missing files stamp
+    as absent, so a project without MCP config is cached the same way and
+    never opens or parses anything after the first build.
+    """
+    desc_path = _mcp_descriptions_path()
+    return _render_mcp_section_cached(
+        mcp_config_stamp(), desc_path, _file_stamp(desc_path),
+    )
+
+
+@lru_cache(maxsize=4)
+def _render_mcp_section_cached(
+    config_stamp: tuple[Any, ...],
+    desc_path: str,
+    desc_stamp: tuple[int, int] | None,
+) -> str:
+    return _build_mcp_section()
+
+
+def _build_mcp_section() -> str:
     """Build the MCP orchestration section with dynamically loaded server info.
 
     Renders the live list of MCP servers available in this project. When the
@@ -301,72 +475,40 @@ def _mcp_section() -> str:
     """
     available_mcps = load_available_mcps()
 
-    lines = [
-        "## MCP Orchestration",
-        "",
-        "MCP (Model Context Protocol) servers extend agent capabilities by connecting to external tools and services.",
-        "You can configure which MCPs are loaded when opening agent sessions.",
-        "",
-        "### Available MCPs",
-        "",
-    ]
-
     if available_mcps:
-        for name in sorted(available_mcps.keys()):
-            description = _get_mcp_description(name, available_mcps[name])
-            lines.append(f"- **{name}**: {description}")
-        usage_examples = [
-            f"- `mcp_servers=['{name}']` — load only `{name}`"
-            for name in sorted(available_mcps.keys())[:2]
-        ]
+        descriptions = _load_mcp_descriptions()
+        names = sorted(available_mcps.keys())
+        items = "\n".join(
+            f"- **{name}**: {_get_mcp_description(name, available_mcps[name], descriptions)}"
+            for name in names
+        )
+        usage_examples = "".join(
+            f"- `mcp_servers=['{name}']` — load only `{name}`\n"
+            for name in names[:2]
+        )
     else:
-        lines.append("- _(none configured for this project)_")
-        usage_examples = []
-
-    lines.extend([
-        "",
-        "### Usage",
-        "",
-        "When calling `open_agent_session`, pass the `mcp_servers` parameter with a list of MCP names:",
-        *usage_examples,
-        "- Omit parameter or pass `[]` — Default Claude Code tools only",
-        "",
-        "**Only pass names from the list above.** Inventing names will fail the call.",
-        "Load only the MCPs needed for each task to minimize resource usage.",
-    ])
+        items = "- _(none configured for this project)_"
+        usage_examples = ""
 
-    return "\n".join(lines)
+    return _MCP_SECTION_TMPL.format(items=items, usage_examples=usage_examples)
 
 
-def _memory_section(
-    config: OrchestratorConfig,
-    voice_provider_id: str | None = None,
-) -> str:
-    """Build the memory system section explaining both shared and private memory.
+def _memory_instructions_section(memory_path: str, project_dir: str) -> str:
+    """Build the static memory-system instructions (shared wiki + private file).
 
-    When ``voice_provider_id`` is set (only in realtime voice sessions) and a
-    matching `ORCHESTRATOR_MEMORY_<provider>.md` file exists, its contents are
-    appended as a separate "Provider-Specific Memory" subsection along with
-    short editing instructions.
+    Depends only on the configured memory path, so it stays byte-identical
+    across turns and belongs in the cacheable prefix of the prompt. The file
+    contents themselves are rendered by ``_memory_contents_section``.
     """
     # Get relative path for display
-    relative_path = config.memory_path
-    if config.project_dir and config.memory_path.startswith("/"):
+    relative_path = memory_path
+    if project_dir and memory_path.startswith("/"):
         try:
-            relative_path = str(Path(config.memory_path).relative_to(Path(config.project_dir)))
+            relative_path = str(Path(memory_path).relative_to(Path(project_dir)))
         except ValueError:
             pass
 
-    # Load memory contents
-    memory_index = _load_memory_index(config)
-    private_memory = _load_private_memory(config)
-    provider_memory, provider_memory_path = (
-        _load_provider_memory(config, voice_provider_id)
-        if voice_provider_id
-        else ("", None)
-    )
-
-    section = f"""## Memory System
+    return f"""## Memory System
 
 `context/memory/` is a structured wiki — files live in semantic category folders, carry YAML frontmatter, and link to related files inline. `MEMORY.md` is the index: it documents the current folder ontology, the frontmatter schema, the cross-reference format, and lists every file with its location. Read MEMORY.md to discover what categories exist and what files already cover a topic — it is loaded below.
 
@@ -395,37 +537,51 @@ def _memory_section(
 
 For orchestrator-specific state: active workflows, pending tasks, session notes. Does NOT follow the frontmatter convention."""
 
-    # Add shared memory index contents
-    if memory_index:
-        section += f"""
 
----
+def _memory_contents_section(
+    config: OrchestratorConfig,
+    voice_provider_id: str | None = None,
+    budgets: PromptBudgets = DEFAULT_PROMPT_BUDGETS,
+) -> str:
+    """Render the current contents of the shared index and private memory.
+
+    These change whenever memory is edited, so they are placed after the
+    static sections of the prompt.
+
+    When ``voice_provider_id`` is set (only in realtime voice sessions) and a
+    matching `ORCHESTRATOR_MEMORY_<provider>.md` file exists, its contents are
+    appended as a separate "Provider-Specific Memory" subsection along with
+    short editing instructions.
+    """
+    memory_index = _load_memory_index(config, budgets)
+    private_memory = _load_private_memory(config, budgets)
+    provider_memory, provider_memory_path = (
+        _load_provider_memory(config, voice_provider_id, budgets)
+        if voice_provider_id
+        else ("", None)
+    )
+
+    parts: list[str] = []
 
-### Current Shared Memory Index
+    # Add shared memory index contents
+    if memory_index:
+        parts.append(f"""### Current Shared Memory Index
 
 ```markdown
 {memory_index}
-```"""
+```""")
 
     # Add private memory contents
     if private_memory:
-        section += f"""
-
----
-
-### Current Private Memory
+        parts.append(f"""### Current Private Memory
 
 ```
 {private_memory}
-```"""
+```""")
     else:
-        section += """
+        parts.append("""### Current Private Memory
 
----
-
-### Current Private Memory
-
-Your private memory is currently empty."""
+Your private memory is currently empty.""")
 
     # Add voice-provider-specific memory (only loaded in realtime voice sessions
     # when an ORCHESTRATOR_MEMORY_<provider>.md file exists).
@@ -438,98 +594,55 @@ Your private memory is currently empty."""
                 )
             except ValueError:
                 pass
-        section += f"""
-
----
-
-### Provider-Specific Memory (`{provider_rel}`)
+        parts.append(f"""### Provider-Specific Memory (`{provider_rel}`)
 
 This file is loaded **only** when you are running on the `{voice_provider_id}` realtime voice provider. Use it for guidance, alignment, or context that applies just to this provider — not the general orchestrator behavior. Edit this file (not the main private memory) when feedback or learnings only apply when speaking through `{voice_provider_id}` voice.
 
 ```
 {provider_memory}
-```"""
+```""")
 
-    return section
+    return "## Current Memory\n\n" + "\n\n---\n\n".join(parts)
 
 
-def _guidelines_section() -> str:
-    """Build the operational guidelines section."""
-    return """## Guidelines
-
-### Before Starting Work
-- **Search first**: Use `search_memory` and `search_history` before non-trivial tasks — relevant context often exists
-- **Check active sessions**: Review what's already running to avoid duplicate work
-
-### Delegating to Agents
-- **Be specific**: Give clear, actionable instructions with enough context for independent work
-- **Fire-and-forget**: `send_to_agent_session` returns IMMEDIATELY with a turn_id; the agent runs in the background. Do NOT loop calling it waiting for a response — results arrive as background events on your next turn.
-- **In parallel**: While a turn is in flight you can spawn other agents, check progress and read output with `read_agent_session` (returns persisted messages plus a `live` block with `status: running/idle` and the live event tail when running), respond to permission requests (`respond_to_agent_permission`), or talk to the user.
-- **Match MCPs to tasks**: Load only the MCPs an agent needs
-
-### Background Events
-- After every fire-and-forget turn, you'll receive a structured `[SESSION xxx event: turn <id> <status>, ...]` line (succeeded / failed / cancelled / timeout). Status only — call `read_agent_session(session_id)` for the actual content; it works both while a turn is still running (live tail in `live.events`) and after it finishes (persisted messages).
-- Permission events also arrive as structured lines: `[SESSION xxx event: <user|orchestrator> <approved|denied> <ToolName> — "<message>"]`. Typically the user answered in their tab; only call `respond_to_agent_permission` when they're unavailable, the agent has explicitly asked you to decide, or you have a specific reason to overrule.
-- Agents announce intent BEFORE calling gated tools (per their system prompt). When you see one of those announcements in `read_agent_session`'s `live.events` while a turn is running, you can respond via the agent's chat — the user's chat reply also auto-denies the pending popup with their prose as the rejection reason, prompting the agent to refine.
-
-### Session Management
-- **Open sessions only when needed**: Don't open sessions speculatively
-- **Close sessions when done**: Free resources after tasks complete
-- **Report progress**: Keep the user informed of status and results
-- **Use the returned session_id immediately**: When `open_agent_session` returns `{"session_id": "<id>", "status": "started"}`, the very next `send_to_agent_session` call for that work MUST pass that exact `<id>`. Do not reuse an older session_id from earlier in the conversation — that silently delivers the work to the wrong agent and the user sees the original task respond, not the new one.
-- **Check tool results**: When a tool returns `{"error": "..."}`, treat it as a failure even if the error sounds recoverable. Do not narrate "I've opened a new session" if `open_agent_session` errored — tell the user what failed and pick a valid input (e.g. an MCP from the Available MCPs list) before retrying.
-
-### Session Configuration
-Sessions inherit their settings from `assistant_config.json` — the same file the Config page in the UI edits. Every `open_agent_session` call resolves working directory (local path or SSH target), session harness (`claude` / `qwen`), harness model, chrome flag, and enabled MCPs from that file at the moment of the call. The orchestrator does NOT carry a separate config: editing the file via the UI or the tools below changes what the next spawned session sees, immediately.
-
-- **Before spawning with non-default settings**: call `get_assistant_config` to inspect the current values. Each `open_agent_session` response also echoes the `resolved_config` it actually used, so you can verify after the fact.
-- **To change settings**: call `update_assistant_config` with only the fields you want to change. Same validation as the Config page (working-directory ids must exist in `working_directory_history`, harness must be registered, etc.). Changes take effect on the next `open_agent_session`.
-- **For one-off MCP overrides**: pass `mcp_servers` to `open_agent_session` directly — that replaces the inherited list for that session only, without touching the global config.
-- **Confirm with the user first** before changing global config in ways that persist across sessions (switching working directory, switching provider, enabling chrome). The user owns the Config page; surprise edits will confuse them.
-
-### Memory Maintenance
-- **Update the shared index** when you or agents modify skills or create memory files
-- **Remind agents** to report back when their work affects the index
-- **Verify writes** — after updating any memory file, confirm nothing was accidentally omitted"""
+_ROLE_LABELS = {"user": "User"}
 
 
 def _format_message(msg: dict[str, Any]) -> str | None:
     """Render a single Anthropic-format message as a Markdown line.
 
     Returns None for empty messages that shouldn't appear in the transcript.
+    Runs for every recent message on every prompt build, so it dispatches on
+    exact types (history entries are plain JSON-shaped dicts/lists/strs)
+    and keeps method lookups out of the block loop.
     """
-    role = msg.get("role", "?")
-    label = "User" if role == "user" else "Assistant"
+    label = _ROLE_LABELS.get(msg.get("role"), "Assistant")
     content = msg.get("content", "")
+    content_type = type(content)
 
-    if isinstance(content, str):
+    if content_type is str:
         text = content.strip()
         return f"**{label}:** {text}" if text else None
 
-    if not isinstance(content, list):
+    if content_type is not list:
         return None
 
     parts: list[str] = []
+    append = parts.append
     for block in content:
-        if not isinstance(block, dict):
+        if type(block) is not dict:
             continue
-        btype = block.get("type", "")
+        btype = block.get("type")
         if btype == "text":
             text = block.get("text", "").strip()
             if text:
-                parts.append(text)
+                append(text)
         elif btype == "tool_use":
-            parts.append(f"[used tool: {block.get('name', '?')}]")
+            append(f"[used tool: {block.get('name', '?')}]")
         elif btype == "tool_result":
-            result_content = block.get("content", "")
-            if isinstance(result_content, list):
-                result_content = " ".join(
-                    b.get("text", "") for b in result_content
-                    if isinstance(b, dict) and b.get("type") == "text"
-                )
             # Tool-result payloads have already been clipped upstream by
             # truncate_tool_results(); pass them through as-is.
-            parts.append(f"[tool result: {result_content}]")
+            append(f"[tool result: {tool_result_text(block.get('content', ''))}]")
 
     return f"**{label}:** {' '.join(parts)}" if parts else None
 
@@ -571,22 +684,68 @@ def _history_section(
 # Main Prompt Builder
 # ---------------------------------------------------------------------------
 
-def build_system_prompt(
+@lru_cache(maxsize=8)
+def _static_prompt_text(mcp_section: str, memory_path: str, project_dir: str) -> str:
+    """Assemble the static prompt prefix once per distinct input.
+
+    ``_mcp_section`` hands back the same cached string object while the MCP
+    config is unchanged (its hash is memoised on the object), so a repeat
+    lookup here is effectively free and the whole prefix is reused instead
+    of being re-formatted and re-joined on every build.
+    """
+    return "\n\n".join([
+        _ROLE_SECTION,
+        _GUIDELINES_SECTION,
+        mcp_section,
+        _memory_instructions_section(memory_path, project_dir),
+    ])
+
+
+def _prompt_parts(
+    config: OrchestratorConfig,
+    context: dict[str, Any],
+    recent_messages: list[dict[str, Any]] | None,
+    history_summary: str | None,
+    voice_provider_id: str | None,
+    budgets: PromptBudgets,
+) -> tuple[str, list[str]]:
+    """Return the cached static prefix and the non-empty dynamic sections."""
+    static_text = _static_prompt_text(
+        _mcp_section(), config.memory_path, config.project_dir,
+    )
+    dynamic_sections = [
+        _self_reference_section(context),
+        _active_sessions_section(context),
+        _memory_contents_section(config, voice_provider_id=voice_provider_id, budgets=budgets),
+        _history_section(recent_messages, history_summary),
+    ]
+    return static_text, [s for s in dynamic_sections if s]
+
+
+def build_system_prompt_blocks(
     config: OrchestratorConfig,
     context: dict[str, Any],
     recent_messages: list[dict[str, Any]] | None = None,
     history_summary: str | None = None,
     voice_provider_id: str | None = None,
-) -> str:
-    """Build the orchestrator's system prompt.
+    budgets: PromptBudgets = DEFAULT_PROMPT_BUDGETS,
+) -> list[dict[str, Any]]:
+    """Build the orchestrator's system prompt as two Anthropic text blocks.
+
+    Sections are ordered static-first so the leading bytes of the prompt
+    stay identical across turns and providers' prefix caches can reuse them:
 
-    Assembles sections in logical order:
+    Static block (carries the ``cache_control`` breakpoint):
     1. Role and identity
-    2. Current state (active sessions)
+    2. Guidelines
     3. Capabilities (MCP orchestration)
-    4. Knowledge (memory system with contents)
-    5. Guidelines
-    6. Context (recent verbatim messages + summary of older ones)
+    4. Memory system instructions
+
+    Dynamic block:
+    5. This conversation's JSONL path
+    6. Current state (active sessions)
+    7. Memory contents (shared index, private and provider memory)
+    8. Context (recent verbatim messages + summary of older ones)
 
     The caller is responsible for splitting raw history into
     ``recent_messages`` (kept verbatim, with tool results pre-clipped) and
@@ -598,14 +757,34 @@ def build_system_prompt(
     the main orchestrator memory, its contents are appended to the memory
     section. Text and audio modes never pass this argument, so provider-
     specific memory never leaks into non-voice prompts.
+
+    ``budgets`` caps how much of each memory file is inlined.
     """
-    sections = [
-        _role_section(),
-        _self_reference_section(context),
-        _active_sessions_section(context),
-        _mcp_section(),
-        _memory_section(config, voice_provider_id=voice_provider_id),
-        _guidelines_section(),
-        _history_section(recent_messages, history_summary),
+    static_text, dynamic_sections = _prompt_parts(
+        config, context, recent_messages, history_summary, voice_provider_id, budgets,
+    )
+    return [
+        {"type": "text", "text": static_text, "cache_control": {"type": "ephemeral"}},
+        {"type": "text", "text": "\n\n".join(dynamic_sections)},
     ]
-    return "\n\n".join(s for s in sections if s)
+
+
+def build_system_prompt(
+    config: OrchestratorConfig,
+    context: dict[str, Any],
+    recent_messages: list[dict[str, Any]] | None = None,
+    history_summary: str | None = None,
+    voice_provider_id: str | None = None,
+    budgets: PromptBudgets = DEFAULT_PROMPT_BUDGETS,
+) -> str:
+    """Build the orchestrator's system prompt as a single string.
+
+    Same content and order as ``build_system_prompt_blocks``, joined for
+    callers that need plain text (realtime voice session updates).
+    """
+    # One join over all sections — joining the dynamic block first and then
+    # the two blocks would copy the (large) dynamic text twice.
+    static_text, dynamic_sections = _prompt_parts(
+        config, context, recent_messages, history_summary, voice_provider_id, budgets,
+    )
+    return "\n\n".join([static_text, *dynamic_sections])
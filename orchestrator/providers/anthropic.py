@@ -2,13 +2,14 @@
 
 from __future__ import annotations
 
-import json
 import logging
 from collections.abc import AsyncIterator
 from typing import Any
 
 import anthropic
+import orjson
 
+from orchestrator.providers.base import SystemPrompt
 from orchestrator.types import (
     OrchestratorEvent,
     TextDelta,
@@ -20,6 +21,33 @@ from orchestrator.types import (
 
 logger = logging.getLogger(__name__)
 
+_shared_client: anthropic.AsyncAnthropic | None = None
+
+
+def get_shared_client() -> anthropic.AsyncAnthropic:
+    """Return the process-wide AsyncAnthropic client, creating it on first use.
+
+    The provider and the history summarizer share it, so its httpx
+    connection pool (and TLS sessions) stay warm across calls.
+    """
+    global _shared_client
+    if _shared_client is None:
+        _shared_client = anthropic.AsyncAnthropic()
+    return _shared_client
+
+
+def _with_cache_breakpoint(system: SystemPrompt) -> SystemPrompt:
+    """Ensure the system prompt carries a prompt-cache breakpoint.
+
+    Block lists from ``build_system_prompt_blocks`` already mark the end of
+    their static prefix and pass through untouched. A plain string is
+    wrapped as one cached block — tool-loop iterations within a turn resend
+    an identical tools + system prefix, so they still read it from cache.
+    """
+    if not system or not isinstance(system, str):
+        return system
+    return [{"type": "text", "text": system, "cache_control": {"type": "ephemeral"}}]
+
 
 class AnthropicProvider:
     """Model provider using the Anthropic Messages API with streaming.
@@ -30,13 +58,13 @@ class AnthropicProvider:
     def __init__(self, model: str = "claude-sonnet-4-5-20250929", max_tokens: int = 8192) -> None:
         self._model = model
         self._max_tokens = max_tokens
-        self._client = anthropic.AsyncAnthropic()
+        self._client = get_shared_client()
 
     async def create_message(
         self,
         messages: list[dict[str, Any]],
         tools: list[dict[str, Any]],
-        system: str,
+        system: SystemPrompt,
     ) -> AsyncIterator[OrchestratorEvent]:
         """Stream a model response, yielding orchestrator events.
 
@@ -45,18 +73,19 @@ class AnthropicProvider:
         kwargs: dict[str, Any] = {
             "model": self._model,
             "max_tokens": self._max_tokens,
-            "system": system,
+            "system": _with_cache_breakpoint(system),
             "messages": messages,
         }
         if tools:
             kwargs["tools"] = tools
 
-        # Track state for content block accumulation
+        # Track state for content block accumulation. Streamed chunks are
+        # collected in lists and joined once at content_block_stop.
         current_block_type: str | None = None
-        current_text = ""
+        current_text_parts: list[str] = []
         current_tool_id = ""
         current_tool_name = ""
-        current_tool_input_json = ""
+        current_tool_input_parts: list[str] = []
         input_tokens = 0
         output_tokens = 0
 
@@ -65,37 +94,37 @@ class AnthropicProvider:
                 async for event in stream:
                     event_type = event.type
 
-                    if event_type == "message_start":
-                        usage = getattr(event.message, "usage", None)
-                        if usage:
-                            input_tokens = getattr(usage, "input_tokens", 0)
+                    # Branches ordered by frequency: one delta per streamed
+                    # token, a handful of block/message events per turn.
+                    if event_type == "content_block_delta":
+                        delta = event.delta
+                        if delta.type == "text_delta":
+                            current_text_parts.append(delta.text)
+                            yield TextDelta(text=delta.text)
+                        elif delta.type == "input_json_delta":
+                            current_tool_input_parts.append(delta.partial_json)
 
                     elif event_type == "content_block_start":
                         block = event.content_block
                         if block.type == "text":
                             current_block_type = "text"
-                            current_text = ""
+                            current_text_parts = []
                         elif block.type == "tool_use":
                             current_block_type = "tool_use"
                             current_tool_id = block.id
                             current_tool_name = block.name
-                            current_tool_input_json = ""
-
-                    elif event_type == "content_block_delta":
-                        delta = event.delta
-                        if delta.type == "text_delta":
-                            current_text += delta.text
-                            yield TextDelta(text=delta.text)
-                        elif delta.type == "input_json_delta":
-                            current_tool_input_json += delta.partial_json
+                            current_tool_input_parts = []
 
                     elif event_type == "content_block_stop":
-                        if current_block_type == "text" and current_text:
-                            yield TextComplete(text=current_text)
+                        if current_block_type == "text" and current_text_parts:
+                            current_text = "".join(current_text_parts)
+                            if current_text:
+                                yield TextComplete(text=current_text)
                         elif current_block_type == "tool_use":
+                            current_tool_input_json = "".join(current_tool_input_parts)
                             try:
-                                tool_input = json.loads(current_tool_input_json) if current_tool_input_json else {}
-                            except json.JSONDecodeError:
+                                tool_input = orjson.loads(current_tool_input_json) if current_tool_input_json else {}
+                            except orjson.JSONDecodeError:
                                 tool_input = {}
                             yield ToolUseStart(
                                 tool_call_id=current_tool_id,
@@ -104,10 +133,17 @@ class AnthropicProvider:
                             )
                         current_block_type = None
 
+                    elif event_type == "message_start":
+                        try:
+                            input_tokens = event.message.usage.input_tokens
+                        except AttributeError:
+                            pass
+
                     elif event_type == "message_delta":
-                        usage = getattr(event, "usage", None)
-                        if usage:
-                            output_tokens = getattr(usage, "output_tokens", 0)
+                        try:
+                            output_tokens = event.usage.output_tokens
+                        except AttributeError:
+                            pass
 
             yield TurnComplete(input_tokens=input_tokens, output_tokens=output_tokens)
 
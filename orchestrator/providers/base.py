@@ -7,6 +7,19 @@ from typing import Any, Protocol, runtime_checkable
 
 from orchestrator.types import OrchestratorEvent
 
+# A system prompt is either plain text or a list of Anthropic-style text
+# blocks (``{"type": "text", "text": ..., "cache_control": ...}``). Blocks
+# let providers that support prompt caching mark where the static prefix
+# ends; everyone else flattens them with ``system_prompt_text``.
+SystemPrompt = str | list[dict[str, Any]]
+
+
+def system_prompt_text(system: SystemPrompt) -> str:
+    """Flatten a system prompt to plain text (blocks joined by blank lines)."""
+    if isinstance(system, str):
+        return system
+    return "\n\n".join(b["text"] for b in system if b.get("text"))
+
 
 @runtime_checkable
 class ModelProvider(Protocol):
@@ -21,14 +34,15 @@ class ModelProvider(Protocol):
         self,
         messages: list[dict[str, Any]],
         tools: list[dict[str, Any]],
-        system: str,
+        system: SystemPrompt,
     ) -> AsyncIterator[OrchestratorEvent]:
         """Stream a model response as orchestrator events.
 
         Args:
             messages: Conversation history in API format.
             tools: Tool definitions in Anthropic format.
-            system: System prompt string.
+            system: System prompt — a string or a list of text blocks
+                (see ``SystemPrompt``).
 
         Yields:
             OrchestratorEvent instances (TextDelta, ToolUseStart, TurnComplete, etc.)
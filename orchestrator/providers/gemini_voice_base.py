@@ -59,6 +59,7 @@ from orchestrator import voice_vad
 from orchestrator.providers.voice_base import (
     BaseVoiceProvider,
     ToolCallAccumulator,
+    VoiceEventQueue,
 )
 from orchestrator.voice_errors import VoiceError, VoiceErrorCategory
 from orchestrator.types import (
@@ -131,7 +132,7 @@ class GeminiVoiceProviderBase(BaseVoiceProvider, ToolCallAccumulator, abc.ABC):
         # exists for signature parity with QwenVoiceProvider /
         # OpenAIVoiceProvider but is currently unused.
         self._transcription_language = transcription_language
-        self._queue: asyncio.Queue[dict[str, Any]] = asyncio.Queue()
+        self._queue = VoiceEventQueue()
         # Running transcript for interruption events.
         self._current_transcript: str = ""
         # Session resumption — Gemini Live closes the upstream WS after
@@ -212,7 +213,7 @@ class GeminiVoiceProviderBase(BaseVoiceProvider, ToolCallAccumulator, abc.ABC):
     # --- ingestion --------------------------------------------------------
 
     async def inject_event(self, raw_event: dict[str, Any]) -> None:
-        await self._queue.put(raw_event)
+        self._queue.offer(raw_event)
 
     async def inject_audio(self, pcm_b64: str, sample_rate: int) -> None:
         """Frontend mic chunk → backend → relayed to Gemini via realtimeInput.
@@ -241,7 +242,7 @@ class GeminiVoiceProviderBase(BaseVoiceProvider, ToolCallAccumulator, abc.ABC):
         self._current_transcript = ""
         while True:
             try:
-                event = await asyncio.wait_for(self._queue.get(), timeout=30.0)
+                event = await self._queue.next_event(timeout=30.0)
             except asyncio.TimeoutError:
                 yield ErrorEvent(error="voice_timeout", detail="No event received within 30s")
                 return
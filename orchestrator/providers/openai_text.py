@@ -19,6 +19,7 @@ from typing import Any
 
 import openai
 
+from orchestrator.providers.base import SystemPrompt, system_prompt_text
 from orchestrator.types import (
     ErrorEvent,
     OrchestratorEvent,
@@ -30,6 +31,20 @@ from orchestrator.types import (
 
 logger = logging.getLogger(__name__)
 
+_shared_client: openai.AsyncOpenAI | None = None
+
+
+def get_shared_client() -> openai.AsyncOpenAI:
+    """Return the process-wide AsyncOpenAI client, creating it on first use.
+
+    The provider and the history summarizer share it, so its httpx
+    connection pool (and TLS sessions) stay warm across calls.
+    """
+    global _shared_client
+    if _shared_client is None:
+        _shared_client = openai.AsyncOpenAI()
+    return _shared_client
+
 
 # ---------------------------------------------------------------------------
 # Constants and Configuration
@@ -151,7 +166,7 @@ def anthropic_to_openai_tools(tools: list[dict[str, Any]]) -> list[dict[str, Any
 
 def convert_messages_for_openai(
     messages: list[dict[str, Any]],
-    system: str,
+    system: SystemPrompt,
 ) -> list[dict[str, Any]]:
     """Convert Anthropic-style messages to OpenAI format.
 
@@ -169,7 +184,8 @@ def convert_messages_for_openai(
     """
     openai_messages: list[dict[str, Any]] = []
 
-    # Add system message first
+    # Add system message first (OpenAI has no cache_control; flatten blocks)
+    system = system_prompt_text(system)
     if system:
         openai_messages.append({"role": "system", "content": system})
 
@@ -393,7 +409,7 @@ class OpenAITextProvider:
                 self._model_enum = None
 
         self._max_tokens = max_tokens
-        self._client = openai.AsyncOpenAI()
+        self._client = get_shared_client()
 
     @property
     def model(self) -> str:
@@ -409,7 +425,7 @@ class OpenAITextProvider:
         self,
         messages: list[dict[str, Any]],
         tools: list[dict[str, Any]],
-        system: str,
+        system: SystemPrompt,
     ) -> AsyncIterator[OrchestratorEvent]:
         """Stream a model response, yielding orchestrator events.
 
@@ -15,7 +15,6 @@ Architecture::
 from __future__ import annotations
 
 import asyncio
-import json
 import logging
 import os
 from collections.abc import AsyncIterator
@@ -24,8 +23,10 @@ from typing import Any
 import httpx
 
 from orchestrator.providers.voice_base import (
+    RESPONSE_CREATE,
     BaseVoiceProvider,
     ToolCallAccumulator,
+    VoiceEventQueue,
 )
 from orchestrator.voice_errors import VoiceError, VoiceErrorCategory
 from orchestrator.types import (
@@ -33,7 +34,6 @@ from orchestrator.types import (
     OrchestratorEvent,
     TextDelta,
     TextComplete,
-    ToolUseStart,
     TurnComplete,
     VoiceInterrupted,
 )
@@ -50,6 +50,19 @@ VOICE_NAME = "cedar"
 OPENAI_CLIENT_SECRETS_URL = "https://api.openai.com/v1/realtime/client_secrets"
 OPENAI_CALLS_URL = "https://api.openai.com/v1/realtime/calls"
 
+# Transcript deltas arrive roughly one token per event. ``create_message``
+# merges consecutive queued deltas into one ``TextDelta`` (capped so a long
+# backlog still streams out in readable chunks).
+_TRANSCRIPT_DELTA_TYPES = frozenset({
+    "response.output_audio_transcript.delta",
+    "response.audio_transcript.delta",
+})
+MAX_MERGED_DELTA_CHARS = 512
+
+# Audio format for both directions of a Realtime session. Shared by every
+# session.update payload; treat as read-only.
+_PCM_24K_FORMAT: dict[str, Any] = {"type": "audio/pcm", "rate": 24000}
+
 # Default VAD config — server-side VAD (the frontend doesn't push-to-talk).
 DEFAULT_VAD = {
     "type": "server_vad",
@@ -85,7 +98,11 @@ class OpenAIVoiceProvider(BaseVoiceProvider, ToolCallAccumulator):
         # exposed in the UI for OpenAI sessions; the param exists for
         # signature parity with QwenVoiceProvider.
         self._transcription_language = transcription_language
-        self._queue: asyncio.Queue[dict[str, Any]] = asyncio.Queue()
+        # Static per instance, so built once rather than per session.update.
+        self._transcription_config: dict[str, Any] = {"model": "whisper-1"}
+        if transcription_language:
+            self._transcription_config["language"] = transcription_language
+        self._queue = VoiceEventQueue()
         self._current_transcript: str = ""
 
     # --- identity ---------------------------------------------------------
@@ -124,7 +141,7 @@ class OpenAIVoiceProvider(BaseVoiceProvider, ToolCallAccumulator):
     # --- ingestion --------------------------------------------------------
 
     async def inject_event(self, raw_event: dict[str, Any]) -> None:
-        await self._queue.put(raw_event)
+        self._queue.offer(raw_event)
 
     # WebRTC: audio bypasses backend; the base class default raise applies.
 
@@ -141,16 +158,35 @@ class OpenAIVoiceProvider(BaseVoiceProvider, ToolCallAccumulator):
         Runs until ``response.done`` or an ``error`` event is observed.
         """
         self._current_transcript = ""
+        # Non-delta event pulled off the queue while merging deltas; it is
+        # processed on the next iteration instead of waiting on the queue.
+        carried: dict[str, Any] | None = None
 
         while True:
-            try:
-                event = await asyncio.wait_for(self._queue.get(), timeout=30.0)
-            except asyncio.TimeoutError:
-                yield ErrorEvent(error="voice_timeout", detail="No event received within 30s")
-                return
+            if carried is not None:
+                event, carried = carried, None
+            else:
+                try:
+                    event = await self._queue.next_event(timeout=30.0)
+                except asyncio.TimeoutError:
+                    yield ErrorEvent(error="voice_timeout", detail="No event received within 30s")
+                    return
 
             event_type = event.get("type", "")
 
+            if event_type in _TRANSCRIPT_DELTA_TYPES:
+                text = event.get("delta", "")
+                while len(text) < MAX_MERGED_DELTA_CHARS and not self._queue.empty():
+                    queued = self._queue.get_nowait()
+                    if queued.get("type") not in _TRANSCRIPT_DELTA_TYPES:
+                        carried = queued
+                        break
+                    text += queued.get("delta", "")
+                self._current_transcript += text
+                if text:
+                    yield TextDelta(text=text)
+                continue
+
             # Side-effects: track partial transcript for interruption context
             # and stash function-call metadata before translating.
             # Increment E — both delegated to ``ToolCallAccumulator``.
@@ -168,12 +204,6 @@ class OpenAIVoiceProvider(BaseVoiceProvider, ToolCallAccumulator):
                     event.get("delta", ""),
                 )
 
-            elif event_type in (
-                "response.output_audio_transcript.delta",
-                "response.audio_transcript.delta",
-            ):
-                self._current_transcript += event.get("delta", "")
-
             translated = self.translate_event(event)
             if translated is not None:
                 yield translated
@@ -203,27 +233,9 @@ class OpenAIVoiceProvider(BaseVoiceProvider, ToolCallAccumulator):
     def _translate_function_call_done(
         self, raw_event: dict[str, Any]
     ) -> OrchestratorEvent | None:
-        # Non-consuming peeks preserve the legacy ``.get()`` semantics
-        # of ``_pending_calls`` / ``_pending_args``; entries clear only
-        # via the mixin's ``clear_pending_calls`` (e.g., reconnect).
-        call_id = raw_event.get("call_id", "")
-        args_str = (
-            raw_event.get("arguments")
-            or self.peek_args(call_id)
-            or "{}"
-        )
-        name = self.peek_name(call_id) or raw_event.get("name", "")
-        try:
-            tool_input = json.loads(args_str) if args_str else {}
-        except Exception:
-            tool_input = {}
-        if call_id and name:
-            return ToolUseStart(
-                tool_call_id=call_id,
-                tool_name=name,
-                tool_input=tool_input,
-            )
-        return None
+        # Resolution (and the args decode) is shared with the session's
+        # tool executor via ``ToolCallAccumulator.resolve_done_call``.
+        return self.resolve_done_call(raw_event)
 
     def _translate_response_done(
         self, raw_event: dict[str, Any]
@@ -289,7 +301,7 @@ class OpenAIVoiceProvider(BaseVoiceProvider, ToolCallAccumulator):
                     "output": output,
                 },
             },
-            {"type": "response.create"},
+            RESPONSE_CREATE,
         ]
 
     def format_session_config(
@@ -312,9 +324,6 @@ class OpenAIVoiceProvider(BaseVoiceProvider, ToolCallAccumulator):
         architecture".  Schema verified against the ``session.created``
         echo from a live connection.
         """
-        transcription: dict[str, Any] = {"model": "whisper-1"}
-        if self._transcription_language:
-            transcription["language"] = self._transcription_language
         return {
             "type": "session.update",
             "session": {
@@ -326,12 +335,12 @@ class OpenAIVoiceProvider(BaseVoiceProvider, ToolCallAccumulator):
                 "output_modalities": ["audio"],
                 "audio": {
                     "input": {
-                        "format": {"type": "audio/pcm", "rate": 24000},
-                        "transcription": transcription,
+                        "format": _PCM_24K_FORMAT,
+                        "transcription": self._transcription_config,
                         "turn_detection": vad or DEFAULT_VAD,
                     },
                     "output": {
-                        "format": {"type": "audio/pcm", "rate": 24000},
+                        "format": _PCM_24K_FORMAT,
                         "voice": voice or self._voice,
                     },
                 },
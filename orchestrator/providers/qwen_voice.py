@@ -26,7 +26,6 @@ Differences from OpenAI:
 from __future__ import annotations
 
 import asyncio
-import json
 import logging
 import os
 import re
@@ -36,15 +35,16 @@ from typing import Any
 import websockets
 
 from orchestrator.providers.voice_base import (
+    RESPONSE_CREATE,
     BaseVoiceProvider,
     ToolCallAccumulator,
+    VoiceEventQueue,
 )
 from orchestrator.types import (
     ErrorEvent,
     OrchestratorEvent,
     TextDelta,
     TextComplete,
-    ToolUseStart,
     TurnComplete,
     VoiceInterrupted,
 )
@@ -163,7 +163,7 @@ class QwenVoiceProvider(BaseVoiceProvider, ToolCallAccumulator):
         # Empty string = auto-detect (no `language` field sent to Qwen).
         # Otherwise an ISO-639-1 code recognised by qwen3-asr-flash.
         self._transcription_language = transcription_language
-        self._queue: asyncio.Queue[dict[str, Any]] = asyncio.Queue()
+        self._queue = VoiceEventQueue()
         self._current_transcript: str = ""
         # Tracks whether a ``response.created`` has fired without a
         # matching ``response.done``.  Sending ``response.create`` while
@@ -208,7 +208,7 @@ class QwenVoiceProvider(BaseVoiceProvider, ToolCallAccumulator):
     # --- ingestion --------------------------------------------------------
 
     async def inject_event(self, raw_event: dict[str, Any]) -> None:
-        await self._queue.put(raw_event)
+        self._queue.offer(raw_event)
 
     async def inject_audio(self, pcm_b64: str, sample_rate: int) -> None:
         """Frontend mic chunk → backend → relayed to Qwen via append.
@@ -238,7 +238,7 @@ class QwenVoiceProvider(BaseVoiceProvider, ToolCallAccumulator):
         self._current_transcript = ""
         while True:
             try:
-                event = await asyncio.wait_for(self._queue.get(), timeout=30.0)
+                event = await self._queue.next_event(timeout=30.0)
             except asyncio.TimeoutError:
                 yield ErrorEvent(error="voice_timeout", detail="No event received within 30s")
                 return
@@ -299,25 +299,9 @@ class QwenVoiceProvider(BaseVoiceProvider, ToolCallAccumulator):
     def _translate_function_call_done(
         self, raw_event: dict[str, Any]
     ) -> OrchestratorEvent | None:
-        # Non-consuming peeks preserve legacy ``.get()`` semantics.
-        call_id = raw_event.get("call_id", "")
-        args_str = (
-            raw_event.get("arguments")
-            or self.peek_args(call_id)
-            or "{}"
-        )
-        name = self.peek_name(call_id) or raw_event.get("name", "")
-        try:
-            tool_input = json.loads(args_str) if args_str else {}
-        except Exception:
-            tool_input = {}
-        if call_id and name:
-            return ToolUseStart(
-                tool_call_id=call_id,
-                tool_name=name,
-                tool_input=tool_input,
-            )
-        return None
+        # Resolution (and the args decode) is shared with the session's
+        # tool executor via ``ToolCallAccumulator.resolve_done_call``.
+        return self.resolve_done_call(raw_event)
 
     def _translate_response_done(
         self, raw_event: dict[str, Any]
@@ -392,7 +376,7 @@ class QwenVoiceProvider(BaseVoiceProvider, ToolCallAccumulator):
                     "output": _sanitize_for_qwen(output),
                 },
             },
-            {"type": "response.create"},
+            RESPONSE_CREATE,
         ]
 
     def format_session_config(
@@ -730,7 +714,7 @@ class QwenVoiceProvider(BaseVoiceProvider, ToolCallAccumulator):
         """
         return [
             {"type": "input_audio_buffer.commit"},
-            {"type": "response.create"},
+            RESPONSE_CREATE,
         ]
 
     def manual_vad_safety_commit_frames(self) -> list[dict[str, Any]]:
@@ -26,13 +26,25 @@ one of these hooks on ``QwenVoiceProvider``.
 
 from __future__ import annotations
 
+import asyncio
+import logging
 from abc import ABC, abstractmethod
+from collections import deque
 from collections.abc import AsyncIterator
 from typing import Any
 
-from orchestrator.types import OrchestratorEvent
+import orjson
+
+from orchestrator.types import OrchestratorEvent, ToolUseStart
 from orchestrator.voice_errors import VoiceError
 
+logger = logging.getLogger(__name__)
+
+# ``response.create`` carries no per-call data, so the OpenAI-shaped
+# providers hand out this one instance. Commands are only serialized and
+# sent downstream — never mutated.
+RESPONSE_CREATE: dict[str, Any] = {"type": "response.create"}
+
 
 class BaseVoiceProvider(ABC):
     """Provider-agnostic contract for realtime voice backends.
@@ -407,6 +419,96 @@ class BaseVoiceProvider(ABC):
         return "server_first"
 
 
+class VoiceEventQueue:
+    """Bounded buffer between ``inject_event`` and ``create_message``.
+
+    Mirrored provider events are injected whether or not an agent loop is
+    draining the queue, so it has to be bounded — transcript deltas alone
+    arrive at tens of Hz. :meth:`offer` never blocks the relay: when the
+    queue is full a new transcript delta is dropped (cosmetic, and the
+    ``*.done`` event carries the full text), anything else evicts the
+    oldest queued transcript delta, falling back to the oldest event of
+    any type only when no delta is queued.
+
+    Owns its deque (rather than subclassing ``asyncio.Queue``) so the
+    eviction policy can remove from the middle without touching another
+    class's internals; a single consumer waits in :meth:`next_event`.
+    """
+
+    MAX_SIZE = 1024
+    DROPPABLE_TYPES = frozenset({
+        "response.output_audio_transcript.delta",
+        "response.audio_transcript.delta",
+    })
+
+    def __init__(self, maxsize: int = MAX_SIZE) -> None:
+        self.maxsize = maxsize
+        self.dropped = 0
+        self._items: deque[dict[str, Any]] = deque()
+        self._nonempty = asyncio.Event()
+
+    def qsize(self) -> int:
+        return len(self._items)
+
+    def empty(self) -> bool:
+        return not self._items
+
+    def full(self) -> bool:
+        return len(self._items) >= self.maxsize
+
+    def get_nowait(self) -> dict[str, Any]:
+        """Pop the oldest event; raises ``asyncio.QueueEmpty`` when empty."""
+        if not self._items:
+            raise asyncio.QueueEmpty
+        return self._items.popleft()
+
+    def offer(self, raw_event: dict[str, Any]) -> None:
+        """Enqueue ``raw_event`` without blocking, applying the drop policy."""
+        if self.full():
+            if self.dropped == 0:
+                logger.warning(
+                    "Voice event queue full (%d); dropping events until drained",
+                    self.maxsize,
+                )
+            self.dropped += 1
+            if raw_event.get("type") in self.DROPPABLE_TYPES:
+                return
+            self._evict_one()
+        elif self.dropped and len(self._items) < self.maxsize // 2:
+            logger.info("Voice event queue recovered after %d drops", self.dropped)
+            self.dropped = 0
+        self._items.append(raw_event)
+        self._nonempty.set()
+
+    def _evict_one(self) -> None:
+        """Make room for a non-droppable event.
+
+        Evicts the oldest queued transcript delta; only when none is queued
+        does the oldest event of any type go (e.g. a ``response.done`` or a
+        tool-call ``*.done``), which is logged since it can stall a turn.
+        """
+        for i, queued in enumerate(self._items):
+            if queued.get("type") in self.DROPPABLE_TYPES:
+                del self._items[i]
+                return
+        evicted = self._items.popleft()
+        logger.warning(
+            "Voice event queue full with no transcript deltas; evicted %s",
+            evicted.get("type"),
+        )
+
+    async def next_event(self, timeout: float) -> dict[str, Any]:
+        """Return the next event, waiting up to ``timeout`` seconds.
+
+        Buffered events are taken without arming a ``wait_for`` timer;
+        raises ``asyncio.TimeoutError`` when nothing arrives in time.
+        """
+        if not self._items:
+            self._nonempty.clear()
+            await asyncio.wait_for(self._nonempty.wait(), timeout=timeout)
+        return self._items.popleft()
+
+
 class ToolCallAccumulator:
     """Mixin: tracks in-flight tool calls (id → name + accumulated args).
 
@@ -432,6 +534,11 @@ class ToolCallAccumulator:
     - ``peek_name(call_id) -> str`` — non-consuming read; useful when
       the same translator both reads the name AND keeps the call alive
       for a later ``format_tool_result`` (Gemini pattern).
+    - ``parse_call_args(call_id, args_str) -> dict`` — decode a call's
+      final args JSON once. The session's tool executor and the
+      provider's translator both see ``function_call_arguments.done``;
+      whichever gets there first parses and stashes the dict, the other
+      takes it (provided it resolved the same args string).
     - ``clear_pending_calls()`` — drop everything (called on reconnect
       teardown so a half-finished call can't bleed across sessions).
 
@@ -440,11 +547,20 @@ class ToolCallAccumulator:
     the mixin never imports anything provider-specific.
     """
 
+    # Finished calls are only peeked (the session and the translator both
+    # read them), so nothing pops them on the OpenAI/Qwen path. Bound the
+    # bookkeeping instead: registering beyond this evicts the oldest call.
+    MAX_TRACKED_CALLS = 64
+
     def __init__(self) -> None:
         # id → tool name (set on first announcement, popped at result).
         self._pending_call_names: dict[str, str] = {}
-        # id → accumulated args JSON (populated by ``accumulate_args``).
-        self._pending_call_args: dict[str, str] = {}
+        # id → streamed args JSON chunks (populated by ``accumulate_args``).
+        # Kept as a list and joined on read: ``str +=`` on a dict value
+        # copies the whole buffer per delta, quadratic in the args size.
+        self._pending_call_args: dict[str, list[str]] = {}
+        # id → (args JSON, decoded dict) awaiting the second consumer.
+        self._parsed_call_args: dict[str, tuple[str, dict[str, Any]]] = {}
 
     def register_call(self, call_id: str, name: str) -> None:
         """Record a newly-announced tool call. Re-registering with the
@@ -454,9 +570,14 @@ class ToolCallAccumulator:
         if not call_id or not name:
             return
         self._pending_call_names[call_id] = name
+        while len(self._pending_call_names) > self.MAX_TRACKED_CALLS:
+            oldest = next(iter(self._pending_call_names))
+            del self._pending_call_names[oldest]
+            self._pending_call_args.pop(oldest, None)
+            self._parsed_call_args.pop(oldest, None)
         # Reset args buffer for this call so a stale prior buffer can't
         # leak forward (defensive — call_ids should be unique).
-        self._pending_call_args[call_id] = ""
+        self._pending_call_args[call_id] = []
 
     def accumulate_args(self, call_id: str, delta: str) -> None:
         """Append a streamed args-delta to the call's buffer.
@@ -466,7 +587,7 @@ class ToolCallAccumulator:
         kept the loop alive on out-of-order frames.
         """
         if call_id in self._pending_call_args:
-            self._pending_call_args[call_id] += delta
+            self._pending_call_args[call_id].append(delta)
 
     def pop_name(self, call_id: str) -> str:
         """Read AND remove the tool name. Returns "" if absent."""
@@ -474,7 +595,7 @@ class ToolCallAccumulator:
 
     def pop_args(self, call_id: str) -> str:
         """Read AND remove the accumulated args JSON. Returns "" if absent."""
-        return self._pending_call_args.pop(call_id, "")
+        return "".join(self._pending_call_args.pop(call_id, ()))
 
     def peek_name(self, call_id: str) -> str:
         """Read the tool name WITHOUT removing it. Returns "" if absent."""
@@ -482,7 +603,53 @@ class ToolCallAccumulator:
 
     def peek_args(self, call_id: str) -> str:
         """Read the accumulated args WITHOUT removing it. Returns "" if absent."""
-        return self._pending_call_args.get(call_id, "")
+        chunks = self._pending_call_args.get(call_id)
+        if not chunks:
+            return ""
+        if len(chunks) > 1:
+            # Collapse so repeated peeks of a finished call don't re-join.
+            chunks[:] = ["".join(chunks)]
+        return chunks[0]
+
+    def parse_call_args(self, call_id: str, args_str: str) -> dict[str, Any]:
+        """Decode ``args_str`` for ``call_id``, sharing the result between
+        the two consumers of the same done event. Malformed JSON yields
+        ``{}`` (legacy contract)."""
+        cached = self._parsed_call_args.pop(call_id, None)
+        if cached is not None and cached[0] == args_str:
+            return cached[1]
+        try:
+            tool_input = orjson.loads(args_str) if args_str else {}
+        except Exception:
+            tool_input = {}
+        if call_id:
+            self._parsed_call_args[call_id] = (args_str, tool_input)
+            if len(self._parsed_call_args) > self.MAX_TRACKED_CALLS:
+                del self._parsed_call_args[next(iter(self._parsed_call_args))]
+        return tool_input
+
+    def resolve_done_call(self, raw_event: dict[str, Any]) -> ToolUseStart | None:
+        """Resolve a ``function_call_arguments.done`` event into the call.
+
+        The one place name/args precedence lives: the event's ``name``,
+        else the registered name; the streamed args buffer, else the
+        event's ``arguments`` (OpenAI may send those empty when the args
+        were streamed). Non-consuming — entries clear via
+        :meth:`clear_pending_calls` or ``MAX_TRACKED_CALLS`` eviction.
+        Both the session's tool executor and the provider's translator
+        call this for the same event; the decoded dict is shared via
+        :meth:`parse_call_args`.
+        """
+        call_id = raw_event.get("call_id", "")
+        name = raw_event.get("name", "") or self.peek_name(call_id)
+        if not (call_id and name):
+            return None
+        args_str = self.peek_args(call_id) or raw_event.get("arguments", "") or "{}"
+        return ToolUseStart(
+            tool_call_id=call_id,
+            tool_name=name,
+            tool_input=self.parse_call_args(call_id, args_str),
+        )
 
     def clear_pending_calls(self) -> None:
         """Drop all in-flight call state. Call from reconnect / restart
@@ -490,3 +657,4 @@ class ToolCallAccumulator:
         """
         self._pending_call_names.clear()
         self._pending_call_args.clear()
+        self._parsed_call_args.clear()
@@ -418,6 +418,59 @@ class BackgroundAgentRunner:
         if len(record.events) > self._peek_buffer_size:
             record.events.popleft()
 
+    # Per-event-kind recorders for :meth:`_drive`, dispatched on the exact
+    # event class (one dict lookup instead of an isinstance chain).
+
+    def _on_text_delta(self, record: _TurnRecord, event: TextDelta) -> None:
+        self._buffer(record, "text_delta", {"text": event.text})
+
+    def _on_text_complete(self, record: _TurnRecord, event: TextComplete) -> None:
+        record.last_assistant_text = event.text
+        self._buffer(record, "text", {"text": event.text})
+
+    def _on_tool_use(self, record: _TurnRecord, event: ToolUse) -> None:
+        self._buffer(record, "tool_use", {
+            "tool_use_id": event.tool_use_id,
+            "tool_name": event.tool_name,
+            "tool_input": event.tool_input,
+        })
+
+    def _on_tool_result(self, record: _TurnRecord, event: ToolResult) -> None:
+        self._buffer(record, "tool_result", {
+            "tool_use_id": event.tool_use_id,
+            "output_excerpt": _excerpt(event.output, 800),
+            "is_error": event.is_error,
+        })
+
+    def _on_permission_request(self, record: _TurnRecord, event: PermissionRequest) -> None:
+        self._buffer(record, "permission_request", {
+            "request_id": event.request_id,
+            "tool_name": event.tool_name,
+            "tool_input": event.tool_input,
+        })
+
+    def _on_permission_resolved(self, record: _TurnRecord, event: PermissionResolved) -> None:
+        self._buffer(record, "permission_resolved", {
+            "request_id": event.request_id,
+            "decision": event.decision,
+            "responder": event.responder,
+            "message": event.message,
+        })
+
+    def _on_turn_complete(self, record: _TurnRecord, event: TurnComplete) -> None:
+        record.cost = event.cost or 0.0
+        record.turns = event.num_turns or 0
+
+    _EVENT_HANDLERS: dict[type, Callable[["BackgroundAgentRunner", _TurnRecord, Any], None]] = {
+        TextDelta: _on_text_delta,
+        TextComplete: _on_text_complete,
+        ToolUse: _on_tool_use,
+        ToolResult: _on_tool_result,
+        PermissionRequest: _on_permission_request,
+        PermissionResolved: _on_permission_resolved,
+        TurnComplete: _on_turn_complete,
+    }
+
     async def _drive(
         self,
         record: _TurnRecord,
@@ -438,44 +491,21 @@ class BackgroundAgentRunner:
             return
 
         async def _consume() -> None:
-            async for event in self._pool.send(record.session_id, message):
-                # Track pending permissions for the prompt-builder snapshot
-                if hasattr(sm, "pending_permission_ids"):
-                    record.pending_permission_ids = tuple(sm.pending_permission_ids())
-
-                if isinstance(event, TextDelta):
-                    self._buffer(record, "text_delta", {"text": event.text})
-                elif isinstance(event, TextComplete):
-                    record.last_assistant_text = event.text
-                    self._buffer(record, "text", {"text": event.text})
-                elif isinstance(event, ToolUse):
-                    self._buffer(record, "tool_use", {
-                        "tool_use_id": event.tool_use_id,
-                        "tool_name": event.tool_name,
-                        "tool_input": event.tool_input,
-                    })
-                elif isinstance(event, ToolResult):
-                    self._buffer(record, "tool_result", {
-                        "tool_use_id": event.tool_use_id,
-                        "output_excerpt": _excerpt(event.output, 800),
-                        "is_error": event.is_error,
-                    })
-                elif isinstance(event, PermissionRequest):
-                    self._buffer(record, "permission_request", {
-                        "request_id": event.request_id,
-                        "tool_name": event.tool_name,
-                        "tool_input": event.tool_input,
-                    })
-                elif isinstance(event, PermissionResolved):
-                    self._buffer(record, "permission_resolved", {
-                        "request_id": event.request_id,
-                        "decision": event.decision,
-                        "responder": event.responder,
-                        "message": event.message,
-                    })
-                elif isinstance(event, TurnComplete):
-                    record.cost = event.cost or 0.0
-                    record.turns = event.num_turns or 0
+            # Close the stream explicitly on any exit (timeout, cancel, error)
+            # so pool.send releases the per-session lock now rather than
+            # whenever the abandoned generator gets finalised.
+            stream = self._pool.send(record.session_id, message)
+            try:
+                async for event in stream:
+                    # Track pending permissions for the prompt-builder snapshot
+                    if hasattr(sm, "pending_permission_ids"):
+                        record.pending_permission_ids = tuple(sm.pending_permission_ids())
+
+                    handler = self._EVENT_HANDLERS.get(type(event))
+                    if handler is not None:
+                        handler(self, record, event)
+            finally:
+                await stream.aclose()
 
         async def _consume_with_retry() -> None:
             """Run _consume; if it raises TurnAbandoned, interrupt the SDK
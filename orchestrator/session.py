@@ -13,14 +13,15 @@ from __future__ import annotations
 
 import asyncio
 import enum
-import json
+import io
 import logging
 import uuid
 from collections.abc import AsyncIterator, Awaitable, Callable
-from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any
 
+import orjson
+
 from utils.paths import get_sessions_dir
 
 from orchestrator.agent import OrchestratorAgent
@@ -29,11 +30,15 @@ from orchestrator.config import (
     AVAILABLE_MODELS,
     OrchestratorConfig,
     Provider,
+    _infer_model_info,
     get_model_info,
 )
-from orchestrator.persistence import HistoryLoader, HistoryWriter
-from orchestrator.providers.voice_base import BaseVoiceProvider
+from orchestrator.persistence import HistoryLoader, HistoryWriter, utc_timestamp
+from orchestrator.prompt import VOICE_PROMPT_BUDGETS, build_system_prompt
+from orchestrator.providers import voice_registry
+from orchestrator.providers.voice_base import BaseVoiceProvider, ToolCallAccumulator
 from orchestrator.voice_persister import VoicePersister
+from orchestrator.voice_relay import VoiceRelay
 from orchestrator.voice_timeouts import VoiceTimeouts
 from orchestrator.audio_recorder import AudioRecorder, is_recording_enabled
 # Provider classes are imported lazily inside the methods that need them so
@@ -46,14 +51,24 @@ from orchestrator import summary_cache
 from orchestrator.token_budget import (
     RECENT_VERBATIM_TOKENS,
     estimate_message_tokens,
+    estimate_tokens,
     split_by_token_budget,
     summary_target_word_range,
     truncate_tool_results,
 )
 from orchestrator.tools import registry
+# Tools register themselves on import; load them once here rather than on
+# every session start.
+import orchestrator.tools.agent_sessions  # noqa: F401
+import orchestrator.tools.assistant_config  # noqa: F401
+import orchestrator.tools.audio_playback  # noqa: F401
+import orchestrator.tools.files  # noqa: F401
+import orchestrator.tools.search  # noqa: F401
+import orchestrator.tools.voice_control  # noqa: F401
 from orchestrator.types import (
     OrchestratorEvent,
     TextComplete,
+    TextDelta,
     ToolResultEvent,
     ToolUseStart,
     TurnComplete,
@@ -119,6 +134,39 @@ _VALID_VOICE_TRANSITIONS: dict[VoiceLifecycle, set[VoiceLifecycle]] = {
 # ``orchestrator.voice_timeouts.VoiceTimeouts``. Sessions read from
 # ``self._voice_timeouts``; tests can override per-instance.
 
+# Top-level (OpenAI/Qwen) voice event types process_voice_event does any
+# work for beyond ``inject_event``; everything else returns right away.
+_VOICE_TOOL_DONE = "response.function_call_arguments.done"
+_HANDLED_VOICE_EVENT_TYPES = VoicePersister.HANDLED_TYPES | {_VOICE_TOOL_DONE}
+
+
+def _clip_stripped(text: str, limit: int) -> str:
+    """``text.strip()[:limit]`` without copying the whole (possibly huge)
+    string first — slice with headroom for leading whitespace, then strip."""
+    return text[: limit + 512].strip()[:limit]
+
+
+def _resolve_legacy_done_call(
+    provider: Any, event: dict[str, Any]
+) -> ToolUseStart | None:
+    """Resolve a ``function_call_arguments.done`` event against a provider
+    that predates ``ToolCallAccumulator`` (the legacy ``pending_calls`` /
+    ``_pending_args`` dicts — only test fakes still use these)."""
+    call_id = event.get("call_id", "")
+    name = event.get("name", "") or provider.pending_calls.get(call_id, "")
+    if not (call_id and name):
+        return None
+    pending_args_dict = (
+        getattr(provider, "_pending_call_args", None)
+        or getattr(provider, "_pending_args", {})
+    )
+    args_str = pending_args_dict.get(call_id) or event.get("arguments", "") or "{}"
+    try:
+        tool_input = orjson.loads(args_str) if args_str else {}
+    except Exception:
+        tool_input = {}
+    return ToolUseStart(tool_call_id=call_id, tool_name=name, tool_input=tool_input)
+
 
 def _render_notifications(notes: list[Notification]) -> str:
     """Render a batch of background-agent notifications as a status block.
@@ -231,6 +279,11 @@ class OrchestratorSession:
         self._voice_endpoint: str | None = voice_endpoint
         self._voice_relay = None  # Set lazily for websocket providers
         self._history_summary: str | None = None
+        # (jsonl (mtime_ns, size), (recent, summary)) from the last
+        # _build_history_for_prompt; reused while the JSONL is unchanged.
+        self._history_prompt_cache: (
+            tuple[tuple[int, int], tuple[list[dict[str, Any]], str | None]] | None
+        ) = None
         self._audio_recorder: AudioRecorder | None = None  # Set in start() if recording enabled
 
         # Voice lifecycle state machine. ``IDLE`` for both text and
@@ -494,30 +547,19 @@ class OrchestratorSession:
         which equals the original session_id when resuming so we append to
         the same history file.
         """
-        # Import tools to ensure they're registered
-        import orchestrator.tools.agent_sessions  # noqa: F401
-        import orchestrator.tools.assistant_config  # noqa: F401
-        import orchestrator.tools.audio_playback  # noqa: F401
-        import orchestrator.tools.files  # noqa: F401
-        import orchestrator.tools.search  # noqa: F401
-        import orchestrator.tools.voice_control  # noqa: F401
-
         if self._voice:
-            from orchestrator.providers.voice_registry import (
-                instantiate_provider,
-                resolve_voice_target,
-            )
-            provider_id, model_entry, voice_name, language = resolve_voice_target(
+            target = voice_registry.resolve_voice_target(
                 self._voice_provider_id,
                 self._voice_model_id,
                 self._voice_name,
                 self._voice_transcription_language,
             )
+            provider_id, model_entry, voice_name, language = target
             self._voice_provider_id = provider_id
             self._voice_model_id = model_entry["id"]
             self._voice_name = voice_name
             self._voice_transcription_language = language
-            self._voice_provider = instantiate_provider(
+            self._voice_provider = voice_registry.instantiate_provider(
                 provider_id, model_entry["id"], voice_name, language,
                 endpoint=self._voice_endpoint,
             )
@@ -537,26 +579,27 @@ class OrchestratorSession:
             context=self._context,
         )
 
-        self._jsonl_path = self._get_jsonl_path()
+        # Disk work runs off the event loop: the sessions dir may sit on a
+        # slow mount, and a resumed history can be a multi-MB JSONL.
+        self._jsonl_path = await asyncio.to_thread(self._get_jsonl_path)
         self._writer = HistoryWriter(self._jsonl_path)
 
         # If resuming, load history from the existing JSONL.
         # For voice mode the summary is built fresh in get_session_update() on
         # every (re)connect, so we don't precompute it here.
-        if self._resume_id and self._jsonl_path.is_file():
+        if self._resume_id and await asyncio.to_thread(self._jsonl_path.is_file):
             loader = HistoryLoader(self._jsonl_path)
-            history = loader.load()
+            history = await asyncio.to_thread(loader.load)
             self._agent.history = history
         else:
             # New session — write metadata as first line
-            self._jsonl_path.parent.mkdir(parents=True, exist_ok=True)
             meta: dict[str, Any] = {
                 "type": "orchestrator_meta",
                 "orchestrator": True,
                 "session_id": self.jsonl_id,
                 "model": self._config.model,
                 "provider": self._config.provider.value,
-                "timestamp": datetime.now(timezone.utc).isoformat(),
+                "timestamp": utc_timestamp(),
             }
             if self._voice and self._voice_provider is not None:
                 meta["voice"] = True
@@ -649,7 +692,7 @@ class OrchestratorSession:
                 "type": "model_switch",
                 "model": model_id,
                 "provider": self._config.provider.value,
-                "timestamp": datetime.now(timezone.utc).isoformat(),
+                "timestamp": utc_timestamp(),
             })
 
         logger.info("Switched to model: %s (%s)", model_id, self._config.provider.value)
@@ -681,8 +724,6 @@ class OrchestratorSession:
         if not self._voice or provider is None:
             return None
 
-        from orchestrator.prompt import build_system_prompt
-
         recent_messages, history_summary = await self._build_history_for_prompt()
 
         system = build_system_prompt(
@@ -691,6 +732,7 @@ class OrchestratorSession:
             recent_messages=recent_messages,
             history_summary=history_summary,
             voice_provider_id=provider.provider_name,
+            budgets=VOICE_PROMPT_BUDGETS,
         )
         tools = registry.get_openai_definitions()
         return provider.get_session_update_payload(system, tools)
@@ -708,12 +750,27 @@ class OrchestratorSession:
         synchronously (so the caller still gets a correct prompt) and
         write the result back so the next call is fast.
 
+        The whole result is also memoized on the JSONL's (mtime_ns, size),
+        so a voice reconnect with no new turns skips the reload, clip and
+        split entirely.
+
         Returns (recent_verbatim_messages, summary_or_none).
         """
-        if self._jsonl_path is None or not self._jsonl_path.is_file():
+        await self._flush_history()
+        if self._jsonl_path is None:
             return [], None
-
-        history = HistoryLoader(self._jsonl_path).load()
+        try:
+            st = self._jsonl_path.stat()
+        except OSError:
+            return [], None
+        stamp = (st.st_mtime_ns, st.st_size)
+        cached_prompt = self._history_prompt_cache
+        if cached_prompt is not None and cached_prompt[0] == stamp:
+            recent, summary = cached_prompt[1]
+            self._history_summary = summary
+            return list(recent), summary
+
+        history = await asyncio.to_thread(HistoryLoader(self._jsonl_path).load)
         if not history:
             return [], None
 
@@ -799,8 +856,16 @@ class OrchestratorSession:
                         )
 
         self._history_summary = summary
+        # A failed summarization stays uncached so the next call retries.
+        if summary or not older:
+            self._history_prompt_cache = (stamp, (list(recent), summary))
         return recent, summary
 
+    async def _flush_history(self) -> None:
+        """Push buffered JSONL appends to disk before the file is read."""
+        if self._writer is not None:
+            await self._writer.aflush()
+
     async def refresh_summary_cache_if_stale(self) -> bool:
         """Compute and persist the history summary for the current JSONL
         state, but only if the cache is missing or stale.
@@ -812,13 +877,14 @@ class OrchestratorSession:
         - Session stop (write the summary the next reopen will need)
         - Background safety nets (boot warmup, history reopen)
         """
+        await self._flush_history()
         if self._jsonl_path is None or not self._jsonl_path.is_file():
             return False
         if summary_cache.is_fresh(self._jsonl_path):
             return False
 
         try:
-            history = HistoryLoader(self._jsonl_path).load()
+            history = await asyncio.to_thread(HistoryLoader(self._jsonl_path).load)
         except Exception:  # noqa: BLE001
             logger.exception("summary refresh: history load failed")
             return False
@@ -903,7 +969,6 @@ class OrchestratorSession:
                 return
             self._set_voice_state_unlocked(VoiceLifecycle.STARTING)
 
-        from orchestrator.voice_relay import VoiceRelay
         if session_update is None:
             session_update = await self.get_session_update()
         if session_update is None:
@@ -1242,21 +1307,18 @@ class OrchestratorSession:
                 )
 
         # Instantiate a fresh provider mirroring the start() path.
-        from orchestrator.providers.voice_registry import (
-            instantiate_provider,
-            resolve_voice_target,
-        )
-        provider_id, model_entry, voice_name_resolved, language = resolve_voice_target(
+        target = voice_registry.resolve_voice_target(
             self._voice_provider_id,
             self._voice_model_id,
             self._voice_name,
             self._voice_transcription_language,
         )
+        provider_id, model_entry, voice_name_resolved, language = target
         self._voice_provider_id = provider_id
         self._voice_model_id = model_entry["id"]
         self._voice_name = voice_name_resolved
         self._voice_transcription_language = language
-        self._voice_provider = instantiate_provider(
+        self._voice_provider = voice_registry.instantiate_provider(
             provider_id, model_entry["id"], voice_name_resolved, language,
             endpoint=self._voice_endpoint,
         )
@@ -1476,6 +1538,12 @@ class OrchestratorSession:
         if inject:
             await provider.inject_event(event)
 
+        # Most mirrored events (audio deltas, item bookkeeping) need
+        # nothing else. Gemini events carry no top-level type.
+        event_type = event.get("type", "")
+        if event_type and event_type not in _HANDLED_VOICE_EVENT_TYPES:
+            return commands
+
         # Delegate JSONL persistence to the per-session persister.
         # The persister owns the staged transcript buffers and the
         # ``is_injecting`` gating; the session only sees the result
@@ -1484,8 +1552,6 @@ class OrchestratorSession:
         if persister is not None:
             persister.handle_event(event, provider.provider_name)
 
-        event_type = event.get("type", "")
-
         # --- Gemini Live tool calls (camelCase shape) ------------------
         # Tool execution stays on the session because the registry needs
         # ``self._context``; the persister provides the canonical
@@ -1493,13 +1559,18 @@ class OrchestratorSession:
         if not event_type and provider.provider_name == "google":
             tool_call = event.get("toolCall")
             if isinstance(tool_call, dict):
-                for call in tool_call.get("functionCalls", []):
-                    call_id = call.get("id", "")
-                    name = call.get("name", "")
-                    args = call.get("args", {}) or {}
-                    if not (call_id and name):
-                        continue
-                    result = await registry.execute(name, args, self._context)
+                calls = [
+                    (call.get("id", ""), call.get("name", ""), call.get("args", {}) or {})
+                    for call in tool_call.get("functionCalls", [])
+                ]
+                calls = [c for c in calls if c[0] and c[1]]
+                # One toolCall can carry several independent calls; run them
+                # concurrently (``execute`` never raises — failures come back
+                # as error JSON), then persist + format in the model's order.
+                results = await asyncio.gather(
+                    *(registry.execute(name, args, self._context) for _, name, args in calls)
+                )
+                for (call_id, name, args), result in zip(calls, results):
                     if persister is not None:
                         persister.persist_tool_use_and_result(
                             call_id=call_id,
@@ -1518,42 +1589,23 @@ class OrchestratorSession:
             return commands
 
         # --- OpenAI / Qwen tool calls (top-level type) -----------------
-        if event_type == "response.function_call_arguments.done":
-            call_id = event.get("call_id", "")
-            name = event.get("name", "")
-
-            # Get name from pending_calls if not in event.
-            if not name and call_id in provider.pending_calls:
-                name = provider.pending_calls[call_id]
-
-            # Prefer accumulated streaming args over the done event's
-            # ``arguments`` field (OpenAI may send empty/missing
-            # arguments when args were streamed incrementally via delta
-            # events).
-            # Inc E renamed the mixin attribute. Fall through to the
-            # legacy name for any provider not migrated yet (test fakes).
-            pending_args_dict = (
-                getattr(provider, "_pending_call_args", None)
-                or getattr(provider, "_pending_args", {})
-            )
-            args_str = (
-                pending_args_dict.get(call_id)
-                or event.get("arguments", "")
-                or "{}"
-            )
-
-            try:
-                tool_input = json.loads(args_str) if args_str else {}
-            except Exception:
-                tool_input = {}
+        if event_type == _VOICE_TOOL_DONE:
+            # Mixin providers resolve name + args (and share the decoded
+            # dict with their own translator); test fakes take the legacy
+            # dict path.
+            if isinstance(provider, ToolCallAccumulator):
+                call = provider.resolve_done_call(event)
+            else:
+                call = _resolve_legacy_done_call(provider, event)
 
-            if call_id and name:
-                result = await registry.execute(name, tool_input, self._context)
+            if call is not None:
+                call_id = call.tool_call_id
+                result = await registry.execute(call.tool_name, call.tool_input, self._context)
                 if persister is not None:
                     persister.persist_tool_use_and_result(
                         call_id=call_id,
-                        tool_name=name,
-                        tool_input=tool_input,
+                        tool_name=call.tool_name,
+                        tool_input=call.tool_input,
                         output=result,
                     )
                 # Provider-specific command sequence to ship the result
@@ -1590,6 +1642,8 @@ class OrchestratorSession:
             pending = self._notifications.drain()
             if not prompt and not pending:
                 return  # racing wake; nothing to deliver
+            # One timestamp for everything this turn persists up front.
+            now = utc_timestamp()
             # Persist a JSONL line for each drained notification so the run
             # is replayable (ties back to the originating tool_use_id).
             for n in pending:
@@ -1605,7 +1659,7 @@ class OrchestratorSession:
                     "turns": n.turns,
                     "duration_seconds": n.duration_seconds,
                     "error": n.error,
-                    "timestamp": datetime.now(timezone.utc).isoformat(),
+                    "timestamp": now,
                 })
             # Build the actual prompt the LLM sees.  Notifications go FIRST
             # so the model reads them before anything the user typed.
@@ -1624,7 +1678,7 @@ class OrchestratorSession:
                 self._writer.append({
                     "type": "user",
                     "message": {"role": "user", "content": prompt},
-                    "timestamp": datetime.now(timezone.utc).isoformat(),
+                    "timestamp": now,
                 })
 
             async for event in self._run_agent(effective_prompt):
@@ -1669,6 +1723,7 @@ class OrchestratorSession:
         async with self._busy_lock:
             pending = self._notifications.drain()
             if pending:
+                now = utc_timestamp()
                 for n in pending:
                     self._writer.append({
                         "type": "background_notification",
@@ -1682,7 +1737,7 @@ class OrchestratorSession:
                         "turns": n.turns,
                         "duration_seconds": n.duration_seconds,
                         "error": n.error,
-                        "timestamp": datetime.now(timezone.utc).isoformat(),
+                        "timestamp": now,
                     })
                 rendered = _render_notifications(pending)
                 text_prompt = (rendered + "\n\n" + text_prompt) if text_prompt else rendered
@@ -1728,7 +1783,7 @@ class OrchestratorSession:
             },
             "source": "audio_input",
             "audio_format": audio_format,
-            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "timestamp": utc_timestamp(),
         })
 
         # If the session is in voice (WebRTC) mode, the agent's provider is
@@ -1755,41 +1810,64 @@ class OrchestratorSession:
         self,
         prompt: str | dict[str, Any],
     ) -> AsyncIterator[OrchestratorEvent]:
-        """Run the agent with text or audio input and persist events."""
-        # Collect assistant text for persistence; persist tool events as they arrive
-        assistant_text_parts: list[str] = []
-
-        async for event in self._agent.run(prompt):
-            if isinstance(event, TextComplete):
-                assistant_text_parts.append(event.text)
-            elif isinstance(event, ToolUseStart):
-                self._writer.append({
-                    "type": "tool_use",
-                    "tool_call_id": event.tool_call_id,
-                    "tool_name": event.tool_name,
-                    "tool_input": event.tool_input,
-                    "timestamp": datetime.now(timezone.utc).isoformat(),
-                })
-            elif isinstance(event, ToolResultEvent):
+        """Run the agent with text or audio input and persist events.
+
+        Events are buffered by the history writer; the turn's tail is
+        handed off as soon as the turn ends instead of waiting on the timer.
+        """
+        # Stream assistant text into one buffer for persistence (newline
+        # between TextCompletes); persist tool events as they arrive.
+        assistant_text = io.StringIO()
+        has_assistant_text = False
+
+        try:
+            async for event in self._agent.run(prompt):
+                # Event types are final dataclasses, so exact-type checks are
+                # safe; the per-token TextDelta needs no persistence and
+                # short-circuits first.
+                event_type = type(event)
+                if event_type is TextDelta:
+                    yield event
+                    continue
+                if event_type is TextComplete:
+                    if has_assistant_text:
+                        assistant_text.write("\n")
+                    assistant_text.write(event.text)
+                    has_assistant_text = True
+                elif event_type is ToolUseStart:
+                    self._writer.append({
+                        "type": "tool_use",
+                        "tool_call_id": event.tool_call_id,
+                        "tool_name": event.tool_name,
+                        "tool_input": event.tool_input,
+                        "timestamp": utc_timestamp(),
+                    })
+                elif event_type is ToolResultEvent:
+                    self._writer.append({
+                        "type": "tool_result",
+                        "tool_call_id": event.tool_call_id,
+                        "output": event.output,
+                        "is_error": event.is_error,
+                        "timestamp": utc_timestamp(),
+                    })
+                yield event
+
+            # Persist assistant text response
+            if has_assistant_text:
                 self._writer.append({
-                    "type": "tool_result",
-                    "tool_call_id": event.tool_call_id,
-                    "output": event.output,
-                    "is_error": event.is_error,
-                    "timestamp": datetime.now(timezone.utc).isoformat(),
+                    "type": "assistant",
+                    "message": {
+                        "role": "assistant",
+                        "content": assistant_text.getvalue(),
+                    },
+                    "timestamp": utc_timestamp(),
                 })
-            yield event
-
-        # Persist assistant text response
-        if assistant_text_parts:
-            self._writer.append({
-                "type": "assistant",
-                "message": {
-                    "role": "assistant",
-                    "content": "\n".join(assistant_text_parts),
-                },
-                "timestamp": datetime.now(timezone.utc).isoformat(),
-            })
+        finally:
+            # The turn boundary is a natural flush point: whatever the timer
+            # has not written yet goes to the writer thread right away (also
+            # on cancellation) without blocking the loop on the write.
+            if self._writer is not None:
+                self._writer.flush_in_background()
 
     async def compact(self) -> dict[str, int]:
         """Summarize and compress the conversation history.
@@ -1809,9 +1887,8 @@ class OrchestratorSession:
 
         # Rough token estimate: ~0.75 tokens per character
         def estimate_tokens(h: list) -> int:
-            import json as _json
             try:
-                return int(len(_json.dumps(h)) * 0.75)
+                return int(len(orjson.dumps(h)) * 0.75)
             except Exception:
                 return 0
 
@@ -1834,7 +1911,7 @@ class OrchestratorSession:
                     "type": "compact",
                     "trigger": "manual",
                     "summary": summary,
-                    "timestamp": datetime.now(timezone.utc).isoformat(),
+                    "timestamp": utc_timestamp(),
                 })
 
         tokens_after = estimate_tokens(self._agent.history)
@@ -1874,6 +1951,10 @@ class OrchestratorSession:
                 await self.end_voice(reason)
             except Exception:  # noqa: BLE001
                 logger.exception("end_voice failed during session stop")
+        # Write out whatever the history writer still has buffered and
+        # release its append fd.
+        if self._writer is not None:
+            await self._writer.aclose()
         # Spawn the cache-refresh as a detached task. We don't await
         # because the session is shutting down and the JSONL is already
         # written; the refresh just makes the next reopen faster.
@@ -1943,7 +2024,7 @@ class OrchestratorSession:
             content = msg.get("content", "")
             label = "USER" if role == "user" else "ASSISTANT"
             if isinstance(content, str):
-                lines.append(f"{label}: {content.strip()[:4000]}")
+                lines.append(f"{label}: {_clip_stripped(content, 4000)}")
             elif isinstance(content, list):
                 parts: list[str] = []
                 for block in content:
@@ -1951,7 +2032,7 @@ class OrchestratorSession:
                         continue
                     btype = block.get("type")
                     if btype == "text":
-                        parts.append(block.get("text", "").strip()[:4000])
+                        parts.append(_clip_stripped(block.get("text", ""), 4000))
                     elif btype == "tool_use":
                         parts.append(f"[tool: {block.get('name', '?')}]")
                     elif btype == "tool_result":
@@ -1970,11 +2051,9 @@ class OrchestratorSession:
         if target_words is None:
             # Fallback when called without a pre-computed range (e.g. the
             # manual /compact path).  Compute on the fly from the transcript.
-            from orchestrator.token_budget import (
-                estimate_tokens as _est,
-                summary_target_word_range as _range,
+            target_words = summary_target_word_range(
+                len(messages), estimate_tokens(transcript)
             )
-            target_words = _range(len(messages), _est(transcript))
 
         min_words, max_words = target_words
         length_hint = (
@@ -2068,8 +2147,8 @@ class OrchestratorSession:
         model, provider = self._resolve_summarizer_model()
         try:
             if provider == Provider.OPENAI:
-                import openai
-                client = openai.AsyncOpenAI()
+                from orchestrator.providers.openai_text import get_shared_client
+                client = get_shared_client()
                 # GPT-5 family and reasoning models (o1/o3/o4) reject custom
                 # ``temperature``; everything else takes it.  Both
                 # ``max_tokens`` and ``max_completion_tokens`` are omitted on
@@ -2104,8 +2183,8 @@ class OrchestratorSession:
                     )
                 return text
             else:
-                import anthropic
-                client = anthropic.AsyncAnthropic()
+                from orchestrator.providers.anthropic import get_shared_client
+                client = get_shared_client()
                 # Anthropic requires ``max_tokens``; pass the largest value
                 # the SDK will accept so it doesn't cap us short.  Sonnet 4.6
                 # supports up to 64k output tokens.
@@ -2135,8 +2214,6 @@ class OrchestratorSession:
         unset, and ultimately to the active text-mode model when the chosen
         summarizer model id can't be classified at all.
         """
-        from orchestrator.config import _infer_model_info, get_model_info
-
         # Prefer the dedicated summarizer model from the live config file.
         configured: str | None = None
         try:
@@ -2155,8 +2232,7 @@ class OrchestratorSession:
     def _get_jsonl_path(self) -> Path:
         """Get the JSONL file path for this session.
 
-        Uses context/ directly for portability.
+        Uses context/ directly for portability. The directory is created
+        by :class:`HistoryWriter` on the first write, not here.
         """
-        sessions_dir = get_sessions_dir()
-        sessions_dir.mkdir(parents=True, exist_ok=True)
-        return sessions_dir / f"{self.jsonl_id}.jsonl"
+        return get_sessions_dir() / f"{self.jsonl_id}.jsonl"
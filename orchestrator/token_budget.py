@@ -7,6 +7,7 @@ is the safe direction when we're fitting into a context window.
 
 from __future__ import annotations
 
+import re
 from typing import Any
 
 # gpt-realtime context window
@@ -40,6 +41,30 @@ TOOL_RESULT_TRUNCATE_SUFFIX = (
 )
 
 
+# Lines that carry no information worth spending budget on: blanks, ASCII
+# rules/banners, and progress counters like "[3/10]" or "Progress: 40%".
+_LOW_SIGNAL_LINE_RE = re.compile(
+    r"^\s*$|^\s*[=\-_*#~]{3,}\s*$|^\s*\[\d+/\d+\]|^\s*Progress: "
+)
+
+
+def tool_result_text(result_content: Any) -> str:
+    """Flatten a tool_result ``content`` (str or list of blocks) to text.
+
+    Builds a list rather than feeding a generator to ``str.join`` — join
+    materialises generators into a sequence first anyway, so the list
+    comprehension skips that extra pass.
+    """
+    if type(result_content) is str:
+        return result_content
+    if isinstance(result_content, list):
+        return " ".join([
+            b.get("text", "") for b in result_content
+            if type(b) is dict and b.get("type") == "text"
+        ])
+    return str(result_content)
+
+
 def estimate_tokens(text: str) -> int:
     """Conservative char-based token estimate (~3.5 chars/token).
 
@@ -71,21 +96,68 @@ def estimate_message_tokens(msg: dict[str, Any]) -> int:
                     input_str = str(block.get("input", ""))
                 total += estimate_tokens(block.get("name", "")) + estimate_tokens(input_str) + 8
             elif btype == "tool_result":
-                result_content = block.get("content", "")
-                if isinstance(result_content, list):
-                    result_content = " ".join(
-                        b.get("text", "") for b in result_content
-                        if isinstance(b, dict) and b.get("type") == "text"
-                    )
-                total += estimate_tokens(str(result_content)) + 4
+                total += estimate_tokens(tool_result_text(block.get("content", ""))) + 4
     return total
 
 
+def _compact_tool_result(text: str, budget: int) -> str:
+    """Shrink an oversized tool result while keeping surviving lines verbatim.
+
+    Multi-line output (command logs, listings, diffs) first loses
+    low-signal lines and consecutive duplicates; if it still doesn't fit,
+    the head and tail are kept with an elision marker in between, so exact
+    paths, line numbers and the final error survive. Single-line payloads
+    (most JSON tool results) fall back to a plain head clip. Dropping
+    only noise lines appends a "(N lines pruned)" note; anything clipped
+    beyond that gets ``TOOL_RESULT_TRUNCATE_SUFFIX``.
+    """
+    lines = text.splitlines()
+    if len(lines) > 1:
+        kept: list[str] = []
+        for line in lines:
+            if _LOW_SIGNAL_LINE_RE.match(line) or (kept and kept[-1] == line):
+                continue
+            kept.append(line)
+        compacted = "\n".join(kept)
+        if len(compacted) <= budget:
+            dropped = len(lines) - len(kept)
+            if dropped:
+                compacted += f"\n... ({dropped} lines pruned)"
+            return compacted
+
+        # Head gets ~2/3 of the budget, tail the rest.
+        head: list[str] = []
+        used = 0
+        for line in kept:
+            if used + len(line) + 1 > budget * 2 // 3:
+                break
+            head.append(line)
+            used += len(line) + 1
+        tail: list[str] = []
+        for line in reversed(kept[len(head):]):
+            if used + len(line) + 1 > budget:
+                break
+            tail.append(line)
+            used += len(line) + 1
+        tail.reverse()
+        pruned = len(kept) - len(head) - len(tail)
+        if head and pruned:
+            return (
+                "\n".join(head)
+                + f"\n... ({pruned} lines pruned) ...\n"
+                + "\n".join(tail)
+                + TOOL_RESULT_TRUNCATE_SUFFIX
+            )
+
+    return text[:budget] + TOOL_RESULT_TRUNCATE_SUFFIX
+
+
 def truncate_tool_results(messages: list[dict[str, Any]]) -> list[dict[str, Any]]:
     """Return a deep-ish copy of messages with oversized tool_result contents clipped.
 
     Does not mutate the originals. Tool inputs/calls are left intact — only the
-    potentially-large result payloads are clipped.
+    potentially-large result payloads are compacted (see
+    ``_compact_tool_result``).
     """
     out: list[dict[str, Any]] = []
     for msg in messages:
@@ -101,20 +173,14 @@ def truncate_tool_results(messages: list[dict[str, Any]]) -> list[dict[str, Any]
                 new_blocks.append(block)
                 continue
 
-            result = block.get("content", "")
             # Normalize to string for length check
-            if isinstance(result, list):
-                text = " ".join(
-                    b.get("text", "") for b in result
-                    if isinstance(b, dict) and b.get("type") == "text"
-                )
-            else:
-                text = str(result)
+            text = tool_result_text(block.get("content", ""))
 
             if len(text) > TOOL_RESULT_TRUNCATE_CHARS:
-                clipped = text[:TOOL_RESULT_TRUNCATE_CHARS] + TOOL_RESULT_TRUNCATE_SUFFIX
                 new_block = dict(block)
-                new_block["content"] = clipped
+                new_block["content"] = _compact_tool_result(
+                    text, TOOL_RESULT_TRUNCATE_CHARS
+                )
                 new_blocks.append(new_block)
                 changed = True
             else:
@@ -9,7 +9,7 @@ from __future__ import annotations
 import inspect
 import json
 import logging
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import Any, Callable, Awaitable
 
 logger = logging.getLogger(__name__)
@@ -28,6 +28,11 @@ class ToolDef:
     sessions, etc.). It receives the registered ``input_schema`` and must
     return a (possibly new) schema dict. When ``None``, the static
     schema is used verbatim.
+
+    ``param_names`` is the set of keyword arguments the handler accepts
+    (excluding ``context``) and ``accepts_var_kw`` whether it takes
+    ``**kwargs``; both are read from its signature once at registration so
+    :meth:`ToolRegistry.execute` doesn't reflect on every call.
     """
 
     name: str
@@ -35,6 +40,8 @@ class ToolDef:
     input_schema: dict[str, Any]
     handler: Callable[..., Awaitable[str]]
     schema_builder: SchemaBuilder | None = None
+    param_names: frozenset[str] = field(default_factory=frozenset)
+    accepts_var_kw: bool = False
 
 
 class ToolRegistry:
@@ -61,6 +68,13 @@ class ToolRegistry:
 
     def __init__(self) -> None:
         self._tools: dict[str, ToolDef] = {}
+        # Serialized definition lists, keyed by API format. Static entries
+        # only change when a tool is (re-)registered, so each list is built
+        # once and reused; the (index, tool) slots of tools with a
+        # ``schema_builder`` are rebuilt per call so live state stays fresh.
+        self._definition_lists: dict[
+            str, tuple[list[dict[str, Any]], list[tuple[int, ToolDef]]]
+        ] = {}
 
     def register(
         self,
@@ -77,13 +91,19 @@ class ToolRegistry:
         """
 
         def decorator(fn: Callable[..., Awaitable[str]]) -> Callable[..., Awaitable[str]]:
+            params = inspect.signature(fn).parameters
             self._tools[name] = ToolDef(
                 name=name,
                 description=description,
                 input_schema=input_schema,
                 handler=fn,
                 schema_builder=schema_builder,
+                param_names=frozenset(params) - {"context"},
+                accepts_var_kw=any(
+                    p.kind is inspect.Parameter.VAR_KEYWORD for p in params.values()
+                ),
             )
+            self._definition_lists.clear()
             return fn
 
         return decorator
@@ -101,28 +121,57 @@ class ToolRegistry:
             )
             return tool.input_schema
 
+    def _anthropic_definition(self, tool: ToolDef) -> dict[str, Any]:
+        return {
+            "name": tool.name,
+            "description": tool.description,
+            "input_schema": self._resolve_schema(tool),
+        }
+
+    def _openai_definition(self, tool: ToolDef) -> dict[str, Any]:
+        return {
+            "type": "function",
+            "name": tool.name,
+            "description": tool.description,
+            "parameters": self._resolve_schema(tool),
+        }
+
+    def _collect_definitions(
+        self,
+        api_format: str,
+        build: Callable[[ToolDef], dict[str, Any]],
+    ) -> list[dict[str, Any]]:
+        """Serialize every tool, reusing the cached list for static schemas.
+
+        Returned lists and dicts are shared between calls — callers must
+        treat them as read-only (the providers only forward them to the
+        API). A registry with dynamic tools returns a fresh list.
+        """
+        cached = self._definition_lists.get(api_format)
+        if cached is None:
+            definitions = []
+            dynamic: list[tuple[int, ToolDef]] = []
+            for tool in self._tools.values():
+                if tool.schema_builder is not None:
+                    dynamic.append((len(definitions), tool))
+                definitions.append(build(tool))
+            self._definition_lists[api_format] = (definitions, dynamic)
+            return list(definitions) if dynamic else definitions
+        definitions, dynamic = cached
+        if not dynamic:
+            return definitions
+        definitions = list(definitions)
+        for index, tool in dynamic:
+            definitions[index] = build(tool)
+        return definitions
+
     def get_definitions(self) -> list[dict[str, Any]]:
         """Return tool definitions in Anthropic API format."""
-        return [
-            {
-                "name": tool.name,
-                "description": tool.description,
-                "input_schema": self._resolve_schema(tool),
-            }
-            for tool in self._tools.values()
-        ]
+        return self._collect_definitions("anthropic", self._anthropic_definition)
 
     def get_openai_definitions(self) -> list[dict[str, Any]]:
         """Return tool definitions in OpenAI function calling format (for Realtime API)."""
-        return [
-            {
-                "type": "function",
-                "name": tool.name,
-                "description": tool.description,
-                "parameters": self._resolve_schema(tool),
-            }
-            for tool in self._tools.values()
-        ]
+        return self._collect_definitions("openai", self._openai_definition)
 
     async def execute(
         self, name: str, tool_input: dict[str, Any], context: dict[str, Any]
@@ -133,10 +182,17 @@ class ToolRegistry:
             return json.dumps({"error": f"Unknown tool: {name}"})
 
         try:
-            # Filter tool_input to only pass params the handler accepts
-            sig = inspect.signature(tool.handler)
-            params = set(sig.parameters.keys()) - {"context"}
-            filtered = {k: v for k, v in tool_input.items() if k in params}
+            # Filter tool_input to only pass params the handler accepts;
+            # ``**kwargs`` handlers take everything except ``context``.
+            params = tool.param_names
+            if tool_input.keys() <= params or (
+                tool.accepts_var_kw and "context" not in tool_input
+            ):
+                filtered = tool_input
+            elif tool.accepts_var_kw:
+                filtered = {k: v for k, v in tool_input.items() if k != "context"}
+            else:
+                filtered = {k: tool_input[k] for k in tool_input.keys() & params}
             result = await tool.handler(context=context, **filtered)
             return result
         except Exception as e:
@@ -2,16 +2,73 @@
 
 from __future__ import annotations
 
-import json
+import asyncio
+import copy
 import logging
+import time
+from pathlib import Path
 from typing import Any
 
+import orjson
+
+from api.routes.session_config import save_session_config
+from api.session_factory import build_session_config
 from orchestrator.tools import registry
 from utils.mcp_config import get_mcp_configs, load_available_mcps
 
 logger = logging.getLogger(__name__)
 
 
+def _dumps(obj: Any) -> str:
+    """Serialize a tool result (orjson; compact, UTF-8 passed through)."""
+    return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS).decode()
+
+
+# Shared failure result for tools addressed to a session id that isn't open;
+# ``code`` is a stable key callers can match instead of the prose.
+_NO_ACTIVE_SESSION_JSON = '{"error":%s,"code":"no_active_session"}'
+
+
+def _no_active_session(session_id: str) -> str:
+    return _NO_ACTIVE_SESSION_JSON % _dumps(f"No active session with ID {session_id}")
+
+
+# list_history reuses the last store.list_sessions() result for this long,
+# provided neither session directory's mtime changed in the meantime.
+_HISTORY_TTL_SECONDS = 5.0
+
+# sessions_dir → (monotonic fetch time, directory stamp, sorted sessions).
+_history_cache: dict[Path, tuple[float, tuple[int, int], list]] = {}
+
+
+def _dir_mtime(path: Path) -> int:
+    try:
+        return path.stat().st_mtime_ns
+    except OSError:
+        return -1
+
+
+def _recent_sessions(store: Any) -> list:
+    """``store.list_sessions()`` with a short TTL + directory-mtime cache.
+
+    Creating or deleting a transcript bumps its directory's mtime and
+    invalidates immediately; appends to existing files are picked up once
+    the TTL lapses.
+    """
+    stamp = (_dir_mtime(store.sessions_dir), _dir_mtime(store.chats_dir))
+    now = time.monotonic()
+    cached = _history_cache.get(store.sessions_dir)
+    if (
+        cached is not None
+        and cached[1] == stamp
+        and now - cached[0] < _HISTORY_TTL_SECONDS
+    ):
+        return cached[2]
+    sessions = store.list_sessions()
+    _history_cache[store.sessions_dir] = (now, stamp, sessions)
+    return sessions
+
+
 @registry.register(
     name="list_agent_sessions",
     description=(
@@ -31,15 +88,16 @@ async def list_agent_sessions(context: dict[str, Any]) -> str:
 
     # Enrich with history data from the store (message count, title).
     # The store uses SDK session IDs (JSONL filenames).
+    infos = store.get_session_infos(
+        [s["sdk_session_id"] for s in sessions if s.get("sdk_session_id")]
+    )
     for s in sessions:
-        sdk_id = s.get("sdk_session_id")
-        if sdk_id:
-            info = store.get_session_info(sdk_id)
-            if info:
-                s["message_count"] = info.message_count
-                s["title"] = info.title
+        info = infos.get(s.get("sdk_session_id"))
+        if info:
+            s["message_count"] = info.message_count
+            s["title"] = info.title
 
-    return json.dumps({"sessions": sessions, "count": len(sessions)})
+    return _dumps({"sessions": sessions, "count": len(sessions)})
 
 
 def _open_agent_session_schema(static: dict[str, Any]) -> dict[str, Any]:
@@ -53,8 +111,6 @@ def _open_agent_session_schema(static: dict[str, Any]) -> dict[str, Any]:
     description to list what's actually available rather than hardcoding
     examples from other deployments.
     """
-    import copy
-
     available = sorted(load_available_mcps().keys())
     schema = copy.deepcopy(static)
     mcp_prop = schema["properties"]["mcp_servers"]
@@ -128,8 +184,6 @@ async def open_agent_session(
     verbatim, matching the per-session config the UI exposes via the gear
     panel.
     """
-    from api.session_factory import build_session_config
-
     pool = context["pool"]
     store = context["store"]
     sdk_id = resume_sdk_id if resume_sdk_id else None
@@ -138,12 +192,12 @@ async def open_agent_session(
     if sdk_id:
         session_info = store.get_session_info(sdk_id)
         if session_info is None:
-            return json.dumps({
+            return _dumps({
                 "error": f"Session {sdk_id!r} not found in history. "
                 "Use list_history to see available sessions."
             })
         if session_info.is_orchestrator:
-            return json.dumps({
+            return _dumps({
                 "error": f"Session {sdk_id!r} is an orchestrator session and cannot "
                 "be resumed as an agent session. Only agent sessions (type='agent') "
                 "from list_history can be resumed."
@@ -155,11 +209,13 @@ async def open_agent_session(
     # signal because the user-visible failure mode is "the model invented
     # a name and the tool reported success on an empty MCP set".
     if mcp_servers:
-        resolved = get_mcp_configs(mcp_servers)
+        # Off the event loop: a stale memo means reading and parsing both
+        # config files, which shouldn't stall other in-flight tool calls.
+        resolved = await asyncio.to_thread(get_mcp_configs, mcp_servers)
         missing = [n for n in mcp_servers if n not in resolved]
         if missing:
             available = sorted(load_available_mcps().keys())
-            return json.dumps({
+            return _dumps({
                 "error": (
                     f"Unknown MCP servers: {missing}. "
                     f"Available: {available or '(none configured)'}."
@@ -172,19 +228,18 @@ async def open_agent_session(
             mcp_override=mcp_servers,
         )
     except Exception as e:
-        return json.dumps({"error": f"Failed to build session config: {e}"})
+        return _dumps({"error": f"Failed to build session config: {e}"})
 
     try:
         local_id = await pool.create(
             config, resume_sdk_id=sdk_id, mcp_servers=resolved_mcps,
         )
     except Exception as e:
-        return json.dumps({"error": f"Failed to start session: {e}"})
+        return _dumps({"error": f"Failed to start session: {e}"})
 
     # Mirror chat.py's persist-on-detect behaviour so a legacy resumed
     # session gets its provider pinned for future deterministic resumes.
     if sdk_id and info.get("persist_provider"):
-        from api.routes.session_config import save_session_config
         try:
             save_session_config(sdk_id, {"provider": info["persist_provider"]})
         except Exception as e:
@@ -197,7 +252,7 @@ async def open_agent_session(
     # global settings landed (working dir, provider, MCPs, ssh target).
     # Without this the model has no way to verify that its expectations
     # match reality without calling get_assistant_config separately.
-    return json.dumps({
+    return _dumps({
         "session_id": local_id,
         "status": "started",
         "resolved_config": {
@@ -230,14 +285,14 @@ async def close_agent_session(context: dict[str, Any], session_id: str) -> str:
     pool = context["pool"]
 
     if not pool.has(session_id):
-        return json.dumps({"error": f"No active session with ID {session_id}"})
+        return _no_active_session(session_id)
 
     try:
         await pool.close(session_id)
     except Exception as e:
         logger.warning("Error closing session %s: %s", session_id, e)
 
-    return json.dumps({"session_id": session_id, "status": "closed"})
+    return _dumps({"session_id": session_id, "status": "closed"})
 
 
 @registry.register(
@@ -283,12 +338,10 @@ async def read_agent_session(
     sdk_id = sm.sdk_session_id if sm else session_id
 
     previews = store.get_preview(sdk_id, max_messages=max_messages)
+    # orjson renders datetimes exactly as ``isoformat()`` (None → null), so
+    # timestamps go in as-is.
     messages = [
-        {
-            "role": p.role,
-            "text": p.text,
-            "timestamp": p.timestamp.isoformat() if p.timestamp else None,
-        }
+        {"role": p.role, "text": p.text, "timestamp": p.timestamp}
         for p in previews
     ]
 
@@ -307,12 +360,12 @@ async def read_agent_session(
             }
 
     if not messages and live["status"] == "idle":
-        return json.dumps({
+        return _dumps({
             "error": f"No messages found for session {session_id}",
             "live": live,
         })
 
-    return json.dumps({
+    return _dumps({
         "session_id": session_id,
         "messages": messages,
         "live": live,
@@ -358,19 +411,19 @@ async def send_to_agent_session(
     if runner is None:
         # Fallback safety: shouldn't happen — OrchestratorSession injects runner
         # into context at __init__.  If it's missing we have a wiring bug.
-        return json.dumps({
+        return _dumps({
             "error": "BackgroundAgentRunner not available in context — orchestrator init bug",
         })
 
     if not pool.has(session_id):
-        return json.dumps({"error": f"No active session with ID {session_id}"})
+        return _no_active_session(session_id)
 
     try:
         handle = await runner.spawn(session_id, message)
     except ValueError as e:
-        return json.dumps({"error": str(e)})
+        return _dumps({"error": str(e)})
 
-    return json.dumps({
+    return _dumps({
         "turn_id": handle.turn_id,
         "session_id": session_id,
         "session_title": handle.session_title,
@@ -405,18 +458,17 @@ async def send_to_agent_session(
     },
 )
 async def interrupt_agent_session(context: dict[str, Any], session_id: str) -> str:
-    pool = context["pool"]
-
-    if not pool.has(session_id):
-        return json.dumps({"error": f"No active session with ID {session_id}"})
+    sm = context["pool"].get(session_id)
+    if sm is None:
+        return _no_active_session(session_id)
 
     try:
-        await pool.interrupt(session_id)
+        await sm.interrupt()
     except Exception as e:
         logger.warning("Error interrupting session %s: %s", session_id, e)
-        return json.dumps({"error": f"Failed to interrupt session: {e}"})
+        return _dumps({"error": f"Failed to interrupt session: {e}"})
 
-    return json.dumps({"session_id": session_id, "status": "interrupted"})
+    return _dumps({"session_id": session_id, "status": "interrupted"})
 
 
 @registry.register(
@@ -468,7 +520,7 @@ async def respond_to_agent_permission(
 ) -> str:
     pool = context["pool"]
     if decision not in ("allow", "deny"):
-        return json.dumps({"error": "decision must be 'allow' or 'deny'"})
+        return _dumps({"error": "decision must be 'allow' or 'deny'"})
     won = await pool.resolve_session_permission(
         session_id,
         request_id,
@@ -477,13 +529,13 @@ async def respond_to_agent_permission(
         responder="orchestrator",
     )
     if not won:
-        return json.dumps({
+        return _dumps({
             "session_id": session_id,
             "request_id": request_id,
             "result": "no_op",
             "detail": "request was already answered or no longer exists",
         })
-    return json.dumps({
+    return _dumps({
         "session_id": session_id,
         "request_id": request_id,
         "decision": decision,
@@ -512,14 +564,15 @@ async def respond_to_agent_permission(
 )
 async def list_history(context: dict[str, Any], limit: int = 20) -> str:
     store = context["store"]
-    sessions = store.list_sessions()[:limit]
-    result = []
-    for s in sessions:
-        result.append({
+    sessions = _recent_sessions(store)[:limit]
+    result = [
+        {
             "session_id": s.session_id,
             "title": s.title,
             "message_count": s.message_count,
-            "last_activity": s.last_activity.isoformat(),
+            "last_activity": s.last_activity,
             "type": "orchestrator" if s.is_orchestrator else "agent",
-        })
-    return json.dumps({"sessions": result, "total": len(sessions)})
+        }
+        for s in sessions
+    ]
+    return _dumps({"sessions": result, "total": len(sessions)})
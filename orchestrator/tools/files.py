@@ -6,6 +6,7 @@ project directory.
 
 from __future__ import annotations
 
+import asyncio
 import json
 import logging
 from pathlib import Path
@@ -27,6 +28,35 @@ def _resolve_path(base_dir: str, path: str) -> Path:
     return (Path(base_dir) / expanded).resolve()
 
 
+def _read_line_range(
+    target: Path, start: int, end: int | None,
+) -> tuple[list[str], int, bool]:
+    """Stream ``target`` and keep lines ``start..end`` (1-indexed, inclusive).
+
+    Returns ``(kept_lines, total_lines, truncated)``. Kept lines stop at the
+    :data:`MAX_FILE_SIZE` character budget — whole lines only, but always at
+    least one — so memory stays bounded however large the file is; the rest
+    of the file is only counted. Line boundaries match ``str.splitlines``.
+    """
+    kept: list[str] = []
+    running = 0
+    total = 0
+    truncated = False
+    with target.open(encoding="utf-8") as f:
+        for physical in f:
+            for line in physical.splitlines(keepends=True):
+                total += 1
+                if truncated or total < start or (end is not None and total > end):
+                    continue
+                if running + len(line) > MAX_FILE_SIZE and kept:
+                    truncated = True
+                    continue
+                kept.append(line)
+                running += len(line)
+    # A lone first line over the budget is returned whole, flagged truncated.
+    return kept, total, truncated or running > MAX_FILE_SIZE
+
+
 @registry.register(
     name="read_file",
     description=(
@@ -74,18 +104,19 @@ async def read_file(
     if not target.is_file():
         return json.dumps({"error": f"File not found: {path}"})
 
+    # Normalise the range. start_line defaults to 1; end_line defaults to EOF.
+    # Both are clamped to [1, total_lines]; an inverted range yields empty.
+    s = 1 if start_line is None else max(1, start_line)
+    last = None if end_line is None else max(1, end_line)
+
     try:
-        raw = target.read_text(encoding="utf-8")
+        kept, total_lines, truncated = await asyncio.to_thread(
+            _read_line_range, target, s, last,
+        )
     except Exception as e:
         return json.dumps({"error": f"Failed to read file: {e}"})
 
-    lines = raw.splitlines(keepends=True)
-    total_lines = len(lines)
-
-    # Normalise the range. start_line defaults to 1; end_line defaults to EOF.
-    # Both are clamped to [1, total_lines]; an inverted range yields empty.
-    s = 1 if start_line is None else max(1, start_line)
-    e = total_lines if end_line is None else min(total_lines, max(1, end_line))
+    e = total_lines if last is None else min(total_lines, last)
 
     if total_lines == 0:
         # Empty file — preserve original behaviour (return empty content).
@@ -107,24 +138,11 @@ async def read_file(
             "total_lines": total_lines,
         })
 
-    sliced = "".join(lines[s - 1:e])
+    sliced = "".join(kept)
     returned_end = e
 
-    # Byte-size truncation — count whole lines so the marker can name a
-    # line number the model can resume from.
-    if len(sliced) > MAX_FILE_SIZE:
-        kept: list[str] = []
-        running = 0
-        last_idx = s - 1
-        for idx in range(s - 1, e):
-            chunk = lines[idx]
-            if running + len(chunk) > MAX_FILE_SIZE and kept:
-                break
-            kept.append(chunk)
-            running += len(chunk)
-            last_idx = idx
-        sliced = "".join(kept)
-        returned_end = last_idx + 1
+    if truncated:
+        returned_end = s + len(kept) - 1
         next_line = returned_end + 1
         marker = (
             f"\n... [truncated at line {returned_end} of {total_lines} total "
@@ -141,6 +159,11 @@ async def read_file(
     })
 
 
+def _write_text(target: Path, content: str) -> None:
+    target.parent.mkdir(parents=True, exist_ok=True)
+    target.write_text(content, encoding="utf-8")
+
+
 @registry.register(
     name="write_file",
     description="Write content to a file. Absolute paths write anywhere on the host; relative paths resolve against the project directory. Creates parent directories if needed.",
@@ -167,8 +190,7 @@ async def write_file(context: dict[str, Any], path: str, content: str) -> str:
     target = _resolve_path(project_dir, path)
 
     try:
-        target.parent.mkdir(parents=True, exist_ok=True)
-        target.write_text(content, encoding="utf-8")
+        await asyncio.to_thread(_write_text, target, content)
         return json.dumps({"path": str(target), "status": "written", "bytes": len(content)})
     except Exception as e:
         return json.dumps({"error": f"Failed to write file: {e}"})
@@ -265,6 +265,10 @@ _server_lock = asyncio.Lock()  # guards lifecycle (start/stop)
 _query_lock = asyncio.Lock()   # serializes stdin/stdout pairing across concurrent queries
 _server_ready = False
 
+# Searches waiting on _query_lock as (request, future) pairs; the next lock
+# holder sends them all in one query_many round trip.
+_pending_searches: list[tuple[dict, asyncio.Future]] = []
+
 
 async def _ensure_server() -> asyncio.subprocess.Process | None:
     """Start the search server if not already running. Returns the process or None."""
@@ -465,6 +469,95 @@ async def _do_search_cold(
         return []
 
 
+def _results_from_response(response: dict, request: dict) -> list[dict[str, Any]]:
+    """Unpack one warm-server query reply, surfacing its error if any."""
+    error = response.get("error")
+    if error:
+        msg = (
+            f"[search warm-server ERROR] collection={request['collection']} "
+            f"query={request['query']!r}: {error}"
+        )
+        logger.warning(msg)
+        print(msg, file=sys.stderr, flush=True)
+        return [{"error": error}]
+    results = response.get("results", [])
+    logger.info("Warm search returned %d results.", len(results))
+    return results
+
+
+async def _warm_search(request: dict) -> list[dict[str, Any]] | None:
+    """Run one query on the warm server, restarting it once if it stops
+    answering. Returns None when the warm server can't be used at all."""
+    collection_name, query = request["collection"], request["query"]
+
+    proc = await _ensure_server()
+    if proc is None:
+        return None
+    response = await _query_server(proc, request)
+    if response is not None:
+        return _results_from_response(response, request)
+
+    # Warm path failed — restart and retry once.
+    rc = proc.returncode
+    msg = (
+        f"[search warm-server UNRESPONSIVE] pid={proc.pid} returncode={rc} "
+        f"collection={collection_name} query={query!r} — restarting and retrying"
+    )
+    logger.warning(msg)
+    print(msg, file=sys.stderr, flush=True)
+    await _restart_server()
+
+    proc = await _ensure_server()
+    if proc is not None:
+        response = await _query_server(proc, request)
+        if response is not None:
+            error = response.get("error")
+            if error:
+                return [{"error": error}]
+            results = response.get("results", [])
+            logger.info("Warm search returned %d results (after restart).", len(results))
+            return results
+        # Retry also failed — server keeps dying. Fall through.
+        msg = (
+            f"[search warm-server FAILED AFTER RESTART] "
+            f"collection={collection_name} query={query!r}"
+        )
+        logger.error(msg)
+        print(msg, file=sys.stderr, flush=True)
+    return None
+
+
+async def _warm_search_batch(batch: list[tuple[dict, asyncio.Future]]) -> None:
+    """Resolve every ``(request, future)`` in ``batch`` through the warm server.
+
+    Several requests go out as one ``query_many`` round trip so the server
+    runs a single batched encode; each future gets its results, or None
+    when the warm server is unavailable.
+    """
+    if len(batch) > 1:
+        proc = await _ensure_server()
+        if proc is not None:
+            response = await _query_server(
+                proc, {"command": "query_many", "queries": [r for r, _ in batch]},
+            )
+            replies = response.get("replies") if response is not None else None
+            if isinstance(replies, list) and len(replies) == len(batch):
+                for (request, fut), reply in zip(batch, replies):
+                    if not fut.done():
+                        fut.set_result(_results_from_response(reply, request))
+                return
+            if response is None:
+                # No reply (timeout / dead process) would leave stdio pairing
+                # out of step for the per-request retries below.
+                await _restart_server()
+
+    # Single search, or a server that couldn't answer the batch (e.g. one
+    # predating query_many): one request at a time with restart-and-retry.
+    for request, fut in batch:
+        if not fut.done():
+            fut.set_result(await _warm_search(request))
+
+
 async def _do_search(
     query: str,
     collection_name: str,
@@ -472,6 +565,10 @@ async def _do_search(
 ) -> list[dict[str, Any]]:
     """Search using the warm server.
 
+    Concurrent calls (parallel tool calls in one turn) are coalesced: each
+    queues its request, and whichever caller takes the query lock sends
+    everything queued as one batch.
+
     Cold fallback only fires when the warm server can't be started AT ALL.
     Once the warm server is up, all queries go through it — chromadb's
     PersistentClient is not safe for concurrent multi-process access against
@@ -479,8 +576,6 @@ async def _do_search(
     warm server holds it crashes with "Failed to apply logs to the hnsw
     segment writer".
     """
-    global _server_proc, _server_ready
-
     logger.info("Searching '%s' for: %s", collection_name, query)
 
     request = {
@@ -488,55 +583,23 @@ async def _do_search(
         "collection": collection_name,
         "n_results": max_results,
     }
+    fut: asyncio.Future = asyncio.get_running_loop().create_future()
+    _pending_searches.append((request, fut))
+    # Yield once so sibling tool calls started in the same tick can queue.
+    await asyncio.sleep(0)
 
-    # Serialize concurrent queries — the warm server is single-threaded and
+    # Serialize round trips — the warm server is single-threaded and
     # request/response pairing on its stdio is positional.
     async with _query_lock:
-        # First attempt
-        proc = await _ensure_server()
-        if proc is not None:
-            response = await _query_server(proc, request)
-            if response is not None:
-                error = response.get("error")
-                if error:
-                    msg = (
-                        f"[search warm-server ERROR] collection={collection_name} "
-                        f"query={query!r}: {error}"
-                    )
-                    logger.warning(msg)
-                    print(msg, file=sys.stderr, flush=True)
-                    return [{"error": error}]
-                results = response.get("results", [])
-                logger.info("Warm search returned %d results.", len(results))
-                return results
-
-            # Warm path failed — restart and retry once.
-            rc = proc.returncode
-            msg = (
-                f"[search warm-server UNRESPONSIVE] pid={proc.pid} returncode={rc} "
-                f"collection={collection_name} query={query!r} — restarting and retrying"
-            )
-            logger.warning(msg)
-            print(msg, file=sys.stderr, flush=True)
-            await _restart_server()
-
-            proc = await _ensure_server()
-            if proc is not None:
-                response = await _query_server(proc, request)
-                if response is not None:
-                    error = response.get("error")
-                    if error:
-                        return [{"error": error}]
-                    results = response.get("results", [])
-                    logger.info("Warm search returned %d results (after restart).", len(results))
-                    return results
-                # Retry also failed — server keeps dying. Fall through.
-                msg = (
-                    f"[search warm-server FAILED AFTER RESTART] "
-                    f"collection={collection_name} query={query!r}"
-                )
-                logger.error(msg)
-                print(msg, file=sys.stderr, flush=True)
+        if not fut.done():
+            batch = [(request, fut)]
+            batch.extend(e for e in _pending_searches if e[1] is not fut)
+            _pending_searches.clear()
+            await _warm_search_batch(batch)
+
+    results = fut.result()
+    if results is not None:
+        return results
 
     # Cold fallback only runs when the warm server cannot be brought up.
     # This is mutually exclusive with a healthy warm server (so chromadb
@@ -73,6 +73,19 @@ class ToolUseStart(OrchestratorEvent):
     tool_name: str
     tool_input: dict[str, Any]
 
+    def as_content_block(self) -> dict[str, Any]:
+        """Anthropic ``tool_use`` content block for the assistant message.
+
+        ``tool_input`` is shared, not copied — history entries are never
+        mutated after they are appended.
+        """
+        return {
+            "type": "tool_use",
+            "id": self.tool_call_id,
+            "name": self.tool_name,
+            "input": self.tool_input,
+        }
+
 
 @dataclass(frozen=True, slots=True)
 class ToolResultEvent(OrchestratorEvent):
@@ -49,9 +49,10 @@ parity tests + the session's tear-down clear path).
 
 from __future__ import annotations
 
-from datetime import datetime, timezone
 from typing import Any, Callable, TYPE_CHECKING
 
+from orchestrator.persistence import utc_timestamp
+
 if TYPE_CHECKING:
     from orchestrator.audio_recorder import AudioRecorder
     from orchestrator.persistence import HistoryWriter
@@ -149,9 +150,13 @@ class VoicePersister:
         order of probes here matches the legacy code's ``if/elif`` chain
         EXACTLY — see ``tests/parity/test_voice_persister_parity.py``.
         """
-        sc = event.get("serverContent") or {}
-        input_t = sc.get("inputTranscription") if isinstance(sc, dict) else None
-        output_t = sc.get("outputTranscription") if isinstance(sc, dict) else None
+        sc = event.get("serverContent")
+        # toolCall / setupComplete / usage frames carry no serverContent
+        # and persist nothing here; every probe below reads ``sc``.
+        if not sc or not isinstance(sc, dict):
+            return
+        input_t = sc.get("inputTranscription")
+        output_t = sc.get("outputTranscription")
 
         # User speech transcript — accumulate; flushed on first output
         # delta or turnComplete failsafe.
@@ -174,7 +179,7 @@ class VoicePersister:
                 self._pending_assistant_transcript = staged + delta
 
         # Turn complete — persist staged transcripts.
-        if isinstance(sc, dict) and sc.get("turnComplete"):
+        if sc.get("turnComplete"):
             # Failsafe flush of user transcript: covers turns where the
             # model produced no text output (audio-only modality) so the
             # outputTranscription branch above never fired.
@@ -184,10 +189,10 @@ class VoicePersister:
             self._flush_assistant_transcript_if_staged()
 
         # Interrupted — mark in JSONL like OpenAI's speech_started.
-        if isinstance(sc, dict) and sc.get("interrupted") and not self._is_injecting():
+        if sc.get("interrupted") and not self._is_injecting():
             self._writer.append({
                 "type": "voice_interrupted",
-                "timestamp": datetime.now(timezone.utc).isoformat(),
+                "timestamp": utc_timestamp(),
             })
 
     # ------------------------------------------------------------------
@@ -197,57 +202,76 @@ class VoicePersister:
     def _handle_top_level_type_event(
         self, event_type: str, event: dict[str, Any]
     ) -> None:
+        # Realtime streams are mostly audio/bookkeeping events nothing
+        # here persists, so a single dict miss is the common path.
+        handler = self._TOP_LEVEL_HANDLERS.get(event_type)
+        if handler is not None:
+            handler(self, event)
+
+    def _on_input_transcription_completed(self, event: dict[str, Any]) -> None:
         # User speech transcript — Whisper completion.
-        if (
-            event_type == "conversation.item.input_audio_transcription.completed"
-            and not self._is_injecting()
-        ):
-            transcript = event.get("transcript", "")
-            if transcript:
-                self._persist_user_turn(transcript)
+        if self._is_injecting():
+            return
+        transcript = event.get("transcript", "")
+        if transcript:
+            self._persist_user_turn(transcript)
 
+    def _on_item_created(self, event: dict[str, Any]) -> None:
         # User typed text inside a voice session.
-        elif event_type == "conversation.item.created":
-            item = event.get("item", {})
-            if item.get("role") == "user":
-                for c in item.get("content", []):
-                    if c.get("type") == "input_text" and c.get("text"):
-                        self._writer.append({
-                            "type": "user",
-                            "message": {"role": "user", "content": c["text"]},
-                            "source": "voice_transcription",
-                            "timestamp": datetime.now(timezone.utc).isoformat(),
-                        })
-                        break
+        item = event.get("item", {})
+        if item.get("role") != "user":
+            return
+        text = next(
+            (
+                c["text"] for c in item.get("content", ())
+                if c.get("type") == "input_text" and c.get("text")
+            ),
+            None,
+        )
+        if text:
+            self._writer.append({
+                "type": "user",
+                "message": {"role": "user", "content": text},
+                "source": "voice_transcription",
+                "timestamp": utc_timestamp(),
+            })
 
+    def _on_transcript_done(self, event: dict[str, Any]) -> None:
         # Assistant transcript complete — STAGE only.
-        elif event_type in (
-            "response.output_audio_transcript.done",
-            "response.audio_transcript.done",
-        ):
-            transcript = event.get("transcript", "")
-            if transcript:
-                self._pending_assistant_transcript = transcript
+        transcript = event.get("transcript", "")
+        if transcript:
+            self._pending_assistant_transcript = transcript
 
+    def _on_response_done(self, event: dict[str, Any]) -> None:
         # Turn complete — flush staged ONLY when status="completed".
         # Cancelled turns drop the fragment without persisting.
-        elif event_type == "response.done":
-            response = event.get("response", {})
-            status = response.get("status", "completed")
-            staged = self._pending_assistant_transcript
-            if staged and status == "completed":
-                self._flush_assistant_transcript_if_staged()
-            else:
-                # Cancelled / failed — drop the staged fragment.
-                self._pending_assistant_transcript = None
+        response = event.get("response", {})
+        status = response.get("status", "completed")
+        staged = self._pending_assistant_transcript
+        if staged and status == "completed":
+            self._flush_assistant_transcript_if_staged()
+        else:
+            # Cancelled / failed — drop the staged fragment.
+            self._pending_assistant_transcript = None
 
+    def _on_speech_started(self, event: dict[str, Any]) -> None:
         # Barge-in — record JSONL marker (suppressed while injecting).
-        elif event_type == "input_audio_buffer.speech_started":
-            if not self._is_injecting():
-                self._writer.append({
-                    "type": "voice_interrupted",
-                    "timestamp": datetime.now(timezone.utc).isoformat(),
-                })
+        if not self._is_injecting():
+            self._writer.append({
+                "type": "voice_interrupted",
+                "timestamp": utc_timestamp(),
+            })
+
+    _TOP_LEVEL_HANDLERS: dict[str, Callable[["VoicePersister", dict[str, Any]], None]] = {
+        "conversation.item.input_audio_transcription.completed": _on_input_transcription_completed,
+        "conversation.item.created": _on_item_created,
+        "response.output_audio_transcript.done": _on_transcript_done,
+        "response.audio_transcript.done": _on_transcript_done,
+        "response.done": _on_response_done,
+        "input_audio_buffer.speech_started": _on_speech_started,
+    }
+    #: Top-level event types :meth:`handle_event` persists anything for.
+    HANDLED_TYPES = frozenset(_TOP_LEVEL_HANDLERS)
 
     # ------------------------------------------------------------------
     # Tool persistence (called by OrchestratorSession after registry
@@ -269,7 +293,7 @@ class VoicePersister:
         ``process_voice_event`` (both the OpenAI/Qwen path and the
         Gemini path used the same shape).
         """
-        now = datetime.now(timezone.utc).isoformat()
+        now = utc_timestamp()
         self._writer.append({
             "type": "tool_use",
             "tool_call_id": call_id,
@@ -320,7 +344,7 @@ class VoicePersister:
             "type": "user",
             "message": {"role": "user", "content": content},
             "source": "voice_transcription",
-            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "timestamp": utc_timestamp(),
         }
         if segment:
             entry["audio_segment"] = segment
@@ -348,7 +372,7 @@ class VoicePersister:
             "type": "assistant",
             "message": {"role": "assistant", "content": content},
             "source": "voice_response",
-            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "timestamp": utc_timestamp(),
         }
         if segment:
             entry["audio_segment"] = segment
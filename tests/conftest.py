@@ -8,6 +8,20 @@ SCRIPTS_DIR = Path(__file__).parent.parent / "default-scripts"
 sys.path.insert(0, str(SCRIPTS_DIR))
 
 
+@pytest.fixture
+def write_through_history():
+    """A ``HistoryWriter`` subclass that flushes every append, so assertions
+    can read the JSONL right after each event."""
+    from orchestrator.persistence import HistoryWriter
+
+    class WriteThroughHistory(HistoryWriter):
+        def append(self, data):
+            super().append(data)
+            self.flush()
+
+    return WriteThroughHistory
+
+
 @pytest.fixture
 def tmp_index(tmp_path, monkeypatch):
     """Redirect embed.py and search.py to a temporary ChromaDB directory."""
@@ -203,3 +203,29 @@ def test_claude_config_dir_env_overrides_default(tmp_path, monkeypatch):
     monkeypatch.setenv("CLAUDE_CONFIG_DIR", str(custom_dir))
 
     assert mcp_config.load_available_mcps() == {"obs": {"command": "obs-mcp"}}
+
+
+def test_config_stamp_changes_when_a_file_changes(isolated_project):
+    _, write = isolated_project
+    before = mcp_config.config_stamp()
+    assert mcp_config.config_stamp() == before
+
+    write(project_mcp_json={"mcpServers": {"obs": {"command": "obs-mcp"}}})
+    assert mcp_config.config_stamp() != before
+
+
+def test_load_available_mcps_reparses_only_when_stamp_changes(isolated_project, monkeypatch):
+    _, write = isolated_project
+    write(project_mcp_json={"mcpServers": {"obs": {"command": "obs-mcp"}}})
+    reads = []
+    real_read = mcp_config._read_json
+    monkeypatch.setattr(mcp_config, "_read_json", lambda p: reads.append(p) or real_read(p))
+
+    first = mcp_config.load_available_mcps()
+    n = len(reads)
+    assert mcp_config.load_available_mcps() == first
+    assert len(reads) == n
+
+    write(project_mcp_json={"mcpServers": {"obs": {"command": "obs-mcp"}, "x": {}}})
+    assert set(mcp_config.load_available_mcps()) == {"obs", "x"}
+    assert len(reads) > n
@@ -21,6 +21,8 @@ from orchestrator.types import (
     ToolResultEvent,
     TurnComplete,
     ErrorEvent,
+    ToolExecutingEvent,
+    ToolProgressEvent,
 )
 from orchestrator.config import OrchestratorConfig
 from orchestrator.tools import ToolRegistry
@@ -173,6 +175,76 @@ class TestToolRegistry:
         assert defs[0]["description"] == "Does stuff"
         assert "input_schema" in defs[0]
 
+    def test_static_definitions_are_cached_until_reregistered(self):
+        reg = ToolRegistry()
+
+        @reg.register(
+            name="my_tool",
+            description="v1",
+            input_schema={"type": "object", "properties": {}},
+        )
+        async def my_tool(context: dict) -> str:
+            return "ok"
+
+        first = reg.get_definitions()[0]
+        assert reg.get_definitions()[0] is first
+
+        @reg.register(
+            name="my_tool",
+            description="v2",
+            input_schema={"type": "object", "properties": {}},
+        )
+        async def my_tool_v2(context: dict) -> str:
+            return "ok"
+
+        assert reg.get_definitions()[0]["description"] == "v2"
+
+    def test_schema_builder_definitions_are_rebuilt(self):
+        reg = ToolRegistry()
+        calls = []
+
+        def builder(schema):
+            calls.append(1)
+            return {**schema, "properties": {"n": {"enum": [len(calls)]}}}
+
+        @reg.register(
+            name="dyn",
+            description="Dynamic",
+            input_schema={"type": "object", "properties": {}},
+            schema_builder=builder,
+        )
+        async def dyn(context: dict) -> str:
+            return "ok"
+
+        reg.get_openai_definitions()
+        defs = reg.get_openai_definitions()
+        assert len(calls) == 2
+        assert defs[0]["parameters"]["properties"]["n"]["enum"] == [2]
+
+    def test_definition_list_cached_around_dynamic_slots(self):
+        reg = ToolRegistry()
+
+        @reg.register(name="a", description="A", input_schema={"type": "object"})
+        async def a(context: dict) -> str:
+            return "ok"
+
+        assert reg.get_definitions() is reg.get_definitions()
+
+        @reg.register(
+            name="dyn",
+            description="Dynamic",
+            input_schema={"type": "object"},
+            schema_builder=lambda schema: {**schema, "title": "live"},
+        )
+        async def dyn(context: dict) -> str:
+            return "ok"
+
+        first, second = reg.get_definitions(), reg.get_definitions()
+        assert first is not second
+        assert first[0] is second[0]
+        assert [d["name"] for d in second] == ["a", "dyn"]
+        assert second[1]["input_schema"]["title"] == "live"
+
     @pytest.mark.asyncio
     async def test_execute_success(self):
         reg = ToolRegistry()
@@ -233,6 +305,26 @@ class TestToolRegistry:
         result = await reg.execute("simple", {"x": "ok", "extra": "ignored"}, context={})
         assert result == "ok"
 
+    @pytest.mark.asyncio
+    async def test_execute_passes_all_params_to_var_kw_handler(self):
+        reg = ToolRegistry()
+
+        @reg.register(name="kw", description="Kwargs tool", input_schema={"type": "object"})
+        async def kw(context: dict, **kwargs) -> str:
+            return json.dumps(kwargs, sort_keys=True)
+
+        result = await reg.execute("kw", {"a": 1, "b": 2, "context": "x"}, context={})
+        assert json.loads(result) == {"a": 1, "b": 2}
+
+    def test_register_records_handler_params(self):
+        reg = ToolRegistry()
+
+        @reg.register(name="two", description="Two params", input_schema={"type": "object"})
+        async def two(context: dict, a: str, b: int = 0) -> str:
+            return a
+
+        assert reg._tools["two"].param_names == frozenset({"a", "b"})
+
 
 # ---------------------------------------------------------------------------
 # OpenAI text provider tests
@@ -281,6 +373,16 @@ class TestOpenAITextProvider:
         assert result[2]["role"] == "assistant"
         assert result[2]["content"] == "Hi there!"
 
+    def test_message_conversion_flattens_system_blocks(self):
+        from orchestrator.providers.openai_text import convert_messages_for_openai
+
+        blocks = [
+            {"type": "text", "text": "Static", "cache_control": {"type": "ephemeral"}},
+            {"type": "text", "text": "Dynamic"},
+        ]
+        result = convert_messages_for_openai([], blocks)
+        assert result == [{"role": "system", "content": "Static\n\nDynamic"}]
+
     def test_message_conversion_with_tool_use(self):
         """Test message conversion with tool calls.
 
@@ -414,6 +516,25 @@ class TestAnthropicProvider:
         assert text_completes[0].text == "Hello world"
         assert len(turn_completes) == 1
 
+        system = provider._client.messages.stream.call_args.kwargs["system"]
+        assert system == [{
+            "type": "text", "text": "You are helpful", "cache_control": {"type": "ephemeral"},
+        }]
+
+    @pytest.mark.asyncio
+    async def test_system_blocks_pass_through(self):
+        events = _build_mock_text_stream("ok")
+        provider = self._make_provider(_MockAsyncContextStream(events))
+        blocks = [
+            {"type": "text", "text": "static", "cache_control": {"type": "ephemeral"}},
+            {"type": "text", "text": "dynamic"},
+        ]
+
+        async for _ in provider.create_message(messages=[], tools=[], system=blocks):
+            pass
+
+        assert provider._client.messages.stream.call_args.kwargs["system"] == blocks
+
     @pytest.mark.asyncio
     async def test_streaming_tool_use(self):
         """Test that tool use events are accumulated and yielded."""
@@ -554,6 +675,27 @@ class TestFileTools:
         parsed = json.loads(result)
         assert "error" in parsed
 
+    @pytest.mark.asyncio
+    async def test_read_file_truncates_large_file_and_counts_all_lines(self, tmp_path):
+        from orchestrator.tools.files import MAX_FILE_SIZE, read_file
+
+        line = "x" * 99 + "\n"
+        n_lines = 3 * MAX_FILE_SIZE // len(line)
+        (tmp_path / "big.txt").write_text(line * n_lines)
+
+        parsed = json.loads(await read_file(context={"project_dir": str(tmp_path)}, path="big.txt"))
+        kept = MAX_FILE_SIZE // len(line)
+        assert parsed["total_lines"] == n_lines
+        assert parsed["end_line"] == kept
+        assert f"start_line={kept + 1} to continue" in parsed["content"]
+
+        parsed = json.loads(await read_file(
+            context={"project_dir": str(tmp_path)}, path="big.txt",
+            start_line=n_lines - 1,
+        ))
+        assert parsed["content"] == line * 2
+        assert parsed["end_line"] == n_lines
+
     @pytest.mark.asyncio
     async def test_write_file(self, tmp_path):
         from orchestrator.tools.files import write_file
@@ -584,6 +726,36 @@ class TestFileTools:
             outside.unlink()
 
 
+class TestAgentSessionTools:
+    @pytest.mark.asyncio
+    async def test_list_history_reuses_scan_until_dir_changes(self, tmp_path):
+        from datetime import datetime, timezone
+
+        from manager.types import SessionInfo
+        from orchestrator.tools.agent_sessions import list_history
+
+        info = SessionInfo(
+            session_id="s1",
+            started_at=datetime(2026, 1, 1, tzinfo=timezone.utc),
+            last_activity=datetime(2026, 1, 2, tzinfo=timezone.utc),
+            title="First",
+            message_count=2,
+        )
+        store = MagicMock()
+        store.sessions_dir = tmp_path
+        store.chats_dir = tmp_path / "chats"
+        store.list_sessions.return_value = [info]
+
+        first = json.loads(await list_history(context={"store": store}))
+        await list_history(context={"store": store})
+        assert store.list_sessions.call_count == 1
+        assert first["sessions"][0]["last_activity"] == info.last_activity.isoformat()
+
+        (tmp_path / "s2.jsonl").write_text("")
+        await list_history(context={"store": store})
+        assert store.list_sessions.call_count == 2
+
+
 # ---------------------------------------------------------------------------
 # System prompt builder tests
 # ---------------------------------------------------------------------------
@@ -677,6 +849,168 @@ class TestPromptBuilder:
         assert "qwen-only alignment content" in prompt
         assert "Provider-Specific Memory" in prompt
 
+    def test_static_sections_precede_dynamic_state(self, tmp_path):
+        """Role/guidelines/MCP/memory instructions form a stable prefix; live
+        sessions and memory contents come after it."""
+        from orchestrator.prompt import build_system_prompt
+        from orchestrator.config import OrchestratorConfig
+
+        mem_file = tmp_path / "ORCHESTRATOR_MEMORY.md"
+        mem_file.write_text("# My Memory")
+        config = OrchestratorConfig(project_dir=str(tmp_path), memory_path=str(mem_file))
+
+        prompt = build_system_prompt(config, context={})
+        order = [
+            prompt.index("## Guidelines"),
+            prompt.index("## MCP Orchestration"),
+            prompt.index("## Memory System"),
+            prompt.index("## Active Agent Sessions"),
+            prompt.index("### Current Private Memory"),
+        ]
+        assert order == sorted(order)
+
+        mem_file.write_text("# Changed Memory")
+        changed = build_system_prompt(config, context={})
+        prefix_end = prompt.index("## Active Agent Sessions")
+        assert changed[:prefix_end] == prompt[:prefix_end]
+
+    def test_memory_reload_follows_file_edits(self, tmp_path):
+        from orchestrator.prompt import build_system_prompt
+        from orchestrator.config import OrchestratorConfig
+
+        mem_file = tmp_path / "ORCHESTRATOR_MEMORY.md"
+        mem_file.write_text("first version")
+        config = OrchestratorConfig(project_dir=str(tmp_path), memory_path=str(mem_file))
+        assert "first version" in build_system_prompt(config, context={})
+
+        mem_file.write_text("second, longer version")
+        prompt = build_system_prompt(config, context={})
+        assert "second, longer version" in prompt
+        assert "first version" not in prompt
+
+    def test_mcp_descriptions_loaded_once_per_section(self, tmp_path, monkeypatch):
+        from orchestrator import prompt as prompt_mod
+
+        (tmp_path / "mcp_descriptions.json").write_text(json.dumps({"a": "Alpha server"}))
+        monkeypatch.setenv("CLAUDE_CONFIG_DIR", str(tmp_path))
+        monkeypatch.setattr(
+            prompt_mod, "load_available_mcps",
+            lambda: {"a": {"command": "x"}, "b": {"command": "y"}},
+        )
+        calls = []
+        real = prompt_mod._load_mcp_descriptions
+        monkeypatch.setattr(
+            prompt_mod, "_load_mcp_descriptions", lambda: calls.append(1) or real(),
+        )
+
+        section = prompt_mod._build_mcp_section()
+        assert "**a**: Alpha server" in section
+        assert "**b**: stdio server (y)" in section
+        assert len(calls) == 1
+
+    def test_format_message_blocks(self):
+        from orchestrator.prompt import _format_message
+
+        assert _format_message({"role": "user", "content": "  hi  "}) == "**User:** hi"
+        assert _format_message({"role": "assistant", "content": ""}) is None
+        assert _format_message({"role": "assistant", "content": [
+            {"type": "text", "text": "Checking."},
+            {"type": "tool_use", "name": "read_file"},
+            "stray",
+        ]}) == "**Assistant:** Checking. [used tool: read_file]"
+        assert _format_message({"role": "user", "content": [
+            {"type": "tool_result", "content": [{"type": "text", "text": "a"}, {"type": "text", "text": "b"}]},
+        ]}) == "**User:** [tool result: a b]"
+
+    def test_prompt_blocks_mark_static_prefix(self):
+        from orchestrator.prompt import build_system_prompt, build_system_prompt_blocks
+        from orchestrator.config import OrchestratorConfig
+
+        config = OrchestratorConfig(project_dir="/tmp/test", memory_path="/tmp/nonexistent")
+        static, dynamic = build_system_prompt_blocks(config, context={})
+
+        assert static["cache_control"] == {"type": "ephemeral"}
+        assert "cache_control" not in dynamic
+        assert "## Memory System" in static["text"]
+        assert "## Active Agent Sessions" in dynamic["text"]
+        assert build_system_prompt(config, context={}) == (
+            static["text"] + "\n\n" + dynamic["text"]
+        )
+
+    def test_mcp_section_rerenders_on_config_change(self, tmp_path, monkeypatch):
+        from orchestrator import prompt as prompt_mod
+        from utils import mcp_config
+
+        monkeypatch.setattr(mcp_config, "get_project_dir", lambda: tmp_path)
+        monkeypatch.setenv("CLAUDE_CONFIG_DIR", str(tmp_path))
+        prompt_mod._render_mcp_section_cached.cache_clear()
+
+        assert "_(none configured for this project)_" in prompt_mod._mcp_section()
+        (tmp_path / ".mcp.json").write_text(json.dumps({"mcpServers": {"obs": {"command": "obs-mcp"}}}))
+        assert "**obs**: stdio server (obs-mcp)" in prompt_mod._mcp_section()
+
+    def test_mcp_section_caches_missing_config(self, tmp_path, monkeypatch):
+        from orchestrator import prompt as prompt_mod
+        from utils import mcp_config
+
+        monkeypatch.setattr(mcp_config, "get_project_dir", lambda: tmp_path)
+        monkeypatch.setenv("CLAUDE_CONFIG_DIR", str(tmp_path))
+        prompt_mod._render_mcp_section_cached.cache_clear()
+        calls = []
+        real_load = prompt_mod.load_available_mcps
+        monkeypatch.setattr(
+            prompt_mod, "load_available_mcps",
+            lambda: calls.append(1) or real_load(),
+        )
+
+        first = prompt_mod._mcp_section()
+        assert prompt_mod._mcp_section() is first
+        assert len(calls) == 1
+
+    def test_static_prefix_reused_across_builds(self):
+        from orchestrator.prompt import build_system_prompt_blocks
+        from orchestrator.config import OrchestratorConfig
+
+        config = OrchestratorConfig(project_dir="/tmp/test", memory_path="/tmp/nonexistent")
+        first = build_system_prompt_blocks(config, context={})[0]["text"]
+        second = build_system_prompt_blocks(config, context={})[0]["text"]
+        assert first is second
+
+        other = OrchestratorConfig(project_dir="/tmp/test", memory_path="/tmp/other.md")
+        assert "/tmp/other.md" in build_system_prompt_blocks(other, context={})[0]["text"]
+
+    def test_prompt_budgets_cap_memory(self, tmp_path):
+        from orchestrator.prompt import PromptBudgets, build_system_prompt
+        from orchestrator.config import OrchestratorConfig
+
+        mem_file = tmp_path / "ORCHESTRATOR_MEMORY.md"
+        mem_file.write_text("keep" + "x" * 200 + "TAIL")
+        config = OrchestratorConfig(project_dir=str(tmp_path), memory_path=str(mem_file))
+
+        assert "TAIL" in build_system_prompt(config, context={})
+        small = build_system_prompt(
+            config, context={}, budgets=PromptBudgets(max_memory_chars=50),
+        )
+        assert "TAIL" not in small
+        assert "keep" in small and "... (truncated)" in small
+
+    def test_voice_budgets_inline_only_memory_index_head(self, tmp_path):
+        from orchestrator.prompt import VOICE_PROMPT_BUDGETS, build_system_prompt
+        from orchestrator.config import OrchestratorConfig
+
+        lines = [f"- entry {i}: " + "x" * 60 for i in range(400)]
+        (tmp_path / "MEMORY.md").write_text("\n".join(lines) + "\n")
+        config = OrchestratorConfig(
+            project_dir=str(tmp_path),
+            memory_path=str(tmp_path / "ORCHESTRATOR_MEMORY.md"),
+        )
+
+        text = build_system_prompt(config, context={})
+        voice = build_system_prompt(config, context={}, budgets=VOICE_PROMPT_BUDGETS)
+        assert lines[-1] in text
+        assert lines[0] in voice and lines[-1] not in voice
+        assert "read MEMORY.md starting at line" in voice
+
     def test_provider_memory_omitted_when_not_voice(self, tmp_path):
         """In text/audio mode (no voice_provider_id), the provider file must
         never be injected, even if it exists on disk."""
@@ -813,6 +1147,109 @@ class TestOrchestratorAgent:
         assert "HELLO" in tool_results[0].output
         assert len(text_completes) == 1
 
+        block = agent.history[1]["content"][0]
+        assert block == {
+            "type": "tool_use", "id": "tc1", "name": "test_tool", "input": {"x": "hello"},
+        }
+
+    @pytest.mark.asyncio
+    async def test_text_deltas_are_coalesced(self):
+        from orchestrator.agent import OrchestratorAgent
+        from orchestrator.config import OrchestratorConfig
+
+        config = OrchestratorConfig(project_dir="/tmp/test", memory_path="/tmp/nonexistent")
+        pieces = [f"t{i} " for i in range(20)]
+        provider = _MockProvider([
+            [TextDelta(text=p) for p in pieces]
+            + [TextComplete(text="".join(pieces)), TurnComplete(input_tokens=1, output_tokens=1)],
+        ])
+        agent = OrchestratorAgent(config, ToolRegistry(), provider, context={})
+
+        collected = [e async for e in agent.run("Hi")]
+
+        deltas = [e for e in collected if isinstance(e, TextDelta)]
+        assert 1 < len(deltas) < len(pieces)
+        assert "".join(d.text for d in deltas) == "".join(pieces)
+        # All buffered text is flushed before the completion event.
+        assert isinstance(collected[collected.index(deltas[-1]) + 1], TextComplete)
+
+    @pytest.mark.asyncio
+    async def test_tool_batch_streams_results_and_heartbeats(self, monkeypatch):
+        from orchestrator import agent as agent_mod
+        from orchestrator.agent import OrchestratorAgent
+        from orchestrator.config import OrchestratorConfig
+
+        monkeypatch.setattr(agent_mod, "HEARTBEAT_INTERVAL", 0.0)
+        config = OrchestratorConfig(project_dir="/tmp/test", memory_path="/tmp/nonexistent")
+        reg = ToolRegistry()
+
+        @reg.register(
+            name="slow",
+            description="Slow",
+            input_schema={"type": "object", "properties": {"delay": {"type": "number"}}},
+        )
+        async def slow(context, delay):
+            await asyncio.sleep(delay)
+            return json.dumps({"slept": delay})
+
+        calls = [
+            ToolUseStart(tool_call_id="a", tool_name="slow", tool_input={"delay": 0.6}),
+            ToolUseStart(tool_call_id="b", tool_name="slow", tool_input={"delay": 0.0}),
+        ]
+        agent = OrchestratorAgent(config, reg, _MockProvider([]), context={})
+
+        collected = [e async for e in agent._execute_tools_streaming(calls)]
+
+        executing = [e for e in collected if isinstance(e, ToolExecutingEvent)]
+        results = [e for e in collected if isinstance(e, ToolResultEvent)]
+        progress = [e for e in collected if isinstance(e, ToolProgressEvent)]
+        assert [e.tool_call_id for e in executing] == ["a", "b"]
+        assert [e.tool_call_id for e in results] == ["b", "a"]
+        assert progress and all(e.tool_call_id == "a" for e in progress)
+        assert set(agent._last_tool_results) == {"a", "b"}
+
+    @pytest.mark.asyncio
+    async def test_interrupt_cancels_running_tools(self):
+        from orchestrator.agent import OrchestratorAgent
+        from orchestrator.config import OrchestratorConfig
+
+        config = OrchestratorConfig(project_dir="/tmp/test", memory_path="/tmp/nonexistent")
+        reg = ToolRegistry()
+        started = asyncio.Event()
+        cancelled = asyncio.Event()
+
+        @reg.register(name="hang", description="Hang", input_schema={"type": "object", "properties": {}})
+        async def hang(context):
+            started.set()
+            try:
+                await asyncio.sleep(60)
+            except asyncio.CancelledError:
+                cancelled.set()
+                raise
+            return "never"
+
+        agent = OrchestratorAgent(config, reg, _MockProvider([]), context={})
+        calls = [ToolUseStart(tool_call_id="h", tool_name="hang", tool_input={})]
+
+        collected = []
+        async for event in agent._execute_tools_streaming(calls):
+            collected.append(event)
+            await started.wait()
+            await agent.interrupt()
+
+        assert isinstance(collected[-1], ErrorEvent)
+        assert collected[-1].error == "interrupted"
+        await asyncio.wait_for(cancelled.wait(), timeout=1.0)
+
+    def test_is_error_result(self):
+        from orchestrator.agent import _is_error_result
+
+        assert _is_error_result(json.dumps({"error": "boom"}))
+        assert _is_error_result('  {"path": "x", "error": "bad"}')
+        assert not _is_error_result(json.dumps({"result": "ok"}))
+        assert not _is_error_result("plain text mentioning an error")
+        assert not _is_error_result('{"error": truncated')
+
 
 # ---------------------------------------------------------------------------
 # Session persistence tests
@@ -1000,6 +1437,52 @@ class TestSessionPoolOrchestrator:
         assert pool.orchestrator_id is None
         mock_session.stop.assert_called_once()
 
+    @pytest.mark.asyncio
+    async def test_send_closed_early_closes_stream_and_lock(self):
+        from api.pool import SessionPool
+        from manager.types import TextDelta
+
+        pool = SessionPool()
+        closed = []
+
+        async def _send(text):
+            try:
+                yield TextDelta(text="a")
+                yield TextDelta(text="b")
+            finally:
+                closed.append(True)
+
+        sm = MagicMock()
+        sm.send = _send
+        pool._sessions["a1"] = sm
+        pool._locks["a1"] = asyncio.Lock()
+
+        stream = pool.send("a1", "hi")
+        assert isinstance(await stream.__anext__(), TextDelta)
+        await stream.aclose()
+        assert closed == [True]
+        assert not pool._locks["a1"].locked()
+
+    @pytest.mark.asyncio
+    async def test_send_skips_serialization_without_subscribers(self):
+        from api.pool import SessionPool
+        from manager.types import TextDelta
+
+        pool = SessionPool()
+
+        async def _send(text):
+            yield TextDelta(text="a")
+
+        sm = MagicMock()
+        sm.send = _send
+        pool._sessions["a1"] = sm
+        pool._locks["a1"] = asyncio.Lock()
+
+        with patch("api.pool.serialize_event") as ser:
+            events = [e async for e in pool.send("a1", "hi")]
+        assert events == [TextDelta(text="a")]
+        ser.assert_not_called()
+
 
 # ---------------------------------------------------------------------------
 # Serializer tests
@@ -1,5 +1,6 @@
 """Tests for orchestrator persistence (JSONL history loading)."""
 
+import asyncio
 import json
 import tempfile
 from pathlib import Path
@@ -206,6 +207,37 @@ def test_history_loader_invalid_json():
         jsonl_path.unlink()
 
 
+
+def test_history_loader_tolerates_crlf_and_blank_lines(tmp_path):
+    jsonl_path = tmp_path / "session.jsonl"
+    user = json.dumps({"type": "user", "message": {"role": "user", "content": "Hi"}})
+    reply = json.dumps({"type": "assistant", "message": {"role": "assistant", "content": "Hello"}})
+    jsonl_path.write_bytes(f"{user}\r\n  \n\n{reply}".encode())
+
+    entries = HistoryLoader(jsonl_path)._read_jsonl()
+    assert [e["type"] for e in entries] == ["user", "assistant"]
+
+
+def test_history_loader_snapshot_reused_until_jsonl_changes(tmp_path, monkeypatch):
+    monkeypatch.setattr(HistoryLoader, "SNAPSHOT_MIN_BYTES", 0)
+    jsonl_path = tmp_path / "session.jsonl"
+    writer = HistoryWriter(jsonl_path)
+    writer.append({"type": "user", "message": {"role": "user", "content": "Hi"}})
+
+    first = HistoryLoader(jsonl_path).load()
+    assert jsonl_path.with_suffix(".history.json").is_file()
+
+    def _no_replay(self):
+        raise AssertionError("unchanged JSONL should load from the snapshot")
+
+    monkeypatch.setattr(HistoryLoader, "_read_jsonl", _no_replay)
+    assert HistoryLoader(jsonl_path).load() == first
+
+    monkeypatch.undo()
+    monkeypatch.setattr(HistoryLoader, "SNAPSHOT_MIN_BYTES", 0)
+    writer.append({"type": "assistant", "message": {"role": "assistant", "content": "Hello"}})
+    assert [m["role"] for m in HistoryLoader(jsonl_path).load()] == ["user", "assistant"]
+
 def test_history_loader_recovers_concatenated_objects():
     """Lines like ``}{`` produced by a pre-fix bug (process killed before
     flushing the trailing ``\\n``) should still load — both objects get
@@ -262,6 +294,110 @@ def test_history_writer_atomic_appends():
         jsonl_path.unlink()
 
 
+@pytest.mark.asyncio
+async def test_history_writer_batches_inside_event_loop(tmp_path):
+    """Inside a running loop, appends are buffered and land together in one
+    write once the flush interval elapses (or on an explicit flush)."""
+    jsonl_path = tmp_path / "session.jsonl"
+    writer = HistoryWriter(jsonl_path)
+    for i in range(3):
+        writer.append({"type": "user", "i": i})
+    assert not jsonl_path.exists()
+
+    await asyncio.sleep(HistoryWriter.FLUSH_INTERVAL * 3)
+    # The timer handed the batch to the writer thread; aflush() waits for it.
+    assert writer._pending_count == 0
+    await writer.aflush()
+    assert jsonl_path.read_bytes().count(b"\n") == 3
+
+    writer.append({"type": "user", "i": 3})
+    await writer.aclose()
+    assert writer._fd is None
+    lines = [json.loads(line) for line in jsonl_path.read_text().splitlines()]
+    assert [line["i"] for line in lines] == [0, 1, 2, 3]
+
+
+@pytest.mark.asyncio
+async def test_history_writer_flushes_full_batch_immediately(tmp_path):
+    jsonl_path = tmp_path / "session.jsonl"
+    writer = HistoryWriter(jsonl_path)
+    for i in range(HistoryWriter.FLUSH_COUNT):
+        writer.append({"type": "user", "i": i})
+    assert writer._pending_count == 0
+    assert writer._flush_handle is None
+    await asyncio.wrap_future(writer._inflight)
+    assert jsonl_path.read_bytes().count(b"\n") == HistoryWriter.FLUSH_COUNT
+
+
+
+def test_history_writer_reuses_append_fd_until_closed(tmp_path):
+    jsonl_path = tmp_path / "session.jsonl"
+    writer = HistoryWriter(jsonl_path)
+    writer.append({"type": "user", "i": 0})
+    fd = writer._fd
+    assert fd is not None
+    writer.append({"type": "user", "i": 1})
+    assert writer._fd == fd
+
+    writer.close()
+    assert writer._fd is None
+    writer.append({"type": "user", "i": 2})
+    writer.close()
+    lines = [json.loads(line) for line in jsonl_path.read_text().splitlines()]
+    assert [line["i"] for line in lines] == [0, 1, 2]
+
+
+def test_history_writer_falls_back_to_stdlib_json(tmp_path):
+    """Records orjson rejects (lone surrogates, >64-bit ints) still land."""
+    jsonl_path = tmp_path / "session.jsonl"
+    writer = HistoryWriter(jsonl_path)
+    writer.append({"type": "user", "content": "bad \ud800 text"})
+    writer.append({"type": "tool_use", "input": {"n": 2**70}})
+    writer.close()
+    lines = [json.loads(line) for line in jsonl_path.read_text().splitlines()]
+    assert lines[0]["content"] == "bad \ud800 text"
+    assert lines[1]["input"]["n"] == 2**70
+
+
+def test_history_writer_creates_missing_directory(tmp_path):
+    jsonl_path = tmp_path / "sessions" / "nested" / "session.jsonl"
+    writer = HistoryWriter(jsonl_path)
+    writer.append({"type": "user", "i": 0})
+    writer.close()
+    assert jsonl_path.read_bytes().count(b"\n") == 1
+
+@pytest.mark.asyncio
+async def test_session_turn_end_flushes_history(tmp_path):
+    """A finished text turn is handed to the writer without waiting for the
+    flush timer."""
+    from orchestrator.config import OrchestratorConfig
+    from orchestrator.session import OrchestratorSession
+    from orchestrator.types import TextComplete, ToolUseStart
+
+    class _Agent:
+        async def run(self, prompt):
+            yield TextComplete(text="checking")
+            yield ToolUseStart(tool_call_id="t1", tool_name="x", tool_input={})
+            yield TextComplete(text="done")
+
+    session = OrchestratorSession(
+        config=OrchestratorConfig(
+            project_dir=str(tmp_path), memory_path=str(tmp_path / "mem.md"),
+        ),
+        context={},
+    )
+    session._jsonl_path = tmp_path / "session.jsonl"
+    session._writer = HistoryWriter(session._jsonl_path)
+    session._agent = _Agent()
+
+    async for _ in session.send("hi"):
+        pass
+    assert session._writer._pending_count == 0
+    await asyncio.wrap_future(session._writer._inflight)
+    entries = [json.loads(line) for line in session._jsonl_path.read_text().splitlines()]
+    assert [e["type"] for e in entries] == ["user", "tool_use", "assistant"]
+    assert entries[-1]["message"]["content"] == "checking\ndone"
+
 def test_history_loader_multiple_tool_calls():
     """Test loading conversation with multiple sequential tool calls."""
     with tempfile.NamedTemporaryFile(mode="w", suffix=".jsonl", delete=False) as f:
@@ -0,0 +1,65 @@
+"""Unit tests for the warm-server client in ``orchestrator/tools/search.py``.
+
+The server itself is stubbed: ``_ensure_server`` / ``_query_server`` are
+replaced so the tests exercise only request coalescing and fallback.
+"""
+
+from __future__ import annotations
+
+import asyncio
+
+import pytest
+
+from orchestrator.tools import search
+
+
+@pytest.fixture
+def sent(monkeypatch):
+    requests: list[dict] = []
+
+    async def fake_ensure():
+        return object()
+
+    async def fake_query(proc, request, *, timeout=30.0):
+        requests.append(request)
+        await asyncio.sleep(0)
+        if request.get("command") == "query_many":
+            return {"replies": [{"results": [{"text": q["query"]}]} for q in request["queries"]]}
+        return {"results": [{"text": request["query"]}]}
+
+    # Module-level lock binds to whichever loop first contends on it.
+    monkeypatch.setattr(search, "_query_lock", asyncio.Lock())
+    monkeypatch.setattr(search, "_pending_searches", [])
+    monkeypatch.setattr(search, "_ensure_server", fake_ensure)
+    monkeypatch.setattr(search, "_query_server", fake_query)
+    return requests
+
+
+async def test_concurrent_searches_share_one_round_trip(sent):
+    results = await asyncio.gather(
+        *(search._do_search(f"q{i}", "memory", 5) for i in range(3))
+    )
+    assert results == [[{"text": "q0"}], [{"text": "q1"}], [{"text": "q2"}]]
+    assert [r.get("command") for r in sent] == ["query_many"]
+
+
+async def test_single_search_uses_plain_query(sent):
+    assert await search._do_search("solo", "history", 5) == [{"text": "solo"}]
+    assert sent == [{"query": "solo", "collection": "history", "n_results": 5}]
+
+
+async def test_batch_falls_back_per_request_on_unknown_command(monkeypatch, sent):
+    plain = search._query_server
+
+    async def old_server(proc, request, *, timeout=30.0):
+        if request.get("command") == "query_many":
+            sent.append(request)
+            return {"error": "Unknown command: query_many"}
+        return await plain(proc, request, timeout=timeout)
+
+    monkeypatch.setattr(search, "_query_server", old_server)
+    results = await asyncio.gather(
+        search._do_search("a", "memory", 5), search._do_search("b", "memory", 5),
+    )
+    assert results == [[{"text": "a"}], [{"text": "b"}]]
+    assert [r.get("command", "query") for r in sent] == ["query_many", "query", "query"]
@@ -1,9 +1,10 @@
-"""Integration tests for the warm search-server: protocol, lockfile,
-socket transport, and the IndexFacade client.
+"""Tests for the warm search-server: protocol, lockfile, socket transport,
+and the IndexFacade client.
 
-These tests spawn the real server as a subprocess against a temp index
+Most tests spawn the real server as a subprocess against a temp index
 dir. They are integration tests — slow (~10s each because of model
-load), but they verify the whole pipeline end-to-end.
+load), but they verify the whole pipeline end-to-end. The embedding
+caches are unit-tested in-process against a stub model at the bottom.
 """
 from __future__ import annotations
 
@@ -14,7 +15,9 @@ import signal
 import socket
 import subprocess
 import sys
+import threading
 import time
+from collections import OrderedDict
 from pathlib import Path
 
 import pytest
@@ -23,7 +26,10 @@ PROJECT_DIR = Path(__file__).resolve().parent.parent
 SERVER_SCRIPT = PROJECT_DIR / "default-scripts" / "search-server.py"
 SCRIPTS_DIR = PROJECT_DIR / "default-scripts"
 
-pytestmark = [pytest.mark.slow, pytest.mark.timeout(240)]
+
+def _integration(test):
+    """Mark a test that spawns the real server (model load included)."""
+    return pytest.mark.slow(pytest.mark.timeout(240)(test))
 
 
 def _make_shim(index_dir: Path) -> str:
@@ -105,6 +111,7 @@ def _shutdown(proc: subprocess.Popen) -> None:
 
 # ── Stdio tests ──────────────────────────────────────────────────────────────
 
+@_integration
 def test_stdio_ping(index_dir):
     proc = _spawn_server(index_dir)
     try:
@@ -116,6 +123,7 @@ def test_stdio_ping(index_dir):
         _shutdown(proc)
 
 
+@_integration
 def test_stdio_add_and_query(index_dir):
     proc = _spawn_server(index_dir)
     try:
@@ -149,6 +157,7 @@ def test_stdio_add_and_query(index_dir):
         _shutdown(proc)
 
 
+@_integration
 def test_stdio_delete_ids(index_dir):
     proc = _spawn_server(index_dir)
     try:
@@ -169,6 +178,7 @@ def test_stdio_delete_ids(index_dir):
         _shutdown(proc)
 
 
+@_integration
 def test_stdio_delete_where(index_dir):
     proc = _spawn_server(index_dir)
     try:
@@ -189,6 +199,7 @@ def test_stdio_delete_where(index_dir):
         _shutdown(proc)
 
 
+@_integration
 def test_stdio_reset_collection(index_dir):
     proc = _spawn_server(index_dir)
     try:
@@ -209,6 +220,7 @@ def test_stdio_reset_collection(index_dir):
 
 # ── Socket tests ─────────────────────────────────────────────────────────────
 
+@_integration
 def test_socket_concurrent_clients(index_dir):
     """Two simultaneous socket clients writing in parallel should both
     succeed without corrupting the index. This is the scenario the
@@ -271,6 +283,7 @@ def test_socket_concurrent_clients(index_dir):
 
 # ── Lockfile tests ───────────────────────────────────────────────────────────
 
+@_integration
 def test_lockfile_prevents_second_server(index_dir):
     """A second server pointing at the same index should refuse to start."""
     p1 = _spawn_server(index_dir)
@@ -290,6 +303,7 @@ def test_lockfile_prevents_second_server(index_dir):
         _shutdown(p1)
 
 
+@_integration
 def test_lockfile_released_on_shutdown(index_dir):
     """After the first server shuts down, a second should start fine."""
     p1 = _spawn_server(index_dir)
@@ -303,3 +317,154 @@ def test_lockfile_released_on_shutdown(index_dir):
         assert r["status"] == "ready"
     finally:
         _shutdown(p2)
+
+
+# ── Embedding caches (in-process, stub model) ───────────────────────────────
+
+def _load_server_module():
+    import importlib.util
+
+    spec = importlib.util.spec_from_file_location("search_server_unit", SERVER_SCRIPT)
+    mod = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(mod)
+    return mod
+
+
+class _StubModel:
+    """Stands in for SentenceTransformer: deterministic float32 vectors
+    derived from the text, recording every batch it is asked to encode."""
+
+    def __init__(self):
+        self.calls: list[list[str]] = []
+
+    def encode(self, texts):
+        import numpy as np
+
+        self.calls.append(list(texts))
+        return np.array(
+            [[len(t), sum(map(ord, t)) / 7.0, 0.1] for t in texts], dtype=np.float32
+        )
+
+
+@pytest.fixture
+def search_server():
+    pytest.importorskip("numpy")
+    return _load_server_module()
+
+
+@pytest.fixture
+def unit_server(search_server, tmp_path):
+    """An IndexServer wired to a stub model and a temp embedding cache,
+    without opening chroma or loading the real model."""
+    srv = search_server.IndexServer.__new__(search_server.IndexServer)
+    srv.client = None
+    srv.model = _StubModel()
+    srv.embedding_cache = search_server.EmbeddingCache(
+        tmp_path / "cache.sqlite", "stub-model"
+    )
+    srv._write_lock = threading.Lock()
+    srv._query_cache = OrderedDict()
+    srv._query_cache_lock = threading.Lock()
+    return srv
+
+
+def test_embedding_cache_round_trip_is_bit_identical(search_server, tmp_path):
+    import numpy as np
+
+    cache = search_server.EmbeddingCache(tmp_path / "cache.sqlite", "m")
+    vectors = np.array([[0.1, -2.5, 3.3333333], [1e-8, 7.0, -0.2]], dtype=np.float32)
+    cache.put_many(["a", "b"], vectors)
+
+    got = cache.get_many(["b", "missing", "a"])
+    assert got[1] is None
+    assert np.array_equal(np.asarray(got[0], dtype=np.float32), vectors[1])
+    assert np.array_equal(np.asarray(got[2], dtype=np.float32), vectors[0])
+    assert np.asarray(got[2], dtype=np.float32).tobytes() == vectors[0].tobytes()
+
+
+def test_embedding_cache_is_keyed_by_model(search_server, tmp_path):
+    path = tmp_path / "cache.sqlite"
+    search_server.EmbeddingCache(path, "model-a").put_many(["t"], [[1.0, 2.0]])
+    search_server.EmbeddingCache(path, "model-b").put_many(["t"], [[3.0, 4.0]])
+
+    assert search_server.EmbeddingCache(path, "model-a").get_many(["t"]) == [[1.0, 2.0]]
+    assert search_server.EmbeddingCache(path, "model-b").get_many(["t"]) == [[3.0, 4.0]]
+    assert search_server.EmbeddingCache(path, "model-c").get_many(["t"]) == [None]
+
+
+def test_embedding_cache_prunes_least_recently_used(search_server, tmp_path):
+    cache = search_server.EmbeddingCache(tmp_path / "cache.sqlite", "m", max_entries=2)
+    cache.put_many(["old"], [[1.0]])
+    cache.put_many(["kept"], [[2.0]])
+    cache.get_many(["old"])  # refreshes "old", leaving "kept" as the LRU row
+    cache.put_many(["new"], [[3.0]])
+
+    assert cache.get_many(["old", "kept", "new"]) == [[1.0], None, [3.0]]
+
+
+def test_encode_many_only_encodes_cache_misses(unit_server):
+    first = unit_server._encode_many(["alpha", "beta"])
+    assert unit_server.model.calls == [["alpha", "beta"]]
+
+    second = unit_server._encode_many(["beta", "gamma", "alpha"])
+    assert unit_server.model.calls[-1] == ["gamma"]
+    assert second[0] == first[1]
+    assert second[2] == first[0]
+    assert second[1] == unit_server.model.encode(["gamma"])[0].tolist()
+
+
+def test_query_embedding_hit_skips_encode(unit_server):
+    first = unit_server._query_embeddings(["where is the config"])
+    assert len(unit_server.model.calls) == 1
+
+    assert unit_server._query_embeddings(["where is the config"]) == first
+    assert len(unit_server.model.calls) == 1
+
+
+def test_query_embedding_hit_moves_to_end(unit_server):
+    unit_server._query_embeddings(["a", "b", "c"])
+    unit_server._query_embeddings(["a"])
+    assert list(unit_server._query_cache) == ["b", "c", "a"]
+
+
+def test_query_embedding_cache_evicts_oldest(search_server, unit_server, monkeypatch):
+    monkeypatch.setattr(search_server, "QUERY_CACHE_SIZE", 2)
+    unit_server._query_embeddings(["a", "b"])
+    unit_server._query_embeddings(["a"])  # "b" is now least recently used
+    unit_server._query_embeddings(["c"])
+    assert list(unit_server._query_cache) == ["a", "c"]
+
+    unit_server._query_embeddings(["b"])
+    assert unit_server.model.calls[-1] == ["b"]
+
+
+def test_query_embedding_batch_encodes_duplicates_once(unit_server):
+    embs = unit_server._query_embeddings(["x", "y", "x", "x"])
+    assert unit_server.model.calls == [["x", "y"]]
+    assert embs[0] == embs[2] == embs[3]
+    assert embs[0] != embs[1]
+
+
+def test_query_many_rejects_command_items(unit_server, monkeypatch):
+    handled = []
+    monkeypatch.setattr(
+        unit_server, "_handle_query",
+        lambda q: handled.append(q["query"]) or {"results": [], "error": None},
+    )
+    monkeypatch.setattr(
+        unit_server, "_reset_collection",
+        lambda name: pytest.fail("query_many must not dispatch commands"),
+    )
+
+    reply = unit_server.handle({"command": "query_many", "queries": [
+        {"query": "ok", "collection": "memory"},
+        {"command": "reset_collection", "name": "memory", "query": "sneaky"},
+        {"command": "query_many", "queries": [{"query": "nested"}]},
+    ]})
+
+    assert reply["error"] is None
+    assert reply["replies"][0] == {"results": [], "error": None}
+    assert reply["replies"][1]["error"] and reply["replies"][2]["error"]
+    assert handled == ["ok"]
+    # Only the plain item's text reached the encoder.
+    assert unit_server.model.calls == [["ok"]]
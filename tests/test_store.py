@@ -271,6 +271,27 @@ class TestSessionStoreListSessionsCache:
         assert renamed.title == "Custom name"
 
 
+    def test_get_session_info_uses_cache(self, store_dir):
+        project_dir, context_dir = store_dir
+        store = self._make_store(project_dir, n_sessions=2)
+        assert store.get_session_info("sess0").session_id == "sess0"
+
+        with patch.object(SessionStore, "_parse_session_info", wraps=store._parse_session_info) as spy:
+            store.rename_session("sess0", "Renamed")
+            info = store.get_session_info("sess0")
+            assert spy.call_count == 0
+        assert info.title == "Renamed"
+
+    def test_get_session_infos_loads_titles_once(self, store_dir):
+        project_dir, context_dir = store_dir
+        store = self._make_store(project_dir, n_sessions=3)
+        with patch.object(SessionStore, "_load_titles", wraps=store._load_titles) as spy:
+            infos = store.get_session_infos(["sess0", "sess2", "missing"])
+            assert spy.call_count == 1
+        assert sorted(infos) == ["sess0", "sess2"]
+        assert infos["sess2"].session_id == "sess2"
+
+
 class TestSessionStoreGetSession:
     @pytest.fixture
     def populated_store(self, tmp_path):
@@ -348,6 +369,20 @@ class TestSessionStoreDeleteSession:
             assert not (context_dir / "del.jsonl").exists()
             assert (context_dir / "trash" / "del.jsonl").is_file()
 
+    def test_delete_removes_history_snapshot(self, tmp_path):
+        context_dir = tmp_path / "context"
+        context_dir.mkdir(parents=True)
+        (context_dir / "snap.jsonl").write_text("{}")
+        (context_dir / "snap.history.json").write_text("{}")
+
+        with patch("utils.paths.PROJECT_ROOT", tmp_path):
+            store = SessionStore(tmp_path)
+
+            assert store.delete_session("snap", skip_index_cleanup=True) is True
+            assert not (context_dir / "snap.history.json").exists()
+            assert not (context_dir / "trash" / "snap.history.json").exists()
+            assert (context_dir / "trash" / "snap.jsonl").is_file()
+
     def test_delete_collision_keeps_both(self, tmp_path):
         context_dir = tmp_path / "context"
         context_dir.mkdir(parents=True)
@@ -384,8 +419,10 @@ class TestSessionStoreDeleteSession:
         with patch("utils.paths.PROJECT_ROOT", tmp_path):
             store = SessionStore(tmp_path)
 
-        # Mock the remove_session_from_index function
-        with mock_patch("manager.store.remove_session_from_index") as mock_remove:
+        # Mock the remove_session_from_index function; keep PROJECT_ROOT
+        # patched so the soft-delete lands in tmp_path's trash, not the repo's.
+        with patch("utils.paths.PROJECT_ROOT", tmp_path), \
+                mock_patch("manager.store.remove_session_from_index") as mock_remove:
             mock_remove.return_value = True
 
             # Delete the session
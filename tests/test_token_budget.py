@@ -14,6 +14,7 @@ from orchestrator.token_budget import (
     estimate_tokens,
     split_by_token_budget,
     summary_target_word_range,
+    tool_result_text,
     truncate_tool_results,
 )
 
@@ -43,6 +44,17 @@ class TestEstimate:
         assert t > 8  # overhead + text + tool_use fields
 
 
+    def test_tool_result_text_flattens_blocks(self):
+        assert tool_result_text("plain") == "plain"
+        assert tool_result_text([
+            {"type": "text", "text": "a"},
+            {"type": "image", "source": {}},
+            "junk",
+            {"type": "text", "text": "b"},
+        ]) == "a b"
+        assert tool_result_text(None) == "None"
+
+
 class TestTruncateToolResults:
     def test_small_result_unchanged(self):
         msgs = [{
@@ -89,6 +101,35 @@ class TestTruncateToolResults:
         assert isinstance(out[0]["content"][0]["content"], str)
         assert out[0]["content"][0]["content"].endswith(TOOL_RESULT_TRUNCATE_SUFFIX)
 
+    def test_multiline_result_drops_noise_before_clipping(self):
+        noisy = "\n".join(
+            ["Building project", "=" * 40, ""]
+            + [f"[{i}/300] compiling" for i in range(300)]
+            + ["", "error: src/main.py:42 undefined name 'foo'"]
+        )
+        assert len(noisy) > TOOL_RESULT_TRUNCATE_CHARS
+        msgs = [{
+            "role": "user",
+            "content": [{"type": "tool_result", "tool_use_id": "x", "content": noisy}],
+        }]
+        result = truncate_tool_results(msgs)[0]["content"][0]["content"]
+        assert result == (
+            "Building project\nerror: src/main.py:42 undefined name 'foo'"
+            "\n... (303 lines pruned)"
+        )
+
+    def test_multiline_result_keeps_head_and_tail(self):
+        lines = [f"line {i}: " + "x" * 30 for i in range(100)]
+        msgs = [{
+            "role": "user",
+            "content": [{"type": "tool_result", "tool_use_id": "x", "content": "\n".join(lines)}],
+        }]
+        result = truncate_tool_results(msgs)[0]["content"][0]["content"]
+        assert result.startswith(lines[0] + "\n")
+        assert "lines pruned" in result
+        assert lines[-1] + TOOL_RESULT_TRUNCATE_SUFFIX in result
+        assert len(result) <= TOOL_RESULT_TRUNCATE_CHARS + len(TOOL_RESULT_TRUNCATE_SUFFIX) + 40
+
     def test_text_blocks_preserved(self):
         msgs = [{
             "role": "assistant",
@@ -329,3 +370,35 @@ class TestVoiceSessionUpdateReloadsHistory:
         assert "NEWLY_SPOKEN_MESSAGE" in update2["system"], (
             "Second get_session_update must reload history from JSONL"
         )
+
+    @pytest.mark.asyncio
+    async def test_unchanged_jsonl_skips_history_reload(self, tmp_path, monkeypatch):
+        from orchestrator import session as session_mod
+        from orchestrator.config import OrchestratorConfig
+
+        cfg = OrchestratorConfig(
+            project_dir=str(tmp_path),
+            memory_path=str(tmp_path / "memory.md"),
+        )
+        sess = session_mod.OrchestratorSession(config=cfg, context={}, voice=True)
+        sess._jsonl_path = tmp_path / "s.jsonl"
+        sess._jsonl_path.write_text(
+            '{"type":"user","message":{"role":"user","content":"hi"}}\n'
+        )
+
+        loads = []
+        real_load = session_mod.HistoryLoader.load
+        monkeypatch.setattr(
+            session_mod.HistoryLoader, "load",
+            lambda self: loads.append(1) or real_load(self),
+        )
+
+        first = await sess._build_history_for_prompt()
+        assert await sess._build_history_for_prompt() == first
+        assert len(loads) == 1
+
+        with open(sess._jsonl_path, "a") as f:
+            f.write('{"type":"user","message":{"role":"user","content":"again"}}\n')
+        recent, _ = await sess._build_history_for_prompt()
+        assert len(loads) == 2
+        assert recent[-1]["content"] == "again"
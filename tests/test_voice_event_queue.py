@@ -0,0 +1,87 @@
+"""Unit tests for ``VoiceEventQueue`` (``orchestrator/providers/voice_base.py``).
+
+Mirrored provider events are injected even when no agent loop drains the
+queue, so it is bounded and ``offer`` never blocks:
+
+1. Below the cap, events queue in order.
+2. At the cap, a new transcript delta is dropped.
+3. At the cap, any other event evicts the oldest queued transcript delta,
+   and only evicts a non-delta event when no delta is queued.
+4. ``next_event`` takes buffered events directly and times out when idle.
+"""
+
+from __future__ import annotations
+
+import asyncio
+
+import pytest
+
+from orchestrator.providers.voice_base import VoiceEventQueue
+
+
+def _drain(q: VoiceEventQueue) -> list[dict]:
+    out = []
+    while not q.empty():
+        out.append(q.get_nowait())
+    return out
+
+
+def test_offer_queues_in_order_below_cap():
+    q = VoiceEventQueue(maxsize=4)
+    for i in range(3):
+        q.offer({"type": "x", "i": i})
+    assert [e["i"] for e in _drain(q)] == [0, 1, 2]
+    assert q.dropped == 0
+
+
+def test_transcript_delta_dropped_when_full():
+    q = VoiceEventQueue(maxsize=2)
+    q.offer({"type": "response.done", "i": 0})
+    q.offer({"type": "response.done", "i": 1})
+    q.offer({"type": "response.audio_transcript.delta", "delta": "hi"})
+    assert [e["i"] for e in _drain(q)] == [0, 1]
+    assert q.dropped == 1
+
+
+def test_critical_event_evicts_oldest_when_full():
+    q = VoiceEventQueue(maxsize=2)
+    q.offer({"type": "response.audio_transcript.delta", "i": 0})
+    q.offer({"type": "response.audio_transcript.delta", "i": 1})
+    q.offer({"type": "response.done", "i": 2})
+    assert [e["i"] for e in _drain(q)] == [1, 2]
+    assert q.dropped == 1
+
+
+def test_critical_event_evicts_oldest_delta_before_other_events():
+    q = VoiceEventQueue(maxsize=3)
+    q.offer({"type": "response.done", "i": 0})
+    q.offer({"type": "response.audio_transcript.delta", "i": 1})
+    q.offer({"type": "response.function_call_arguments.done", "i": 2})
+    q.offer({"type": "response.done", "i": 3})
+    assert [e["i"] for e in _drain(q)] == [0, 2, 3]
+
+
+def test_critical_event_evicts_oldest_when_no_delta_queued():
+    q = VoiceEventQueue(maxsize=2)
+    q.offer({"type": "response.done", "i": 0})
+    q.offer({"type": "response.done", "i": 1})
+    q.offer({"type": "response.done", "i": 2})
+    assert [e["i"] for e in _drain(q)] == [1, 2]
+    assert q.dropped == 1
+
+
+async def test_next_event_returns_buffered_then_times_out():
+    q = VoiceEventQueue()
+    q.offer({"type": "x"})
+    assert await q.next_event(timeout=0.01) == {"type": "x"}
+    with pytest.raises(asyncio.TimeoutError):
+        await q.next_event(timeout=0.01)
+
+
+async def test_next_event_wakes_on_offer():
+    q = VoiceEventQueue()
+    waiter = asyncio.ensure_future(q.next_event(timeout=1.0))
+    await asyncio.sleep(0)
+    q.offer({"type": "response.done"})
+    assert await waiter == {"type": "response.done"}
+    assert q.empty()
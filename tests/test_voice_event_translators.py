@@ -45,6 +45,22 @@ def _openai():
     return OpenAIVoiceProvider(model="gpt-realtime", voice="cedar")
 
 
+@pytest.mark.asyncio
+async def test_openai_create_message_merges_queued_deltas():
+    """Consecutive queued transcript deltas stream out as one TextDelta;
+    the event that ends the run is still translated after them."""
+    p = _openai()
+    for chunk in ("Hel", "lo", " there"):
+        await p.inject_event({"type": "response.output_audio_transcript.delta", "delta": chunk})
+    await p.inject_event({"type": "response.output_audio_transcript.done", "transcript": "Hello there"})
+    await p.inject_event({"type": "response.done", "response": {}})
+
+    events = [e async for e in p.create_message([], [], "")]
+
+    assert [type(e) for e in events] == [TextDelta, TextComplete, TurnComplete]
+    assert events[0].text == "Hello there"
+
+
 def test_openai_table_text_delta_both_keys():
     """GA + legacy beta both map to the same TextDelta translator."""
     p = _openai()
@@ -10,6 +10,7 @@ words, the assistant's reply, and any tool-call lifecycle entries.
 
 from __future__ import annotations
 
+import asyncio
 import json
 from pathlib import Path
 from unittest.mock import AsyncMock, MagicMock
@@ -17,18 +18,20 @@ from unittest.mock import AsyncMock, MagicMock
 import pytest
 
 from orchestrator.config import OrchestratorConfig
+from orchestrator.persistence import HistoryWriter
 from orchestrator.session import OrchestratorSession
 
 
-def _make_session(tmp_path: Path) -> OrchestratorSession:
+def _make_session(
+    tmp_path: Path, writer_cls: type[HistoryWriter]
+) -> OrchestratorSession:
     config = OrchestratorConfig(
         project_dir=str(tmp_path),
         memory_path=str(tmp_path / "mem.md"),
     )
     session = OrchestratorSession(config=config, context={}, voice=True)
-    from orchestrator.persistence import HistoryWriter
     session._jsonl_path = tmp_path / "session.jsonl"
-    session._writer = HistoryWriter(session._jsonl_path)
+    session._writer = writer_cls(session._jsonl_path)
     # The dispatch branches on provider_name == "google" so the mock
     # MUST report that.
     provider = MagicMock()
@@ -46,9 +49,11 @@ def _read_jsonl(path: Path) -> list[dict]:
 
 
 @pytest.mark.asyncio
-async def test_gemini_input_transcription_persists_voice_user_message(tmp_path):
+async def test_gemini_input_transcription_persists_voice_user_message(
+    tmp_path, write_through_history
+):
     """serverContent.inputTranscription.text → [voice] user JSONL entry."""
-    session = _make_session(tmp_path)
+    session = _make_session(tmp_path, write_through_history)
     await session.process_voice_event({
         "serverContent": {
             "inputTranscription": {"text": "what is two plus two"},
@@ -62,10 +67,10 @@ async def test_gemini_input_transcription_persists_voice_user_message(tmp_path):
 
 
 @pytest.mark.asyncio
-async def test_gemini_input_transcription_dropped_while_injecting(tmp_path):
+async def test_gemini_input_transcription_dropped_while_injecting(tmp_path, write_through_history):
     """While listen_recording injects replay audio, phantom transcripts
     are dropped — same behaviour as the OpenAI branch."""
-    session = _make_session(tmp_path)
+    session = _make_session(tmp_path, write_through_history)
     session.extend_injection_window(2.0)
     await session.process_voice_event({
         "serverContent": {"inputTranscription": {"text": "phantom"}},
@@ -75,9 +80,11 @@ async def test_gemini_input_transcription_dropped_while_injecting(tmp_path):
 
 
 @pytest.mark.asyncio
-async def test_gemini_output_transcription_stages_and_persists_on_turn_complete(tmp_path):
+async def test_gemini_output_transcription_stages_and_persists_on_turn_complete(
+    tmp_path, write_through_history
+):
     """outputTranscription deltas accumulate; turnComplete flushes them."""
-    session = _make_session(tmp_path)
+    session = _make_session(tmp_path, write_through_history)
     await session.process_voice_event({
         "serverContent": {"outputTranscription": {"text": "The answer "}},
     })
@@ -94,10 +101,10 @@ async def test_gemini_output_transcription_stages_and_persists_on_turn_complete(
 
 
 @pytest.mark.asyncio
-async def test_gemini_tool_call_executes_and_persists_lifecycle(tmp_path):
+async def test_gemini_tool_call_executes_and_persists_lifecycle(tmp_path, write_through_history):
     """toolCall.functionCalls[] → registry.execute() + JSONL tool_use/result
     + format_tool_result commands shipped back to relay."""
-    session = _make_session(tmp_path)
+    session = _make_session(tmp_path, write_through_history)
 
     # Stub the tool registry — execute() must be awaitable.
     from orchestrator.tools import registry
@@ -143,9 +150,48 @@ async def test_gemini_tool_call_executes_and_persists_lifecycle(tmp_path):
 
 
 @pytest.mark.asyncio
-async def test_gemini_interrupted_persists_voice_interrupted_entry(tmp_path):
+async def test_gemini_multiple_tool_calls_run_concurrently(
+    tmp_path, write_through_history, monkeypatch
+):
+    """Calls in one toolCall execute together; results keep call order."""
+    session = _make_session(tmp_path, write_through_history)
+    session._voice_provider.format_tool_result = MagicMock(
+        side_effect=lambda call_id, result: [{"id": call_id, "result": result}]
+    )
+    running = 0
+    peak = 0
+
+    async def _execute(name, args, context):
+        nonlocal running, peak
+        running += 1
+        peak = max(peak, running)
+        await asyncio.sleep(0.01 if name == "slow" else 0)
+        running -= 1
+        return name
+
+    from orchestrator.tools import registry
+    monkeypatch.setattr(registry, "execute", _execute)
+    commands = await session.process_voice_event({
+        "toolCall": {
+            "functionCalls": [
+                {"id": "c1", "name": "slow", "args": {}},
+                {"id": "c2", "name": "fast", "args": {}},
+            ],
+        },
+    })
+
+    assert peak == 2
+    assert commands == [{"id": "c1", "result": "slow"}, {"id": "c2", "result": "fast"}]
+    entries = _read_jsonl(session._jsonl_path)
+    assert [e["tool_call_id"] for e in entries if e.get("type") == "tool_use"] == ["c1", "c2"]
+
+
+@pytest.mark.asyncio
+async def test_gemini_interrupted_persists_voice_interrupted_entry(
+    tmp_path, write_through_history
+):
     """serverContent.interrupted → voice_interrupted JSONL entry."""
-    session = _make_session(tmp_path)
+    session = _make_session(tmp_path, write_through_history)
     await session.process_voice_event({"serverContent": {"interrupted": True}})
     entries = _read_jsonl(session._jsonl_path)
     interrupts = [e for e in entries if e.get("type") == "voice_interrupted"]
@@ -153,10 +199,10 @@ async def test_gemini_interrupted_persists_voice_interrupted_entry(tmp_path):
 
 
 @pytest.mark.asyncio
-async def test_gemini_branch_skipped_when_provider_is_not_google(tmp_path):
+async def test_gemini_branch_skipped_when_provider_is_not_google(tmp_path, write_through_history):
     """A Qwen/OpenAI provider must NOT take the Gemini branch even if
     the event happens to look Gemini-shaped (defensive)."""
-    session = _make_session(tmp_path)
+    session = _make_session(tmp_path, write_through_history)
     session._voice_provider.provider_name = "qwen"
     await session.process_voice_event({
         "serverContent": {"inputTranscription": {"text": "should not persist"}},
@@ -26,10 +26,13 @@ from unittest.mock import AsyncMock, MagicMock
 import pytest
 
 from orchestrator.config import OrchestratorConfig
+from orchestrator.persistence import HistoryWriter
 from orchestrator.session import OrchestratorSession
 
 
-def _make_session(tmp_path: Path) -> OrchestratorSession:
+def _make_session(
+    tmp_path: Path, writer_cls: type[HistoryWriter]
+) -> OrchestratorSession:
     """Build a minimally-wired voice session for direct method testing."""
     config = OrchestratorConfig(
         project_dir=str(tmp_path),
@@ -43,9 +46,8 @@ def _make_session(tmp_path: Path) -> OrchestratorSession:
     # Wire a writer pointed at a temp JSONL so process_voice_event has
     # something to append to.  We don't call session.start() because that
     # would spin up the provider and agent.
-    from orchestrator.persistence import HistoryWriter
     session._jsonl_path = tmp_path / "session.jsonl"
-    session._writer = HistoryWriter(session._jsonl_path)
+    session._writer = writer_cls(session._jsonl_path)
     # Stand in for the voice provider so process_voice_event's voice gate
     # passes.  None of the methods on it are called for the events we
     # exercise.
@@ -60,24 +62,24 @@ def _read_jsonl(path: Path) -> list[dict]:
 
 
 @pytest.mark.asyncio
-async def test_is_injecting_default_false(tmp_path):
+async def test_is_injecting_default_false(tmp_path, write_through_history):
     """A fresh session is not injecting."""
-    session = _make_session(tmp_path)
+    session = _make_session(tmp_path, write_through_history)
     assert session.is_injecting is False
 
 
 @pytest.mark.asyncio
-async def test_extend_injection_window_marks_active(tmp_path):
+async def test_extend_injection_window_marks_active(tmp_path, write_through_history):
     """extend_injection_window flips the flag immediately."""
-    session = _make_session(tmp_path)
+    session = _make_session(tmp_path, write_through_history)
     session.extend_injection_window(5.0)
     assert session.is_injecting is True
 
 
 @pytest.mark.asyncio
-async def test_window_expires_and_clears_flag(tmp_path):
+async def test_window_expires_and_clears_flag(tmp_path, write_through_history):
     """When the deadline passes the watchdog clears the flag."""
-    session = _make_session(tmp_path)
+    session = _make_session(tmp_path, write_through_history)
     session.extend_injection_window(0.15)  # 150ms
     assert session.is_injecting is True
     # Wait past the deadline + watchdog scheduling slack.
@@ -86,9 +88,9 @@ async def test_window_expires_and_clears_flag(tmp_path):
 
 
 @pytest.mark.asyncio
-async def test_window_extension_pushes_deadline_out(tmp_path):
+async def test_window_extension_pushes_deadline_out(tmp_path, write_through_history):
     """Re-extending while active keeps the window open instead of closing."""
-    session = _make_session(tmp_path)
+    session = _make_session(tmp_path, write_through_history)
     session.extend_injection_window(0.15)
     # Just before expiry, push it out further.
     await asyncio.sleep(0.10)
@@ -103,9 +105,9 @@ async def test_window_extension_pushes_deadline_out(tmp_path):
 
 
 @pytest.mark.asyncio
-async def test_phantom_transcription_is_dropped_while_injecting(tmp_path):
+async def test_phantom_transcription_is_dropped_while_injecting(tmp_path, write_through_history):
     """While injecting, transcription.completed events do NOT hit JSONL."""
-    session = _make_session(tmp_path)
+    session = _make_session(tmp_path, write_through_history)
     session.extend_injection_window(2.0)
 
     await session.process_voice_event(
@@ -123,9 +125,11 @@ async def test_phantom_transcription_is_dropped_while_injecting(tmp_path):
 
 
 @pytest.mark.asyncio
-async def test_phantom_speech_started_is_not_persisted_while_injecting(tmp_path):
+async def test_phantom_speech_started_is_not_persisted_while_injecting(
+    tmp_path, write_through_history
+):
     """While injecting, speech_started must NOT write voice_interrupted."""
-    session = _make_session(tmp_path)
+    session = _make_session(tmp_path, write_through_history)
     session.extend_injection_window(2.0)
 
     await session.process_voice_event(
@@ -140,9 +144,9 @@ async def test_phantom_speech_started_is_not_persisted_while_injecting(tmp_path)
 
 
 @pytest.mark.asyncio
-async def test_real_transcription_is_persisted_when_not_injecting(tmp_path):
+async def test_real_transcription_is_persisted_when_not_injecting(tmp_path, write_through_history):
     """Sanity: outside the window, normal user transcripts still land in JSONL."""
-    session = _make_session(tmp_path)
+    session = _make_session(tmp_path, write_through_history)
     assert session.is_injecting is False
 
     await session.process_voice_event(
@@ -161,9 +165,9 @@ async def test_real_transcription_is_persisted_when_not_injecting(tmp_path):
 
 
 @pytest.mark.asyncio
-async def test_real_speech_started_persisted_when_not_injecting(tmp_path):
+async def test_real_speech_started_persisted_when_not_injecting(tmp_path, write_through_history):
     """Sanity: outside the window, speech_started writes voice_interrupted."""
-    session = _make_session(tmp_path)
+    session = _make_session(tmp_path, write_through_history)
     assert session.is_injecting is False
 
     await session.process_voice_event(
@@ -177,13 +181,15 @@ async def test_real_speech_started_persisted_when_not_injecting(tmp_path):
 
 
 @pytest.mark.asyncio
-async def test_send_voice_audio_in_skips_recorder_during_injection(tmp_path):
+async def test_send_voice_audio_in_skips_recorder_during_injection(
+    tmp_path, write_through_history
+):
     """While injecting, send_voice_audio_in must not feed the recorder.
 
     Otherwise the replayed bytes get re-recorded into the live session's
     audio.pcm, polluting it with material that is already saved elsewhere.
     """
-    session = _make_session(tmp_path)
+    session = _make_session(tmp_path, write_through_history)
     fake_relay = MagicMock()
     fake_relay.send_audio = AsyncMock()
     session._voice_relay = fake_relay
@@ -219,9 +225,11 @@ async def test_qwen_provider_exposes_vad_toggle_helpers():
 
 
 @pytest.mark.asyncio
-async def test_send_voice_audio_in_uses_recorder_outside_injection(tmp_path):
+async def test_send_voice_audio_in_uses_recorder_outside_injection(
+    tmp_path, write_through_history
+):
     """Sanity: the recorder still receives mic audio when not injecting."""
-    session = _make_session(tmp_path)
+    session = _make_session(tmp_path, write_through_history)
     fake_relay = MagicMock()
     fake_relay.send_audio = AsyncMock()
     session._voice_relay = fake_relay
@@ -143,3 +143,69 @@ def test_multiple_calls_do_not_collide():
     assert bag.pop_name("a") == "tool_a"
     # popping "a" leaves "b" untouched
     assert bag.peek_name("b") == "tool_b"
+
+
+# ---------- parse_call_args -------------------------------------------------
+
+
+def test_parse_call_args_shares_decode_with_second_consumer():
+    bag = _Bag()
+    first = bag.parse_call_args("a", '{"x": 1}')
+    assert first == {"x": 1}
+    # The second consumer of the same done event gets the same dict.
+    assert bag.parse_call_args("a", '{"x": 1}') is first
+    # ... and the stash is gone afterwards.
+    assert bag.parse_call_args("a", '{"x": 1}') is not first
+
+
+def test_parse_call_args_reparses_when_args_differ():
+    bag = _Bag()
+    bag.parse_call_args("a", '{"x": 1}')
+    assert bag.parse_call_args("a", '{"x": 2}') == {"x": 2}
+
+
+def test_parse_call_args_malformed_is_empty_dict():
+    bag = _Bag()
+    assert bag.parse_call_args("a", '{"x": ') == {}
+
+
+def test_streamed_args_join_on_read():
+    bag = _Bag()
+    bag.register_call("a", "tool_a")
+    for chunk in ('{"q', '": "a', 'bc"}'):
+        bag.accumulate_args("a", chunk)
+    assert bag.peek_args("a") == '{"q": "abc"}'
+    assert bag.peek_args("a") == '{"q": "abc"}'
+    assert bag.pop_args("a") == '{"q": "abc"}'
+    assert bag.peek_args("a") == ""
+
+
+# ---------- resolve_done_call -----------------------------------------------
+
+
+def test_resolve_done_call_prefers_streamed_args_and_shares_decode():
+    bag = _Bag()
+    bag.register_call("a", "tool_a")
+    bag.accumulate_args("a", '{"q": "streamed"}')
+    done = {"type": "response.function_call_arguments.done", "call_id": "a", "arguments": ""}
+
+    first = bag.resolve_done_call(done)
+    second = bag.resolve_done_call(done)
+    assert first.tool_name == "tool_a"
+    assert first.tool_input == {"q": "streamed"}
+    assert second.tool_input is first.tool_input
+
+
+def test_resolve_done_call_unknown_call_is_none():
+    bag = _Bag()
+    assert bag.resolve_done_call({"call_id": "x"}) is None
+
+
+def test_tracked_calls_are_bounded():
+    bag = _Bag()
+    bag.MAX_TRACKED_CALLS = 3
+    for i in range(5):
+        bag.register_call(f"c{i}", "tool")
+        bag.accumulate_args(f"c{i}", "{}")
+    assert bag.peek_name("c0") == "" and bag.peek_args("c1") == ""
+    assert [bag.peek_name(f"c{i}") for i in (2, 3, 4)] == ["tool"] * 3
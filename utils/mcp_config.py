@@ -19,6 +19,11 @@ see the same list.
 Public API:
     - :func:`load_available_mcps` — full ``name → config`` mapping
     - :func:`get_mcp_configs` — subset for a requested list of names
+    - :func:`config_stamp` — cheap fingerprint of the files behind the above
+
+:func:`load_available_mcps` memoizes the merged mapping on
+:func:`config_stamp`, so repeat calls cost two ``stat`` calls until either
+file (or the project directory) changes.
 """
 
 from __future__ import annotations
@@ -37,6 +42,9 @@ logger = logging.getLogger(__name__)
 _CLAUDE_JSON = ".claude.json"
 _PROJECT_MCP_JSON = ".mcp.json"
 
+# (config_stamp(), merged mapping) from the last load_available_mcps().
+_available_cache: tuple[tuple[Any, ...], dict[str, dict[str, Any]]] | None = None
+
 
 def _claude_json_path() -> Path:
     """Resolve ``.claude.json`` honouring ``CLAUDE_CONFIG_DIR``."""
@@ -51,6 +59,29 @@ def _project_mcp_json_path() -> Path:
     return get_project_dir() / _PROJECT_MCP_JSON
 
 
+def _stat_key(path: Path) -> tuple[str, int, int] | tuple[str]:
+    try:
+        st = path.stat()
+    except OSError:
+        return (str(path),)
+    return (str(path), st.st_mtime_ns, st.st_size)
+
+
+def config_stamp() -> tuple[Any, ...]:
+    """Fingerprint of every input :func:`load_available_mcps` depends on.
+
+    Combines the project directory with ``(path, mtime_ns, size)`` for
+    both config files, so callers can cache anything derived from the MCP
+    list and invalidate it with two ``stat`` calls instead of re-reading
+    and re-parsing the JSON.
+    """
+    return (
+        str(get_project_dir()),
+        _stat_key(_claude_json_path()),
+        _stat_key(_project_mcp_json_path()),
+    )
+
+
 def _read_json(path: Path) -> dict[str, Any]:
     if not path.is_file():
         return {}
@@ -81,7 +112,27 @@ def load_available_mcps() -> dict[str, dict[str, Any]]:
     user opt out of a ``.mcp.json`` entry without deleting it. If both are
     empty the project-scoped entries are all considered enabled (the CLI's
     default).
+
+    Returns a fresh outer dict each call; the per-server config dicts are
+    shared with the cache and must be treated as read-only.
     """
+    return dict(_cached_available_mcps())
+
+
+def _cached_available_mcps() -> dict[str, dict[str, Any]]:
+    """The memoized merged mapping itself — callers must not mutate it."""
+    global _available_cache
+    stamp = config_stamp()
+    cached = _available_cache
+    if cached is not None and cached[0] == stamp:
+        return cached[1]
+    merged = _merge_available_mcps()
+    _available_cache = (stamp, merged)
+    return merged
+
+
+def _merge_available_mcps() -> dict[str, dict[str, Any]]:
+    """Read both config files and merge them (see :func:`load_available_mcps`)."""
     project_block = _project_section(_read_json(_claude_json_path()))
     claude_json_mcps: dict[str, dict[str, Any]] = (
         project_block.get("mcpServers") or {}
@@ -109,11 +160,10 @@ def load_available_mcps() -> dict[str, dict[str, Any]]:
 
 def get_mcp_configs(names: list[str]) -> dict[str, dict[str, Any]]:
     """Return only the requested MCPs, dropping (with a warning) any unknown."""
-    available = load_available_mcps()
-    result: dict[str, dict[str, Any]] = {}
-    for name in names:
-        if name in available:
-            result[name] = available[name]
-        else:
-            logger.warning("MCP server %r not found in config", name)
+    available = _cached_available_mcps()
+    result = {name: available[name] for name in names if name in available}
+    if len(result) < len(names):
+        for name in names:
+            if name not in result:
+                logger.warning("MCP server %r not found in config", name)
     return result